@@ -230,7 +230,6 @@ install_packages() {
 		tesseract-data-eng
 		ttf-jetbrains-mono-nerd
 		grimblast-git
-		python-ijson
 		glace-git
 	)
 
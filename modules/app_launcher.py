@@ -1,21 +1,25 @@
-import operator
-from collections.abc import Iterator
 from enum import Enum
 from typing import Callable
 
-from fabric.utils import DesktopApp, idle_add, remove_handler
+from fabric.utils import DesktopApp
 from fabric.widgets.box import Box
 from fabric.widgets.button import Button
 from fabric.widgets.entry import Entry
 from fabric.widgets.image import Image
 from fabric.widgets.label import Label
-from fabric.widgets.scrolledwindow import ScrolledWindow
 from fabric.widgets.wayland import WaylandWindow as Window
 from gi.repository import Gdk
+from loguru import logger
 
 from shared.buttons import HoverButton
 from shared.tagentry import TagEntry
+from shared.virtual_list import VirtualList
 from utils.app import AppUtils
+from utils.app_search import AppSearchEngine
+from utils.colors import Colors
+from utils.constants import APP_FRECENCY_FILE
+from utils.frecency import FrecencyStore
+from utils.icon_cache import IconCache
 
 
 class LauncherCommandType(Enum):
@@ -44,32 +48,40 @@ class AppLauncher(Window):
             all_visible=False,
             **kwargs,
         )
-        self._arranger_handler: int = 0
-
         self.app_util = AppUtils()
         self._all_apps = self.app_util.all_applications
 
+        self._search = AppSearchEngine(
+            key=lambda app: getattr(app, "path", None) or app.name,
+            fields=lambda app: (app.display_name, app.name, app.generic_name),
+            frecency=FrecencyStore(APP_FRECENCY_FILE),
+        )
+        self._search.set_items(self._all_apps)
+
         self.connect("key-press-event", self._on_key_press)
 
         self._commands = {}
         self._command_handler = None
 
-        self.viewport = Box(spacing=2, orientation="v")
         self.search_entry = Entry(
             name="launcher-prompt",
             placeholder="Search Applications...",
             h_expand=True,
             notify_text=lambda entry, *_: self.arrange_viewport(entry.get_text()),
+            on_activate=lambda *_: self._activate_selection(),
+            on_key_press_event=lambda _, event: self.viewport.handle_key(event.keyval),
         )
 
         self.tag_entry = TagEntry(
             h_expand=True, placeholder="Tags", available_tags=["tag1", "tag2", "tag3"]
         )
 
-        self.scrolled_window = ScrolledWindow(
+        self.viewport = VirtualList(
+            create_cell=self.bake_application_slot,
+            bind_cell=self.bind_application_slot,
+            on_activate=self.launch_application,
             min_content_size=(280, 320),
             max_content_size=(280 * 2, 320),
-            child=self.viewport,
         )
 
         self.add(
@@ -96,11 +108,12 @@ class AppLauncher(Window):
                     ),
                     # self.tag_entry,
                     # the actual slots holder
-                    self.scrolled_window,
+                    self.viewport,
                 ],
             )
         )
 
+        self.arrange_viewport()
         self.search_entry.grab_focus_without_selecting()
         self.hide()
 
@@ -109,14 +122,6 @@ class AppLauncher(Window):
             self.destroy()
 
     def arrange_viewport(self, query: str = ""):
-        # reset everything so we can filter current viewport's slots...
-        # remove the old handler so we can avoid race conditions
-        remove_handler(self._arranger_handler) if self._arranger_handler else None
-
-        # remove all children from the viewport
-        self.viewport.children = []
-
-        # make a new iterator containing the filtered apps
         command = None
         prompt = ""
         try:
@@ -137,73 +142,58 @@ class AppLauncher(Window):
                 else:
                     ...
                 return False
-        filtered_apps_iter = iter(
-            [
-                app
-                for app in self._all_apps
-                if query.casefold()
-                in (
-                    (app.display_name or "")
-                    + (" " + app.name + " ")
-                    + (app.generic_name or "")
-                ).casefold()
-            ]
-        )
-        should_resize = operator.length_hint(filtered_apps_iter) == len(self._all_apps)
-
-        # all aboard...
-        # start the process of adding slots with a lazy executor
-        # using this method makes the process of adding slots way more less
-        # resource expensive without blocking the main thread and resulting in a lock
-        self._arranger_handler = idle_add(
-            lambda *args: self.add_next_application(*args)
-            or (self.resize_viewport() if should_resize else False),
-            filtered_apps_iter,
-            pin=True,
-        )
-
+        # The slots are recycled, only the visible ones get rebound
+        self.viewport.set_items(self._search.search(query), selected=0 if query else -1)
         return False
 
-    def add_next_application(self, apps_iter: Iterator[DesktopApp]):
-        if not (app := next(apps_iter, None)):
-            return False
-
-        self.viewport.add(self.bake_application_slot(app))
-        return True
+    def _activate_selection(self):
+        if self.viewport.selected < 0:
+            self.viewport.select(0)
+        self.viewport.activate()
 
-    def resize_viewport(self):
-        self.scrolled_window.set_min_content_width(
-            self.viewport.get_allocation().width  # type: ignore
-        )
-        return False
-
-    def bake_application_slot(self, app: DesktopApp, **kwargs) -> Button:
-        def on_clicked(*_):
-            app.launch()
-            self.hide()
-            self.search_entry.set_text("")
+    def launch_application(self, app: DesktopApp):
+        app.launch()
+        self._record_launch(app)
+        self.hide()
+        self.search_entry.set_text("")
 
-        return Button(
+    def bake_application_slot(self, **kwargs) -> Button:
+        button = Button(
             style_classes="launcher-button",
             child=Box(
                 orientation="h",
                 spacing=12,
                 children=[
-                    Image(
-                        pixbuf=app.get_icon_pixbuf(self.config.get("icon_size", 16)),
-                        h_align="start",
-                    ),
+                    Image(h_align="start"),
                     Label(
-                        label=app.display_name or "Unknown",
+                        label="Unknown",
                         v_align="center",
                         h_align="center",
                     ),
                 ],
             ),
-            tooltip_text=app.description if self.config.get("tooltip", False) else None,
-            on_clicked=on_clicked,
             **kwargs,
         )
+        button.icon, button.label = button.get_child().get_children()
+        return button
+
+    def bind_application_slot(self, button: Button, app: DesktopApp, _index: int):
+        button.icon.set_from_pixbuf(
+            IconCache().load_app_icon(app, self.config.get("icon_size", 16))
+        )
+        button.label.set_label(app.display_name or "Unknown")
+        button.set_tooltip_text(
+            app.description if self.config.get("tooltip", False) else None
+        )
+
+    def _record_launch(self, app):
+        self._search.record_use(app)
+        try:
+            self._search.frecency.save()
+        except OSError as e:
+            logger.warning(
+                f"{Colors.WARNING}[AppLauncher] Failed to save launch history: {e}"
+            )
 
     def set_commands(self, commands: dict):
         self._commands = commands
@@ -214,7 +204,10 @@ class AppLauncher(Window):
     def toggle(self):
         if self.is_visible():
             return self.set_visible(False)
-        self._all_apps = self.app_util.all_applications
+        apps = self.app_util.all_applications
+        if apps is not self._all_apps:
+            self._all_apps = apps
+            self._search.set_items(apps)
         (self.search_entry.set_text(""),)
         self.search_entry.grab_focus_without_selecting()
         return self.set_visible(True)
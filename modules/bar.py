@@ -6,6 +6,8 @@ from fabric.widgets.box import Box
 from fabric.widgets.centerbox import CenterBox
 from fabric.widgets.wayland import WaylandWindow as Window
 
+from services.occlusion import OcclusionWatcher
+from services.polling import PollingPolicyService
 from shared.collapsible_group import CollapsibleGroupWidget
 from widgets.battery import BatteryWidget
 from widgets.bluetooth import BlueToothWidget
@@ -126,7 +128,8 @@ class StatusBar(Window):
             ),
         )
 
-        anchor = f"left {bar_config.get('location', 'top')} right"
+        location = bar_config.get("location", "top")
+        anchor = f"left {location} right"
 
         super().__init__(
             name="panel",
@@ -140,6 +143,16 @@ class StatusBar(Window):
             **kwargs,
         )
 
+        # Pollers pause while the bar is hidden
+        PollingPolicyService().watch_window(self)
+
+        # or while a fullscreen window is drawn over it, which the overlay
+        # layer is immune to
+        if bar_config.get("layer", "overlay") != "overlay":
+            self._occlusion = OcclusionWatcher((location, 1), full=True)
+            self._occlusion.follow_window(self)
+            PollingPolicyService().watch_occlusion(self._occlusion)
+
         if options["check_updates"]:
             exec_shell_command_async(
                 get_relative_path("../assets/scripts/barupdate.sh"),
@@ -1,7 +1,4 @@
-import json
-
 import gi
-from fabric.hyprland.widgets import get_hyprland_connection
 from fabric.utils import bulk_connect, exec_shell_command
 from fabric.widgets.box import Box
 from fabric.widgets.button import Button
@@ -13,10 +10,13 @@ from fabric.widgets.wayland import WaylandWindow as Window
 from gi.repository import Glace, GLib, Gtk
 from loguru import logger
 
+from services.hyprland_state import HyprlandStateService
+from services.occlusion import OcclusionWatcher
 from shared.popoverv1 import PopOverWindow
 from utils.app import AppUtils
 from utils.constants import PINNED_APPS_FILE
 from utils.functions import read_json_file, write_json_file
+from utils.icon_cache import IconCache
 from utils.icon_resolver import IconResolver
 
 gi.require_versions({"Glace": "0.1", "Gtk": "3.0"})
@@ -59,7 +59,7 @@ class AppBar(Box):
         self._manager = Glace.Manager()
         self._manager.connect("client-added", self._on_client_added)
         self._preview_image = Image()
-        self._hyprland_connection = get_hyprland_connection()
+        self._hyprland_state = HyprlandStateService()
 
         self.pinned_apps_container = Box(spacing=7)
         self.add(self.pinned_apps_container)
@@ -94,16 +94,8 @@ class AppBar(Box):
             )
 
     def get_client_data(self, class_name):
-        try:
-            clients = json.loads(
-                self._hyprland_connection.send_command("j/clients").reply.decode()
-            )
-
-            matches = list(filter(lambda app: app.get("class") == class_name, clients))
-            return matches[0] if matches else clients
-        except Exception as e:
-            logger.error(f"[Dock] Failed to get active workspace: {e}")
-            return None
+        client = self._hyprland_state.find_client(**{"class": class_name})
+        return client if client else self._hyprland_state.clients()
 
     def _close_popup(self, *_):
         self.popup_revealer.unreveal()
@@ -138,7 +130,9 @@ class AppBar(Box):
                 self.pinned_apps_container.add(
                     Button(
                         style_classes=["buttons-basic"],
-                        image=Image(pixbuf=app.get_icon_pixbuf(self.icon_size)),
+                        image=Image(
+                            pixbuf=IconCache().load_app_icon(app, self.icon_size)
+                        ),
                         tooltip_text=app.display_name
                         if self.config.get("tooltip", True)
                         else None,
@@ -275,8 +269,11 @@ class Dock(Window):
     def __init__(self, config):
         self.config = config["modules"]["dock"]
         super().__init__(layer=self.config.get("layer", "top"), anchor="bottom-center")
+        self.content = Box(
+            children=[AppBar(self)], style="padding: 20px 50px 5px 50px;"
+        )
         self.revealer = Revealer(
-            child=Box(children=[AppBar(self)], style="padding: 20px 50px 5px 50px;"),
+            child=self.content,
             transition_duration=500,
             transition_type="slide-up",
         )
@@ -284,35 +281,54 @@ class Dock(Window):
             events=["enter-notify", "leave-notify"],
             child=Box(style="min-height: 1px", children=self.revealer),
             on_enter_notify_event=lambda *_: self.revealer.set_reveal_child(True),
-            on_leave_notify_event=lambda *_: self.revealer.set_reveal_child(False),
+            on_leave_notify_event=self._on_leave,
         )
 
-        if self.config.get("show_when_no_windows", False):
-            self._hyprland_connection = get_hyprland_connection()
+        self._occlusion = None
+
+        if self.config.get("intellihide", False):
+            # Stay out of the way only while a window actually sits under the dock
+            self._occlusion = OcclusionWatcher(self._dock_region())
+            self._occlusion.follow_window(self)
+            self._occlusion.connect(
+                "changed",
+                lambda _, occluded: self.revealer.set_reveal_child(not occluded),
+            )
+            self.content.connect("size-allocate", self._on_content_allocated)
+            self.revealer.set_reveal_child(not self._occlusion.occluded)
+
+        elif self.config.get("show_when_no_windows", False):
+            self._hyprland_state = HyprlandStateService()
 
             bulk_connect(
-                self._hyprland_connection,
+                self._hyprland_state,
                 {
-                    "event::workspace": self.check_for_windows,
-                    "event::closewindow": self.check_for_windows,
-                    "event::openwindow": self.check_for_windows,
-                    "event::movewindow": self.check_for_windows,
+                    "workspaces-changed": self.check_for_windows,
+                    "active-changed": self.check_for_windows,
                 },
             )
 
             self.check_for_windows()
 
+    def _dock_region(self) -> tuple:
+        size = self.content.get_preferred_size()[1]
+        return ("bottom", size.height, size.width)
+
+    def _on_content_allocated(self, *_):
+        region = self._dock_region()
+        if region != self._occlusion.region:
+            self._occlusion.set_region(region)
+
+    def _on_leave(self, *_):
+        self.revealer.set_reveal_child(
+            self._occlusion is not None and not self._occlusion.occluded
+        )
+
     def check_for_windows(self, *_):
-        try:
-            response = self._hyprland_connection.send_command(
-                "j/activeworkspace"
-            ).reply.decode()
-            data = json.loads(response)
-        except Exception as e:
-            logger.error(f"[Dock] Failed to get active workspace: {e}")
+        workspace = self._hyprland_state.active_workspace
+        if workspace is None:
             return
 
-        if data.get("windows", 0) == 0:
-            self.revealer.set_reveal_child(True)
-        else:
-            self.revealer.set_reveal_child(False)
+        self.revealer.set_reveal_child(
+            self._hyprland_state.window_count(workspace["id"]) == 0
+        )
@@ -1,8 +1,4 @@
-import json
-
 import gi
-from fabric.hyprland.widgets import get_hyprland_connection
-from fabric.utils.helpers import bulk_connect
 from fabric.widgets.box import Box
 from fabric.widgets.button import Button
 from fabric.widgets.eventbox import EventBox
@@ -13,8 +9,11 @@ from fabric.widgets.overlay import Overlay
 from gi.repository import Gdk, GdkPixbuf, Gtk
 from loguru import logger
 
+from services.hyprland_ipc import HyprlandCommandService
+from services.hyprland_state import HyprlandStateService
 from shared.popup import PopupWindow
 from utils.app import AppUtils
+from utils.icon_cache import IconCache
 from utils.icon_resolver import IconResolver
 from utils.widget_utils import create_surface_from_widget
 
@@ -44,54 +43,20 @@ class HyprlandWindowButton(Button):
         self.title = title
         self.window: Box = window
         self.icon_resolver = IconResolver()
-        self._hyprland_connection = get_hyprland_connection()
-
-        # Compute dynamic icon sizes based on the button size.
-        # Using the minimum dimension of the button for scaling.
-        icon_size_main = int(min(self.size) * 0.5)  # adjust factor as needed
+        self._hyprland_commands = HyprlandCommandService()
 
         # Enhanced icon resolution using desktop apps
-        desktop_app = AppUtils().find_app(app_id)
-
-        # Get icon using improved method with fallbacks
-        icon_pixbuf = None
-        if desktop_app:
-            icon_pixbuf = desktop_app.get_icon_pixbuf(size=icon_size_main)
-
-        if not icon_pixbuf:
-            # Fallback to IconResolver
-            icon_pixbuf = self.icon_resolver.get_icon_pixbuf(app_id, icon_size_main)
-
-        if not icon_pixbuf:
-            # Additional fallbacks for common apps
-            icon_pixbuf = self.icon_resolver.get_icon_pixbuf(
-                "application-x-executable-symbolic", icon_size_main
-            )
-            if not icon_pixbuf:
-                icon_pixbuf = self.icon_resolver.get_icon_pixbuf(
-                    "image-missing", icon_size_main
-                )
-
-        # Ensure icon is scaled to the correct size
-        if icon_pixbuf and (
-            icon_pixbuf.get_width() != icon_size_main
-            or icon_pixbuf.get_height() != icon_size_main
-        ):
-            icon_pixbuf = icon_pixbuf.scale_simple(
-                icon_size_main,
-                icon_size_main,
-                GdkPixbuf.InterpType.BILINEAR,
-            )
+        self.desktop_app = AppUtils().find_app(app_id)
 
         super().__init__(
             name="overview-client-box",
-            image=Image(pixbuf=icon_pixbuf),
+            image=Image(pixbuf=self._load_icon()),
             tooltip_text=title,
             size=size,
             on_clicked=self._on_click,
             on_button_press_event=lambda _,
-            event: self._hyprland_connection.send_command(
-                f"/dispatch closewindow address:{address}"
+            event: self._hyprland_commands.dispatch(
+                f"closewindow address:{address}"
             )
             if event.button == 3
             else None,
@@ -103,9 +68,6 @@ class HyprlandWindowButton(Button):
             ),
         )
 
-        # Store the desktop_app for later use
-        self.desktop_app = desktop_app
-
         self.drag_source_set(
             start_button_mask=Gdk.ModifierType.BUTTON1_MASK,
             targets=TARGET,
@@ -114,58 +76,76 @@ class HyprlandWindowButton(Button):
 
         self.connect("key_press_event", self.on_key_press_event)
 
-    def on_key_press_event(self, widget, event):
-        if (event.get_state() & Gdk.ModifierType.SHIFT_MASK) and event.keyval in (
-            Gdk.KEY_Return,
-            Gdk.KEY_KP_Enter,
-            Gdk.KEY_space,
-        ):
-            self._hyprland_connection.send_command(
-                f"/dispatch closewindow address:{self.address}"
-            )
-            return True
-        return False
-
-    def update_image(self, image):
-        # Compute overlay icon size dynamically.
-        icon_size_overlay = int(min(self.size) * 0.5)  # adjust factor as needed
+    def _load_icon(self) -> GdkPixbuf.Pixbuf | None:
+        # Compute dynamic icon sizes based on the button size.
+        # Using the minimum dimension of the button for scaling.
+        icon_size = max(int(min(self.size) * 0.5), 1)  # adjust factor as needed
 
-        # Enhanced icon resolution for overlay
+        # Get icon using improved method with fallbacks
         icon_pixbuf = None
-        if hasattr(self, "desktop_app") and self.desktop_app:
-            icon_pixbuf = self.desktop_app.get_icon_pixbuf(size=icon_size_overlay)
+        if self.desktop_app:
+            icon_pixbuf = IconCache().load_app_icon(self.desktop_app, icon_size)
 
         if not icon_pixbuf:
-            icon_pixbuf = self.icon_resolver.get_icon_pixbuf(
-                self.app_id, icon_size_overlay
-            )
+            # Fallback to IconResolver
+            icon_pixbuf = self.icon_resolver.get_icon_pixbuf(self.app_id, icon_size)
 
         if not icon_pixbuf:
+            # Additional fallbacks for common apps
             icon_pixbuf = self.icon_resolver.get_icon_pixbuf(
-                "application-x-executable-symbolic", icon_size_overlay
+                "application-x-executable-symbolic", icon_size
             )
             if not icon_pixbuf:
                 icon_pixbuf = self.icon_resolver.get_icon_pixbuf(
-                    "image-missing", icon_size_overlay
+                    "image-missing", icon_size
                 )
 
         # Ensure icon is scaled to the correct size
         if icon_pixbuf and (
-            icon_pixbuf.get_width() != icon_size_overlay
-            or icon_pixbuf.get_height() != icon_size_overlay
+            icon_pixbuf.get_width() != icon_size
+            or icon_pixbuf.get_height() != icon_size
         ):
             icon_pixbuf = icon_pixbuf.scale_simple(
-                icon_size_overlay,
-                icon_size_overlay,
+                icon_size,
+                icon_size,
                 GdkPixbuf.InterpType.BILINEAR,
             )
+        return icon_pixbuf
+
+    def set_geometry(self, size, transform: int = 0):
+        """Resize the button, reloading the icon only if its size changes."""
+        transform %= 4
+        new_size = size if transform in [0, 2] else (size[1], size[0])
+        old_icon_size = int(min(self.size) * 0.5)
+
+        self.transform = transform
+        self.size = new_size
+        self.set_size_request(int(size[0]), int(size[1]))
+
+        if int(min(new_size) * 0.5) != old_icon_size:
+            self.set_image(Image(pixbuf=self._load_icon()))
+
+    def set_title(self, title: str):
+        self.title = title
+        self.set_tooltip_text(title)
 
+    def on_key_press_event(self, widget, event):
+        if (event.get_state() & Gdk.ModifierType.SHIFT_MASK) and event.keyval in (
+            Gdk.KEY_Return,
+            Gdk.KEY_KP_Enter,
+            Gdk.KEY_space,
+        ):
+            self._hyprland_commands.dispatch(f"closewindow address:{self.address}")
+            return True
+        return False
+
+    def update_image(self, image):
         self.set_image(
             Overlay(
                 child=image,
                 overlays=Image(
                     name="overview-icon",
-                    pixbuf=icon_pixbuf,
+                    pixbuf=self._load_icon(),
                     h_align="center",
                     v_align="end",
                     tooltip_text=self.title,
@@ -174,44 +154,41 @@ class HyprlandWindowButton(Button):
         )
 
     def _on_click(self, *_):
-        self._hyprland_connection.send_command(
-            f"/dispatch focuswindow address:{self.address}"
-        )
+        self._hyprland_commands.dispatch(f"focuswindow address:{self.address}")
 
 
 class WorkspaceEventBox(EventBox):
     """A widget to show a workspace in the overview."""
 
-    def __init__(self, workspace_id: int, fixed: Gtk.Fixed | None = None):
-        self.fixed = fixed
+    def __init__(self, workspace_id: int):
+        self.fixed = Gtk.Fixed.new()
+        self.add_label = Label(
+            name="overview-add-label",
+            style_classes=["panel-text"],
+            h_expand=True,
+            v_expand=True,
+            markup="+",
+        )
 
         screen = Gdk.Screen.get_default()
         current_width = screen.get_width()
         current_height = screen.get_height()
 
-        self._hyprland_connection = get_hyprland_connection()
+        self._hyprland_commands = HyprlandCommandService()
 
         super().__init__(
             name="overview-workspace-bg",
             h_expand=True,
             v_expand=True,
             size=(int(current_width * SCALE), int(current_height * SCALE)),
-            child=fixed
-            if fixed
-            else Label(
-                name="overview-add-label",
-                style_classes=["panel-text"],
-                h_expand=True,
-                v_expand=True,
-                markup="+",
-            ),
+            child=self.add_label,
             on_drag_data_received=lambda _w,
             _c,
             _x,
             _y,
             data,
-            *_: self._hyprland_connection.send_command(
-                f"/dispatch movetoworkspacesilent {workspace_id},address:{data.get_data().decode()}"  # noqa: E501
+            *_: self._hyprland_commands.dispatch(
+                f"movetoworkspacesilent {workspace_id},address:{data.get_data().decode()}"  # noqa: E501
             ),
         )
         self.drag_dest_set(
@@ -219,53 +196,46 @@ class WorkspaceEventBox(EventBox):
             TARGET,
             Gdk.DragAction.COPY,
         )
-        if fixed:
-            fixed.show_all()
 
+    def put(self, button: HyprlandWindowButton, x: float, y: float):
+        self.fixed.put(button, x, y)
+        button.show_all()
+        self._update_child()
 
-class OverviewMenu(Box):
-    """A widget to show the overview of all workspaces and windows."""
+    def move(self, button: HyprlandWindowButton, x: float, y: float):
+        self.fixed.move(button, x, y)
 
-    def __init__(self, **kwargs):
-        # Initialize as a Box instead of a PopupWindow.
-        super().__init__(name="overview-menu", orientation="v", spacing=8, **kwargs)
-        self.workspace_boxes: dict[int, Box] = {}
-        self.clients: dict[str, HyprlandWindowButton] = {}
+    def remove_button(self, button: HyprlandWindowButton):
+        self.fixed.remove(button)
+        self._update_child()
 
-        self._hyprland_connection = get_hyprland_connection()
+    def _update_child(self):
+        # Empty workspaces show a "+" to drop windows on
+        child = self.fixed if self.fixed.get_children() else self.add_label
+        if self.get_child() is not child:
+            self.children = child
+            child.show_all()
 
-        # Initialize app registry for better icon resolution
-        self.app_util = AppUtils()
-        self._all_apps = self.app_util.all_applications
-        self.app_identifiers = self.app_util.app_identifiers
 
-        # Remove the window_class_aliases dictionary completely
-
-        bulk_connect(
-            self._hyprland_connection,
-            {
-                "event::openwindow": self._update,
-                "event::closewindow": self._update,
-                "event::movewindow": self._update,
-            },
-        )
-
-        self.update()
+class OverviewMenu(Box):
+    """A widget to show the overview of all workspaces and windows.
 
-    def update(self, signal_update=False):
-        # Refresh app registry when updating to ensure latest data
-        self.app_util.refresh()
-        self._all_apps = self.app_util.all_applications
-        self.app_identifiers = self.app_util.app_identifiers
+    Buttons are kept per window address and only the windows that changed
+    are touched on each update: moved, resized, retitled, added or removed.
+    Updates that arrive while the overview is not shown are applied the
+    next time it is.
+    """
 
-        # Remove old clients and workspaces.
-        for client in self.clients.values():
-            client.destroy()
-        self.clients.clear()
+    def __init__(self, **kwargs):
+        # Initialize as a Box instead of a PopupWindow.
+        super().__init__(name="overview-menu", orientation="v", spacing=8, **kwargs)
+        self.workspace_boxes: dict[int, WorkspaceEventBox] = {}
+        self.clients: dict[str, HyprlandWindowButton] = {}
+        # address -> (workspace, x, y, width, height, transform, title)
+        self._placements: dict[str, tuple] = {}
+        self._dirty = False
 
-        for workspace in self.workspace_boxes.values():
-            workspace.destroy()
-        self.workspace_boxes.clear()
+        self._hyprland_state = HyprlandStateService()
 
         # Create a new Box to hold the overview.
         self.grid = Grid(
@@ -274,46 +244,13 @@ class OverviewMenu(Box):
             column_homogeneous=True,
             row_homogeneous=True,
         )
-
-        # Create two rows in this Box.
         self.children = self.grid
 
-        monitors = {
-            monitor["id"]: (monitor["x"], monitor["y"], monitor["transform"])
-            for monitor in json.loads(
-                self._hyprland_connection.send_command("j/monitors").reply.decode()
-            )
-        }
-
-        for client in json.loads(
-            str(self._hyprland_connection.send_command("j/clients").reply.decode())
-        ):
-            # Exclude special workspaces.
-            if client["workspace"]["id"] > 0:
-                self.clients[client["address"]] = HyprlandWindowButton(
-                    window=self,
-                    title=client["title"],
-                    address=client["address"],
-                    app_id=client["initialClass"],
-                    size=(client["size"][0] * SCALE, client["size"][1] * SCALE),
-                    transform=monitors[client["monitor"]][2],
-                )
-                if client["workspace"]["id"] not in self.workspace_boxes:
-                    self.workspace_boxes[client["workspace"]["id"]] = Gtk.Fixed.new()
-                self.workspace_boxes[client["workspace"]["id"]].put(
-                    self.clients[client["address"]],
-                    abs(client["at"][0] - monitors[client["monitor"]][0]) * SCALE,
-                    abs(client["at"][1] - monitors[client["monitor"]][1]) * SCALE,
-                )
-
         overviews = []
-
         for w_id in range(1, 11):
+            self.workspace_boxes[w_id] = WorkspaceEventBox(w_id)
             overlay = Overlay(
-                child=WorkspaceEventBox(
-                    w_id,
-                    self.workspace_boxes.get(w_id, None),
-                ),
+                child=self.workspace_boxes[w_id],
                 overlays=Label(
                     label=f"{w_id}",
                     style_classes=["panel-text", "ws_id_label"],
@@ -326,8 +263,105 @@ class OverviewMenu(Box):
         # Lay out workspaces into fluid rows.
         self.grid.attach_flow(children=overviews, columns=5)
 
+        self._hyprland_state.connect("clients-changed", self._update)
+        self._hyprland_state.connect("monitors-changed", self._update)
+        self.connect("map", self._on_map)
+
+        self.update()
+
+    def _on_map(self, *_):
+        if self._dirty:
+            self.update()
+
+    def update(self, signal_update=False):
+        # Window positions may need a round trip, draw once they are in
+        self._dirty = False
+        self._hyprland_state.with_geometry(self._render)
+
+    def _placement(self, client: dict, monitors: dict) -> tuple | None:
+        workspace_id = client["workspace"]["id"]
+        # Exclude special workspaces and the ones the grid doesn't show.
+        if workspace_id not in self.workspace_boxes:
+            return None
+
+        monitor_x, monitor_y, transform = monitors.get(client["monitor"], (0, 0, 0))
+        return (
+            workspace_id,
+            abs(client["at"][0] - monitor_x) * SCALE,
+            abs(client["at"][1] - monitor_y) * SCALE,
+            client["size"][0] * SCALE,
+            client["size"][1] * SCALE,
+            transform,
+            client["title"],
+        )
+
+    def _render(self, clients: list[dict]):
+        monitors = {
+            monitor["id"]: (monitor["x"], monitor["y"], monitor["transform"])
+            for monitor in self._hyprland_state.monitors
+        }
+
+        placements, by_address = {}, {}
+        for client in clients:
+            placement = self._placement(client, monitors)
+            if placement is not None:
+                placements[client["address"]] = placement
+                by_address[client["address"]] = client
+
+        for address in self._placements.keys() - placements.keys():
+            self._remove_client(address)
+
+        for address, placement in placements.items():
+            previous = self._placements.get(address)
+            if previous == placement:
+                continue
+            if previous is None:
+                self._add_client(by_address[address], placement)
+            else:
+                self._update_client(address, previous, placement)
+
+        self._placements = placements
+
+    def _add_client(self, client: dict, placement: tuple):
+        workspace_id, x, y, width, height, transform, title = placement
+        address = client["address"]
+        button = HyprlandWindowButton(
+            window=self,
+            title=title,
+            address=address,
+            app_id=client["initialClass"],
+            size=(width, height),
+            transform=transform,
+        )
+        self.clients[address] = button
+        self.workspace_boxes[workspace_id].put(button, x, y)
+
+    def _update_client(self, address: str, previous: tuple, placement: tuple):
+        button = self.clients[address]
+        workspace_id, x, y, width, height, transform, title = placement
+
+        if previous[0] != workspace_id:
+            self.workspace_boxes[previous[0]].remove_button(button)
+            self.workspace_boxes[workspace_id].put(button, x, y)
+        elif previous[1:3] != (x, y):
+            self.workspace_boxes[workspace_id].move(button, x, y)
+
+        if previous[3:6] != (width, height, transform):
+            button.set_geometry((width, height), transform)
+
+        if previous[6] != title:
+            button.set_title(title)
+
+    def _remove_client(self, address: str):
+        button = self.clients.pop(address)
+        self.workspace_boxes[self._placements[address][0]].remove_button(button)
+        button.destroy()
+
     def _update(self, *_):
-        logger.info(f"[Overview] Updating for :{_[1].name}")
+        if not self.get_mapped():
+            self._dirty = True
+            return
+        logger.debug("[Overview] Updating for client changes")
         self.update(signal_update=True)
 
 
@@ -0,0 +1,132 @@
+import subprocess
+
+from fabric.core.service import Service, Signal
+from gi.repository import Gio, GLib
+from loguru import logger
+
+from utils.cliphist import ClipEntry, ClipHistory, db_path, read_entries
+from utils.colors import Colors
+from utils.thread import thread
+
+# Writes to the database come in bursts, a listing follows the last one
+RELOAD_DELAY_MS = 200
+
+
+class ClipboardHistoryService(Service):
+    """Shared model of the cliphist history for every clipboard menu.
+
+    The database file is watched, and after each change `cliphist list` is
+    read in a worker and diffed against the known entries. Only the entries
+    that appeared or disappeared are applied, so opening a menu is a render
+    of `history.entries`. The first listing is applied as it streams in.
+    """
+
+    _instance = None
+
+    @Signal
+    def changed(self, added: object, removed: object) -> None:
+        """Signal emitted with the entries added to and removed from history."""
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self, **kwargs):
+        if getattr(self, "_initialized", False):
+            return
+        super().__init__(**kwargs)
+        self._initialized = True
+
+        self.history = ClipHistory()
+        self.loaded = False
+        # Bumped on every reload, chunks of an older listing are dropped
+        self._generation = 0
+        self._listing: list[ClipEntry] = []
+        self._reload_id = 0
+
+        self.monitor = Gio.File.new_for_path(db_path()).monitor_file(
+            Gio.FileMonitorFlags.NONE, None
+        )
+        self.monitor.connect("changed", self._on_db_changed)
+        self.reload()
+
+    def _on_db_changed(self, *_):
+        if self._reload_id:
+            GLib.source_remove(self._reload_id)
+        self._reload_id = GLib.timeout_add(RELOAD_DELAY_MS, self._delayed_reload)
+
+    def _delayed_reload(self):
+        self._reload_id = 0
+        self.reload()
+        return False
+
+    def reload(self):
+        """List the history again, dropping any listing still in progress"""
+        self._generation += 1
+        self._listing = []
+        thread(self._stream, self._generation)
+
+    def _stream(self, generation):
+        """Worker reading `cliphist list` line by line, handing chunks over"""
+        try:
+            with subprocess.Popen(
+                ["cliphist", "list"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            ) as process:
+                for chunk in read_entries(process.stdout):
+                    if generation != self._generation:
+                        process.kill()
+                        return
+                    GLib.idle_add(self._on_chunk, generation, chunk)
+                if process.wait() != 0:
+                    logger.error(
+                        f"{Colors.ERROR}[Clipboard] cliphist list exited with "
+                        f"{process.returncode}"
+                    )
+                    return
+        except Exception as e:
+            logger.exception(f"{Colors.ERROR}[Clipboard] Error listing history: {e}")
+            return
+        GLib.idle_add(self._on_listed, generation)
+
+    def _on_chunk(self, generation, chunk):
+        if generation != self._generation:
+            return False
+        self._listing.extend(chunk)
+        if not self.loaded:
+            # Nothing to diff against yet, show the first screenful right away
+            self._emit(self.history.add(chunk), [])
+        return False
+
+    def _on_listed(self, generation):
+        if generation != self._generation:
+            return False
+        self.loaded = True
+        added, removed = self.history.apply(self._listing)
+        self._listing = []
+        self._emit(added, removed)
+        return False
+
+    def _emit(self, added, removed):
+        if added or removed:
+            self.emit("changed", added, removed)
+
+    def delete(self, item_id: str):
+        """Delete an entry, dropping it from the model right away"""
+        self._emit([], self.history.remove([item_id]))
+        thread(self._run, ["cliphist", "delete", item_id])
+
+    def wipe(self):
+        """Clear the whole history"""
+        self._emit([], self.history.clear())
+        thread(self._run, ["cliphist", "wipe"])
+
+    def _run(self, command):
+        try:
+            subprocess.run(command, check=True)
+        except (OSError, subprocess.CalledProcessError) as e:
+            logger.exception(f"{Colors.ERROR}[Clipboard] {command[1]} failed: {e}")
+            # The database watch may not fire, list again to undo the change
+            GLib.idle_add(self.reload)
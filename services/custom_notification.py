@@ -1,4 +1,3 @@
-import os
 import threading
 
 from fabric import Signal
@@ -9,7 +8,7 @@ from utils.colors import Colors
 from utils.constants import (
     NOTIFICATION_CACHE_FILE,
 )
-from utils.functions import read_json_file, write_json_file
+from utils.journal import JournalStore
 
 
 class CustomNotifications(Notifications):
@@ -53,21 +52,21 @@ class CustomNotifications(Notifications):
         self._count = 0  # Will be updated to highest ID when loading
         self.deserialized_notifications = []
         self._dont_disturb = False
+        # Every change is appended to a journal, compacted from time to time
+        self._store = JournalStore(NOTIFICATION_CACHE_FILE)
         self._load_notifications()
 
     def _load_notifications(self):
-        """Read and validate notifications from the cache file."""
-        if not os.path.exists(NOTIFICATION_CACHE_FILE):
-            return
-
+        """Replay and validate notifications from the cache file."""
         try:
-            original_data = read_json_file(NOTIFICATION_CACHE_FILE)
+            original_data = self._store.load()
 
-            if original_data is None:
+            if not original_data:
                 logger.info(f"{Colors.INFO}[Notification] Cache file is empty.")
                 return
 
-            original_data.reverse()
+            # Newest first, whichever order the snapshot and journal left them in
+            original_data.sort(key=lambda n: n.get("id", 0), reverse=True)
 
             valid_notifications = []
             highest_id = self._count
@@ -81,12 +80,16 @@ class CustomNotifications(Notifications):
                     msg = f"[Notification] Invalid: {str(e)[:50]}"
                     logger.exception(f"{Colors.INFO}{msg}")
 
-            # Write only if the validated data differs from what was originally loaded
-            if valid_notifications != original_data:
-                write_json_file(valid_notifications, NOTIFICATION_CACHE_FILE)
-                logger.info(
-                    f"{Colors.INFO}[Notification] Notifications written successfully."
-                )
+            # Fold the replayed journal and drop invalid entries in one write
+            if self._store.pending or len(valid_notifications) != len(original_data):
+                try:
+                    self._store.compact(valid_notifications)
+                    logger.info(
+                        f"{Colors.INFO}[Notification] Notifications written "
+                        "successfully."
+                    )
+                except OSError as e:
+                    logger.warning(f"[Notification] Failed to compact the cache: {e}")
 
             self.all_notifications = valid_notifications
             self._count = highest_id
@@ -103,6 +106,7 @@ class CustomNotifications(Notifications):
             item = next((p for p in self.all_notifications if p["id"] == id), None)
             if item:
                 self.all_notifications.remove(item)
+                self._store.remove(id)
                 self._persist_and_emit()
 
                 if len(self.all_notifications) == 0:
@@ -115,6 +119,7 @@ class CustomNotifications(Notifications):
             new_notification = self._create_serialized_notification(data)
             self._enforce_per_app_limit(widget_config, new_notification, max_count)
             self.all_notifications.append(new_notification)
+            self._store.add(new_notification)
             self._enforce_global_limit(max_count)
             self._persist_and_emit()
 
@@ -132,6 +137,7 @@ class CustomNotifications(Notifications):
                 msg = f"[Notification] Removing invalid: {str(e)[:50]}"
                 logger.debug(msg)
                 invalid_id = notification.get("id", 0)
+                self._store.remove(invalid_id)
                 self.emit("notification-closed", invalid_id, "dismissed-by-limit")
                 invalid_count += 1
 
@@ -160,6 +166,7 @@ class CustomNotifications(Notifications):
         """Remove oldest notifications if total count exceeds global limit."""
         while len(self.all_notifications) > max_count:
             oldest = self.all_notifications.pop(0)
+            self._store.remove(oldest["id"])
             self.emit("notification-closed", oldest["id"], "dismissed-by-limit")
 
     def _enforce_per_app_limit(
@@ -179,6 +186,7 @@ class CustomNotifications(Notifications):
             to_remove = len(app_notifications) - app_limit + 1
             for old in app_notifications[:to_remove]:
                 self.all_notifications.remove(old)
+                self._store.remove(old["id"])
                 self.emit("notification-closed", old["id"], "dismissed-by-limit")
 
     def _deserialize_notification(self, notification: NotificationSerializedData):
@@ -186,8 +194,11 @@ class CustomNotifications(Notifications):
         return Notification.deserialize(notification)
 
     def _persist_and_emit(self):
-        """Persist notifications and emit relevant signals."""
-        write_json_file(self.all_notifications, NOTIFICATION_CACHE_FILE)
+        """Compact the journal when due and emit relevant signals."""
+        try:
+            self._store.compact_if_due(self.all_notifications)
+        except OSError as e:
+            logger.warning(f"[Notification] Failed to compact the cache: {e}")
         self.emit("notification_count", len(self.all_notifications))
 
     def clear_all_notifications(self):
@@ -198,6 +209,7 @@ class CustomNotifications(Notifications):
         highest_id = self._count
 
         self.all_notifications = []
+        self._store.clear()
 
         self._persist_and_emit()
 
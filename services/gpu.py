@@ -0,0 +1,138 @@
+import shutil
+import subprocess
+import threading
+
+from fabric.core.service import Service, Signal
+from gi.repository import GLib
+from loguru import logger
+
+from services.polling import PollingPolicyService
+from services.system_stats import history_store
+from utils.colors import Colors
+from utils.config import widget_config
+from utils.gpu import (
+    NvidiaSmiReader,
+    empty_sample,
+    find_sysfs_cards,
+    parse_nvtop_snapshot,
+)
+
+gpu_config = widget_config["widgets"]["gpu"]
+
+
+class GpuStatsService(Service):
+    """Background GPU sampler shared by every gpu widget.
+
+    The backend is picked once on the worker thread: sysfs counters for
+    amdgpu/i915, a single long-lived `nvidia-smi` for the proprietary driver,
+    and `nvtop -s` only as a last resort. Samples are delivered on the main
+    loop through the `changed` signal, so the bar never blocks on a tool.
+    """
+
+    _instance = None
+
+    @Signal
+    def changed(self, value: object) -> None:
+        """Signal emitted with the latest sample of the primary GPU."""
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self, **kwargs):
+        if getattr(self, "_initialized", False):
+            return
+        super().__init__(**kwargs)
+        self._initialized = True
+
+        self.interval = max(gpu_config.get("interval", 1000), 100) / 1000
+        self.sample = empty_sample()
+
+        # Set to interrupt the worker's sleep when the polling policy changes
+        self._wake = threading.Event()
+        self._stopped = False
+        self._policy = PollingPolicyService()
+        self._policy.connect("changed", lambda *_: self._wake.set())
+
+        self._worker = threading.Thread(target=self._run, name="gpu-stats", daemon=True)
+        self._worker.start()
+
+    def _select_backend(self):
+        cards = find_sysfs_cards()
+        # Prefer a card with a busy counter (a discrete amdgpu over an igpu)
+        cards.sort(key=lambda card: not card.has_usage)
+        if cards and cards[0].has_usage:
+            logger.info(f"[GPU] Reading {cards[0].name} from sysfs")
+            for card in cards[1:]:
+                card.close()
+            return cards[0].sample
+
+        if NvidiaSmiReader.available():
+            reader = NvidiaSmiReader(int(self.interval * 1000))
+            reader.start()
+            # nvidia-smi is installed on machines it can't read, e.g. without
+            # the driver loaded, it then exits without printing a sample
+            if reader.wait_ready():
+                for card in cards:
+                    card.close()
+                logger.info("[GPU] Streaming samples from nvidia-smi")
+                return reader.sample
+            reader.close()
+            logger.info("[GPU] nvidia-smi printed no sample, not using it")
+
+        if shutil.which("nvtop"):
+            for card in cards:
+                card.close()
+            logger.info("[GPU] Falling back to nvtop snapshots")
+            return self._nvtop_sample
+
+        if cards:
+            # Frequency and temperature only, e.g. i915 without a busy counter
+            logger.info(f"[GPU] Reading {cards[0].name} from sysfs")
+            return cards[0].sample
+
+        return None
+
+    def _nvtop_sample(self) -> dict:
+        output = subprocess.run(
+            ["nvtop", "-s"],
+            capture_output=True,
+            text=True,
+            timeout=max(self.interval * 5, 5),
+        ).stdout
+        return parse_nvtop_snapshot(output)
+
+    def _run(self):
+        read_sample = self._select_backend()
+        if read_sample is None:
+            logger.warning(f"{Colors.WARNING}[GPU] No supported GPU statistics found")
+            return
+
+        while not self._stopped:
+            if self._policy.suspended:
+                self._wake.wait()
+                self._wake.clear()
+                continue
+
+            try:
+                sample = read_sample()
+            except Exception as e:
+                logger.warning(f"{Colors.WARNING}[GPU] Failed to read sample: {e}")
+            else:
+                GLib.idle_add(self._dispatch, sample)
+
+            self._wake.wait(self.interval * self._policy.scale)
+            self._wake.clear()
+
+    def _dispatch(self, sample: dict):
+        # Record on the main loop, where widgets read the history
+        if (usage := sample.get("usage")) is not None:
+            history_store.push("gpu", usage)
+        self.sample = sample
+        self.changed.emit(sample)
+        return False
+
+    def stop(self):
+        self._stopped = True
+        self._wake.set()
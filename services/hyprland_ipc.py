@@ -0,0 +1,90 @@
+import json
+import threading
+from concurrent.futures import Future
+from typing import Callable
+
+from fabric.core.service import Service
+from gi.repository import GLib
+from loguru import logger
+
+from utils.colors import Colors
+from utils.hyprland_ipc import HyprlandCommandClient
+
+
+class HyprlandCommandService(Service):
+    """Asynchronous access to Hyprland's command socket for the main loop.
+
+    Replies are handed to callbacks on the GTK main loop, so widgets can
+    issue requests without ever waiting on the compositor. Requests sent
+    together travel in a single batch.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self, **kwargs):
+        if getattr(self, "_initialized", False):
+            return
+        super().__init__(**kwargs)
+        self._initialized = True
+
+        self.client = HyprlandCommandClient()
+
+    @staticmethod
+    def _decode(command: str, reply: bytes):
+        text = reply.decode()
+        return json.loads(text) if command.startswith("j/") else text
+
+    def send(
+        self, command: str, callback: Callable[[object], None] | None = None
+    ) -> Future:
+        """Send one request; `callback` gets the reply, parsed for `j/` requests.
+
+        On failure the error is logged and `callback` gets None.
+        """
+        return self.send_many(
+            [command], None if callback is None else lambda r: callback(r[0])
+        )[0]
+
+    def send_many(
+        self,
+        commands: list[str],
+        callback: Callable[[list], None] | None = None,
+    ) -> list[Future]:
+        """Send requests in one batch; `callback` gets all replies in order."""
+        futures = self.client.submit_many(commands)
+        remaining = [len(futures)]
+        lock = threading.Lock()
+
+        def on_done(_):
+            # Batches can be split across workers
+            with lock:
+                remaining[0] -= 1
+                if remaining[0]:
+                    return
+            GLib.idle_add(self._deliver, commands, futures, callback)
+
+        for future in futures:
+            future.add_done_callback(on_done)
+        return futures
+
+    def dispatch(self, arguments: str) -> Future:
+        """Fire and forget a `dispatch` request."""
+        return self.send(f"dispatch {arguments}")
+
+    def _deliver(self, commands, futures, callback):
+        replies = []
+        for command, future in zip(commands, futures):
+            try:
+                replies.append(self._decode(command, future.result()))
+            except Exception as e:
+                logger.error(f"{Colors.ERROR}[HyprlandIPC] '{command}' failed: {e}")
+                replies.append(None)
+
+        if callback is not None:
+            callback(replies)
+        return False
@@ -0,0 +1,208 @@
+from typing import Callable
+
+from fabric.core.service import Service, Signal
+from fabric.hyprland.widgets import get_hyprland_connection
+from gi.repository import GLib
+from loguru import logger
+
+from services.hyprland_ipc import HyprlandCommandService
+from utils.colors import Colors
+from utils.hyprland_state import HyprlandState, StateDomain
+
+SEED_REQUESTS = ("monitors", "workspaces", "clients", "devices", "activewindow")
+# Delay before retrying a failed sync, doubled on every failure in a row
+RETRY_DELAY_MS = 1000
+MAX_RETRY_DELAY_MS = 30000
+
+
+class HyprlandStateService(Service):
+    """Shared, event-sourced view of Hyprland for every widget and module.
+
+    The model is seeded with one round of `j/` requests once the socket is
+    ready and then updated from the event stream, so queries never touch the
+    socket. A full resync only happens when an event does not fit the model.
+    Window geometry is not part of any event and is refetched lazily, once,
+    the next time someone asks for it.
+    """
+
+    _instance = None
+
+    @Signal
+    def monitors_changed(self) -> None:
+        """Signal emitted when monitors are added, removed or reconfigured."""
+
+    @Signal
+    def workspaces_changed(self) -> None:
+        """Signal emitted when workspaces or their window counts change."""
+
+    @Signal
+    def clients_changed(self) -> None:
+        """Signal emitted when windows open, close, move or change."""
+
+    @Signal
+    def active_changed(self) -> None:
+        """Signal emitted when the focused monitor, workspace or window changes."""
+
+    @Signal
+    def keyboard_changed(self) -> None:
+        """Signal emitted when the active keyboard layout changes."""
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self, **kwargs):
+        if getattr(self, "_initialized", False):
+            return
+        super().__init__(**kwargs)
+        self._initialized = True
+
+        self.state = HyprlandState()
+        self.ready = False
+        self._resync_id: int | None = None
+        self._retry_delay = RETRY_DELAY_MS
+        # Events that arrive while a resync is in flight, replayed on top of it
+        self._backlog: list[tuple[str, str]] | None = None
+        self._geometry_callbacks: list[Callable[[list[dict]], None]] | None = None
+
+        self.commands = HyprlandCommandService()
+        self.connection = get_hyprland_connection()
+        self.connection.connect("event", self._on_event)
+
+        if self.connection.ready:
+            self.resync()
+        else:
+            self.connection.connect("event::ready", lambda *_: self.resync())
+
+    def resync(self):
+        """Rebuild the whole model from Hyprland, without waiting for it."""
+        self._resync_id = None
+        if self._backlog is None:
+            self._backlog = []
+            self.commands.send_many(
+                [f"j/{name}" for name in SEED_REQUESTS], self._on_seed_replies
+            )
+        return False
+
+    def _on_seed_replies(self, replies: list):
+        backlog, self._backlog = self._backlog or [], None
+        if any(reply is None for reply in replies):
+            logger.error(
+                f"{Colors.ERROR}[HyprlandState] Failed to sync, "
+                f"retrying in {self._retry_delay} ms"
+            )
+            # Without a model every event is dropped, so keep trying
+            if self._resync_id is None:
+                self._resync_id = GLib.timeout_add(self._retry_delay, self.resync)
+            self._retry_delay = min(self._retry_delay * 2, MAX_RETRY_DELAY_MS)
+            return
+
+        monitors, workspaces, clients, devices, active_window = replies
+        self.state.seed(monitors, workspaces, clients, devices, active_window)
+        # The replies predate these events, and re-applying older ones is
+        # harmless, so a mismatch here is not worth another resync
+        for name, payload in backlog:
+            self.state.apply(name, payload)
+        self.state.needs_resync = False
+
+        self._retry_delay = RETRY_DELAY_MS
+        self.ready = True
+        logger.debug(
+            f"[HyprlandState] Synced {len(self.state.monitors)} monitors, "
+            f"{len(self.state.workspaces)} workspaces, "
+            f"{len(self.state.clients)} clients"
+        )
+        self._emit({"monitors", "workspaces", "clients", "active", "keyboard"})
+
+    def _on_event(self, _, event):
+        if event.name == "ready":
+            return
+
+        payload = ",".join(event.data)
+        if self._backlog is not None:
+            self._backlog.append((event.name, payload))
+            return
+        if not self.ready:
+            return
+
+        changed = self.state.apply(event.name, payload)
+
+        if self.state.needs_resync:
+            # Coalesce a burst of confusing events into a single resync
+            if self._resync_id is None:
+                logger.debug(f"[HyprlandState] Drift on '{event.name}', resyncing")
+                self._resync_id = GLib.idle_add(self.resync)
+            return
+
+        if "keyboard" in changed:
+            # Lock keys are not part of any event, only of the devices reply
+            self.commands.send("j/devices", self._on_devices_reply)
+        self._emit(changed)
+
+    def _on_devices_reply(self, devices: dict | None):
+        if devices is not None:
+            self.state.set_devices(devices)
+            self._emit({"keyboard"})
+
+    def _emit(self, domains: set[StateDomain]):
+        for domain in ("monitors", "workspaces", "clients", "active", "keyboard"):
+            if domain in domains:
+                self.emit(f"{domain}-changed")
+
+    # Queries, all served from memory
+
+    @property
+    def monitors(self) -> list[dict]:
+        return list(self.state.monitors.values())
+
+    @property
+    def workspaces(self) -> list[dict]:
+        return list(self.state.workspaces.values())
+
+    @property
+    def active_workspace(self) -> dict | None:
+        return self.state.active_workspace
+
+    @property
+    def main_keyboard(self) -> dict | None:
+        return self.state.main_keyboard
+
+    def window_count(self, workspace_id: int) -> int:
+        return self.state.window_count(workspace_id)
+
+    def find_client(self, **fields) -> dict | None:
+        return self.state.find_client(**fields)
+
+    def clients(self) -> list[dict]:
+        """Return every client, positions may be stale, see `with_geometry`."""
+        return list(self.state.clients.values())
+
+    def with_geometry(self, callback: Callable[[list[dict]], None]):
+        """Call `callback` with every client once their geometry is current.
+
+        Runs right away when nothing moved since the last refresh, otherwise
+        after a single `j/clients` request shared by every waiting caller.
+        """
+        if not self.state.geometry_stale:
+            callback(self.clients())
+            return
+
+        if self._geometry_callbacks is None:
+            self._geometry_callbacks = []
+            serial = self.state.serial
+            self.commands.send(
+                "j/clients", lambda clients: self._on_clients_reply(clients, serial)
+            )
+        self._geometry_callbacks.append(callback)
+
+    def _on_clients_reply(self, clients: list[dict] | None, serial: int):
+        callbacks, self._geometry_callbacks = self._geometry_callbacks or [], None
+        if clients is not None:
+            if self.state.serial == serial and self._backlog is None:
+                self.state.set_clients(clients)
+            else:
+                # Events raced the reply, keep what they did to the model
+                self.state.update_geometry(clients)
+        for callback in callbacks:
+            callback(self.clients())
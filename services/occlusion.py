@@ -0,0 +1,187 @@
+from fabric.core.service import Service, Signal
+from fabric.utils import bulk_connect
+from gi.repository import GLib
+from loguru import logger
+
+from services.hyprland_state import HyprlandStateService
+from utils.occlusion import OcclusionIndex
+
+
+class OcclusionService(Service):
+    """Answers "is this screen region covered by a window?" from memory.
+
+    Monitor geometry is cached until Hyprland reports a monitor change, and
+    window rectangles are re-indexed per workspace only after the shared
+    state saw windows open, close or move. A burst of events costs at most
+    one asynchronous `j/clients` request, so a query never waits on the
+    compositor and may answer from the previous index meanwhile.
+    """
+
+    _instance = None
+
+    @Signal
+    def changed(self) -> None:
+        """Signal emitted when the index was rebuilt or focus moved."""
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self, **kwargs):
+        if getattr(self, "_initialized", False):
+            return
+        super().__init__(**kwargs)
+        self._initialized = True
+
+        self.index = OcclusionIndex()
+        self.watchers = 0
+
+        self._state = HyprlandStateService()
+        self._monitors_dirty = True
+        self._clients_dirty = True
+        self._refresh_id: int | None = None
+
+        bulk_connect(
+            self._state,
+            {
+                "monitors-changed": lambda *_: self._invalidate(monitors=True),
+                "clients-changed": lambda *_: self._invalidate(clients=True),
+                "workspaces-changed": lambda *_: self._invalidate(clients=True),
+                "active-changed": lambda *_: self._invalidate(),
+            },
+        )
+
+    def _invalidate(self, monitors: bool = False, clients: bool = False):
+        self._monitors_dirty |= monitors
+        self._clients_dirty |= clients
+        if self.watchers:
+            self._schedule_refresh()
+
+    def _schedule_refresh(self):
+        if self._refresh_id is None:
+            self._refresh_id = GLib.idle_add(self._refresh_and_notify)
+
+    def _refresh_monitors(self):
+        if self._monitors_dirty:
+            self.index.set_monitors(self._state.monitors)
+            self._monitors_dirty = False
+
+    def _refresh_and_notify(self):
+        self._refresh_id = None
+        self._refresh_monitors()
+        if not self._clients_dirty:
+            self.emit("changed")
+            return False
+
+        self._clients_dirty = False
+        self._state.with_geometry(self._on_clients)
+        return False
+
+    def _on_clients(self, clients: list[dict]):
+        self.index.set_clients(clients)
+        self.emit("changed")
+
+    def _resolve_monitor(self, monitor: str | None) -> dict | None:
+        return self._state.state.monitors.get(
+            monitor or self._state.state.focused_monitor or ""
+        )
+
+    def occluded(
+        self,
+        region: tuple,
+        monitor: str | None = None,
+        workspace: int | None = None,
+        full: bool = False,
+    ) -> bool:
+        """Whether a window overlaps `region` on the monitor's active workspace.
+
+        `monitor` defaults to the focused one. With `full` the region has to be
+        covered entirely, as by a fullscreen window.
+        """
+        if not self._state.ready:
+            return False
+        self._refresh_monitors()
+        if self._clients_dirty:
+            # Answer from the last index, watchers hear about the refresh
+            self._schedule_refresh()
+
+        monitor_info = self._resolve_monitor(monitor)
+        if monitor_info is None:
+            return False
+
+        rect = self.index.region(region, monitor_info["name"])
+        if rect is None:
+            return False
+
+        if workspace is not None:
+            return self.index.occluded(workspace, rect, full)
+
+        # A shown special workspace sits on top of the regular one
+        workspaces = (
+            monitor_info.get("activeWorkspace", {}).get("id"),
+            monitor_info.get("specialWorkspace", {}).get("id"),
+        )
+        return any(
+            self.index.occluded(workspace_id, rect, full)
+            for workspace_id in workspaces
+            if workspace_id
+        )
+
+
+class OcclusionWatcher(Service):
+    """Tracks one screen region and emits `changed` on every transition."""
+
+    @Signal
+    def changed(self, occluded: bool) -> None:
+        """Signal emitted when the region becomes occluded or unoccluded."""
+
+    def __init__(
+        self,
+        region: tuple,
+        monitor: str | None = None,
+        full: bool = False,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.region = region
+        self.monitor = monitor
+        self.full = full
+        self.occluded = False
+
+        self._service = OcclusionService()
+        self._service.watchers += 1
+        self._handler_id = self._service.connect("changed", self.update)
+        self.update()
+
+    def set_region(self, region: tuple):
+        self.region = region
+        self.update()
+
+    def follow_window(self, window):
+        """Watch the monitor the compositor maps `window` on."""
+        window.connect("map", self._on_window_mapped)
+        if window.get_mapped():
+            self._on_window_mapped(window)
+
+    def _on_window_mapped(self, window):
+        screen = window.get_screen()
+        self.monitor = screen.get_monitor_plug_name(
+            screen.get_monitor_at_window(window.get_window())
+        )
+        self.update()
+
+    def update(self, *_):
+        occluded = self._service.occluded(
+            self.region, monitor=self.monitor, full=self.full
+        )
+        if occluded != self.occluded:
+            self.occluded = occluded
+            logger.debug(f"[Occlusion] {self.region} occluded={occluded}")
+            self.emit("changed", occluded)
+
+    def destroy(self):
+        if self._handler_id is not None:
+            self._service.disconnect(self._handler_id)
+            self._service.watchers -= 1
+            self._handler_id = None
@@ -0,0 +1,240 @@
+import os
+from typing import Callable
+
+from fabric.core.service import Service, Signal
+from gi.repository import Gio, GLib
+from loguru import logger
+
+from services.battery import BatteryService
+from utils.colors import Colors
+from utils.config import widget_config
+from utils.dbus_helper import GioDBusHelper
+from utils.polling import PollingCondition, PollingPolicy
+
+general_config = widget_config["general"]
+
+# UPower states in which the machine drains its battery
+DISCHARGING_STATES = (2, 6)
+
+
+class PollingPolicyService(Service):
+    """Shell-wide polling policy fed by bar visibility, logind and UPower.
+
+    Pollers declare a base interval and ask `interval()` for the one to use
+    right now; `changed` fires whenever that answer may have changed.
+    """
+
+    _instance = None
+
+    @Signal
+    def changed(self) -> None:
+        """Signal emitted when pollers need to reschedule."""
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self, **kwargs):
+        if getattr(self, "_initialized", False):
+            return
+        super().__init__(**kwargs)
+        self._initialized = True
+
+        self.policy = PollingPolicy(
+            enabled=general_config.get("adaptive_polling", True),
+            idle_multiplier=general_config.get("idle_polling_multiplier", 4),
+            battery_multiplier=general_config.get("battery_polling_multiplier", 2),
+        )
+        self._windows = []
+        self._occlusion_watchers = []
+
+        if self.policy.enabled:
+            self._watch_battery()
+            self._watch_session()
+
+    @property
+    def suspended(self) -> bool:
+        return self.policy.suspended
+
+    @property
+    def scale(self) -> float:
+        return self.policy.scale
+
+    def interval(self, base: int) -> int | None:
+        """Return `base` ms scaled by the policy, or None while suspended."""
+        return self.policy.interval(base)
+
+    def set_condition(self, condition: PollingCondition, active: bool):
+        if self.policy.set(condition, active):
+            logger.debug(
+                f"[Polling] {condition}={active}, active conditions: "
+                f"{sorted(self.policy.active) or 'none'}"
+            )
+            self.emit("changed")
+
+    def watch_window(self, window):
+        """Suspend polling while every watched window is hidden."""
+        self._windows.append(window)
+        window.connect("notify::visible", self._on_window_visibility)
+        window.connect("destroy", self._on_window_destroy)
+        self._on_window_visibility()
+
+    def _on_window_destroy(self, window):
+        if window in self._windows:
+            self._windows.remove(window)
+        self._on_window_visibility()
+
+    def _on_window_visibility(self, *_):
+        self.set_condition(
+            "hidden",
+            bool(self._windows)
+            and not any(window.get_visible() for window in self._windows),
+        )
+
+    def watch_occlusion(self, watcher):
+        """Suspend polling while every watched region is covered by windows."""
+        self._occlusion_watchers.append(watcher)
+        watcher.connect("changed", self._on_occlusion_changed)
+        self._on_occlusion_changed()
+
+    def _on_occlusion_changed(self, *_):
+        self.set_condition(
+            "occluded",
+            bool(self._occlusion_watchers)
+            and all(watcher.occluded for watcher in self._occlusion_watchers),
+        )
+
+    def _watch_battery(self):
+        try:
+            self._battery = BatteryService()
+        except Exception as e:
+            logger.warning(f"{Colors.WARNING}[Polling] UPower is unavailable: {e}")
+            return
+        self._battery.connect("changed", self._on_battery_changed)
+        self._on_battery_changed()
+
+    def _on_battery_changed(self, *_):
+        self.set_condition(
+            "battery",
+            bool(self._battery.get_property("IsPresent"))
+            and self._battery.get_property("State") in DISCHARGING_STATES,
+        )
+
+    def _watch_session(self):
+        try:
+            manager = GioDBusHelper(
+                bus_name="org.freedesktop.login1",
+                object_path="/org/freedesktop/login1",
+                interface_name="org.freedesktop.login1.Manager",
+                bus_type=Gio.BusType.SYSTEM,
+            )
+            # Signals are emitted on the real session path, never on ".../auto"
+            (session_path,) = manager.call_method(
+                "org.freedesktop.login1",
+                "/org/freedesktop/login1",
+                "org.freedesktop.login1.Manager",
+                "GetSession",
+                GLib.Variant("(s)", (os.environ.get("XDG_SESSION_ID", "auto"),)),
+            )
+            self._session = GioDBusHelper(
+                bus_name="org.freedesktop.login1",
+                object_path=session_path,
+                interface_name="org.freedesktop.login1.Session",
+                bus_type=Gio.BusType.SYSTEM,
+            )
+        except Exception as e:
+            logger.warning(f"{Colors.WARNING}[Polling] logind is unavailable: {e}")
+            return
+
+        self._session.listen_signal(
+            member="PropertiesChanged", callback=self._on_session_changed
+        )
+
+        for condition, hint in (("idle", "IdleHint"), ("locked", "LockedHint")):
+            value = self._session.proxy.get_cached_property(hint)
+            self.set_condition(condition, bool(value and value.unpack()))
+
+    def _on_session_changed(self, *args):
+        # (connection, sender, path, interface, signal, parameters)
+        _, changed, _ = args[5].unpack()
+        if "IdleHint" in changed:
+            self.set_condition("idle", bool(changed["IdleHint"]))
+        if "LockedHint" in changed:
+            self.set_condition("locked", bool(changed["LockedHint"]))
+
+
+class AdaptiveTimer:
+    """A GLib timeout whose interval follows the polling policy.
+
+    The callback follows `GLib.timeout_add` semantics, returning False stops the
+    timer. When polling resumes after a suspension the callback runs right
+    away, so nothing shows stale data until the next tick.
+    """
+
+    def __init__(
+        self, interval: int, callback: Callable[[], bool | None], start: bool = True
+    ):
+        self.interval = interval
+        self.callback = callback
+
+        self._policy = PollingPolicyService()
+        self._source_id: int | None = None
+        self._handler_id: int | None = None
+        self._current_interval: int | None = None
+
+        if start:
+            self.start()
+
+    @property
+    def running(self) -> bool:
+        return self._handler_id is not None
+
+    def start(self):
+        if self.running:
+            return
+        self._handler_id = self._policy.connect("changed", self._on_policy_changed)
+        self._schedule()
+
+    def stop(self):
+        self._cancel()
+        if self._handler_id is not None:
+            self._policy.disconnect(self._handler_id)
+            self._handler_id = None
+
+    def _cancel(self):
+        if self._source_id is not None:
+            GLib.source_remove(self._source_id)
+            self._source_id = None
+
+    def _schedule(self):
+        self._cancel()
+        self._current_interval = self._policy.interval(self.interval)
+        if self._current_interval is not None:
+            self._source_id = GLib.timeout_add(self._current_interval, self._on_timeout)
+
+    def _run_callback(self) -> bool:
+        try:
+            keep_going = self.callback() is not False
+        except Exception as e:
+            logger.exception(f"{Colors.ERROR}[Polling] Timer callback failed: {e}")
+            keep_going = True
+        if not keep_going:
+            self.stop()
+        return keep_going
+
+    def _on_timeout(self):
+        if not self._run_callback():
+            return False
+        if self._policy.interval(self.interval) != self._current_interval:
+            # The source was replaced by _schedule
+            self._source_id = None
+            self._schedule()
+            return False
+        return True
+
+    def _on_policy_changed(self, *_):
+        was_suspended = self._current_interval is None
+        self._schedule()
+        if was_suspended and self._current_interval is not None:
+            self._run_callback()
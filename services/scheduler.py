@@ -0,0 +1,116 @@
+import math
+import time
+from typing import Callable
+
+from fabric.core.service import Service
+from gi.repository import GLib
+from loguru import logger
+
+from services.polling import PollingPolicyService
+from utils.colors import Colors
+from utils.scheduler import Alignment, ScheduledTask, TickSchedule
+
+
+class TickScheduler(Service):
+    """Single timer driving every periodic widget update.
+
+    Callers register an interval and optionally an alignment and a widget.
+    All deadlines are coalesced into one GLib timeout armed for the earliest
+    wakeup. Clock-like tasks fire right on second or minute boundaries.
+    Tasks bound to a widget are skipped while it is not mapped, and caught up
+    as soon as it is mapped again.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self, **kwargs):
+        if getattr(self, "_initialized", False):
+            return
+        super().__init__(**kwargs)
+        self._initialized = True
+
+        self._schedule = TickSchedule()
+        self._source_id: int | None = None
+
+        self._policy = PollingPolicyService()
+        self._suspended = self._policy.suspended
+        self._policy.connect("changed", self._on_policy_changed)
+
+    def register(
+        self,
+        interval: int,
+        callback: Callable[[], object],
+        align: Alignment | None = None,
+        widget=None,
+    ) -> int:
+        """Run `callback` every `interval` ms until unregistered.
+
+        When `widget` is given the task is skipped while the widget is not
+        mapped and is dropped when the widget is destroyed.
+        """
+        task = self._schedule.add(
+            interval, callback, time.time(), align, widget, self._policy.scale
+        )
+
+        if widget is not None:
+            widget.connect("destroy", lambda *_: self.unregister(task.id))
+            widget.connect("map", lambda *_: self._on_widget_mapped(task.id))
+
+        self._arm()
+        return task.id
+
+    def unregister(self, task_id: int):
+        if self._schedule.remove(task_id) is not None:
+            self._arm()
+
+    def _arm(self):
+        if self._source_id is not None:
+            GLib.source_remove(self._source_id)
+            self._source_id = None
+
+        wakeup = self._schedule.next_wakeup()
+        if wakeup is None or self._suspended:
+            return
+
+        delay = max(math.ceil((wakeup - time.time()) * 1000), 0)
+        self._source_id = GLib.timeout_add(delay, self._on_wakeup)
+
+    def _on_wakeup(self):
+        self._source_id = None
+        for task in self._schedule.pop_due(time.time(), self._policy.scale):
+            self._run(task)
+        self._arm()
+        return False
+
+    def _run(self, task: ScheduledTask):
+        if task.widget is not None and not task.widget.get_mapped():
+            task.missed = True
+            return
+
+        task.missed = False
+        try:
+            task.callback()
+        except Exception as e:
+            logger.exception(f"{Colors.ERROR}[Scheduler] Task {task.id} failed: {e}")
+
+    def _on_widget_mapped(self, task_id: int):
+        task = self._schedule.get(task_id)
+        if task is not None and task.missed and not self._suspended:
+            self._run(task)
+
+    def _on_policy_changed(self, *_):
+        resumed = self._suspended and not self._policy.suspended
+        self._suspended = self._policy.suspended
+
+        if resumed:
+            # Catch up on the tasks that came due while suspended only, the
+            # others, a weather fetch say, keep their deadline
+            for task in self._schedule.pop_due(time.time(), self._policy.scale):
+                self._run(task)
+
+        self._arm()
@@ -0,0 +1,237 @@
+import threading
+import time
+from itertools import count
+from typing import Callable, Iterable
+
+import psutil
+from fabric.core.service import Service
+from gi.repository import GLib
+from loguru import logger
+
+from services.polling import PollingPolicyService
+from utils.colors import Colors
+from utils.config import widget_config
+from utils.history import HistoryStore
+from utils.procfs import ProcStatsReader
+from utils.sensors import SensorRegistry
+
+cpu_config = widget_config["widgets"]["cpu"]
+storage_config = widget_config["widgets"]["storage"]
+general_config = widget_config["general"]
+
+# Shared sample history, sized once from the config before any widget reads it
+history_store = HistoryStore(
+    duration=general_config.get("history_duration", 10800),
+    resolution=general_config.get("history_resolution", 1),
+)
+
+
+class StatsSubscription:
+    """A single consumer of the sampler: which metrics it needs and how often."""
+
+    __slots__ = ("callback", "id", "interval", "metrics", "next_due")
+
+    def __init__(
+        self,
+        subscription_id: int,
+        metrics: frozenset[str],
+        interval: float,
+        callback: Callable[[dict], None],
+    ):
+        self.id = subscription_id
+        self.metrics = metrics
+        self.interval = interval
+        self.callback = callback
+        self.next_due = time.monotonic()
+
+
+class SystemStatsService(Service):
+    """Demand-driven sampler for cpu, memory, disk and temperature metrics.
+
+    Widgets subscribe to the metrics they need at their own cadence; each
+    tick only collects the union of the metrics that are due, and nothing is
+    sampled while there are no subscribers.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self, **kwargs):
+        if getattr(self, "_initialized", False):
+            return
+        super().__init__(**kwargs)
+        self._initialized = True
+
+        self._subscriptions: dict[int, StatsSubscription] = {}
+        self._ids = count(1)
+        self._condition = threading.Condition()
+        self._worker: threading.Thread | None = None
+
+        # Scaled or suspended by the polling policy, read by the worker
+        self._policy = PollingPolicyService()
+        self._scale = self._policy.scale
+        self._suspended = self._policy.suspended
+        self._policy.connect("changed", self._on_policy_changed)
+
+        self.disk_path = storage_config.get("path", "/")
+
+        # Resolve the configured sensor to a single input file up front
+        self.cpu_sensor = SensorRegistry().get(cpu_config.get("sensor", ""))
+
+        try:
+            reader = ProcStatsReader()
+        except OSError as e:
+            logger.warning(
+                f"{Colors.WARNING}[SystemStats] /proc is not readable ({e}), "
+                "falling back to psutil"
+            )
+            reader = None
+
+        self._collectors: dict[str, Callable[[], object]] = {
+            "cpu_usage": reader.cpu_percent
+            if reader
+            else lambda: round(psutil.cpu_percent(), 1),
+            "cpu_freq": reader.cpu_freq
+            if reader and reader.has_cpu_freq
+            else psutil.cpu_freq,
+            "temperature": self.cpu_sensor.read,
+            "memory": reader.virtual_memory if reader else psutil.virtual_memory,
+            "disk": lambda: psutil.disk_usage(self.disk_path),
+        }
+
+    @property
+    def active_metrics(self) -> frozenset[str]:
+        """Return the union of metrics requested by live subscriptions."""
+        with self._condition:
+            return frozenset().union(
+                *(sub.metrics for sub in self._subscriptions.values())
+            )
+
+    def subscribe(
+        self,
+        metrics: Iterable[str],
+        callback: Callable[[dict], None],
+        interval: int = 1000,
+    ) -> int:
+        """Register a callback for the given metrics every `interval` ms."""
+        metrics = frozenset(metrics)
+        unknown = metrics - self._collectors.keys()
+        if unknown:
+            raise ValueError(f"Unknown system metrics: {', '.join(sorted(unknown))}")
+
+        with self._condition:
+            subscription = StatsSubscription(
+                next(self._ids), metrics, max(interval, 100) / 1000, callback
+            )
+            self._subscriptions[subscription.id] = subscription
+            self._ensure_worker()
+            self._condition.notify()
+
+        logger.debug(
+            f"[SystemStats] Subscription {subscription.id} added for "
+            f"{sorted(metrics)} every {interval}ms"
+        )
+        return subscription.id
+
+    def unsubscribe(self, subscription_id: int):
+        """Drop a subscription; metrics nobody needs anymore stop being sampled."""
+        with self._condition:
+            if self._subscriptions.pop(subscription_id, None) is not None:
+                self._condition.notify()
+
+    def _on_policy_changed(self, *_):
+        with self._condition:
+            resumed = self._suspended and not self._policy.suspended
+            self._scale = self._policy.scale
+            self._suspended = self._policy.suspended
+            if resumed:
+                # Refresh every subscriber right away instead of on its next tick
+                now = time.monotonic()
+                for sub in self._subscriptions.values():
+                    sub.next_due = now
+            self._condition.notify()
+
+    def _ensure_worker(self):
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(
+                target=self._run, name="system-stats", daemon=True
+            )
+            self._worker.start()
+
+    def _next_batch(self) -> tuple[list[int], frozenset[str]]:
+        """Block until at least one subscription is due and return it."""
+        with self._condition:
+            while True:
+                if not self._subscriptions or self._suspended:
+                    self._condition.wait()
+                    continue
+
+                now = time.monotonic()
+                due = [
+                    sub for sub in self._subscriptions.values() if sub.next_due <= now
+                ]
+
+                if not due:
+                    next_due = min(sub.next_due for sub in self._subscriptions.values())
+                    self._condition.wait(next_due - now)
+                    continue
+
+                for sub in due:
+                    # Keep the cadence stable, but never try to catch up on
+                    # ticks we missed while the system was suspended
+                    sub.next_due = max(sub.next_due + sub.interval * self._scale, now)
+
+                return [sub.id for sub in due], frozenset().union(
+                    *(sub.metrics for sub in due)
+                )
+
+    def _collect(self, metrics: frozenset[str]) -> dict:
+        sample = {}
+        for metric in metrics:
+            try:
+                sample[metric] = self._collectors[metric]()
+            except Exception as e:
+                logger.warning(
+                    f"{Colors.WARNING}[SystemStats] Failed to read {metric}: {e}"
+                )
+                sample[metric] = None
+        return sample
+
+    def _run(self):
+        while True:
+            subscription_ids, metrics = self._next_batch()
+            sample = self._collect(metrics)
+            GLib.idle_add(self._dispatch, subscription_ids, sample)
+
+    def _record(self, sample: dict):
+        """Append the sampled percentages to the shared history."""
+        if (usage := sample.get("cpu_usage")) is not None:
+            history_store.push("cpu", usage)
+        if (temperature := sample.get("temperature")) is not None:
+            history_store.push("cpu_temperature", temperature)
+        if (memory := sample.get("memory")) is not None:
+            history_store.push("memory", memory.percent)
+        if (disk := sample.get("disk")) is not None:
+            history_store.push("storage", disk.percent)
+
+    def _dispatch(self, subscription_ids: list[int], sample: dict):
+        # Record on the main loop, where widgets read the history
+        self._record(sample)
+
+        for subscription_id in subscription_ids:
+            subscription = self._subscriptions.get(subscription_id)
+            # The widget may have been destroyed while the sample was in flight
+            if subscription is None:
+                continue
+            try:
+                subscription.callback(sample)
+            except Exception as e:
+                logger.exception(
+                    f"{Colors.ERROR}[SystemStats] Subscriber {subscription_id} "
+                    f"failed: {e}"
+                )
+        return False
@@ -1,10 +1,8 @@
 from fabric.widgets.label import Label
 
 import utils.functions as helpers
-from utils.widget_utils import (
-    nerd_font_icon,
-    reusable_fabricator,
-)
+from services.scheduler import TickScheduler
+from utils.widget_utils import nerd_font_icon
 
 from .widget_container import ButtonWidget
 
@@ -60,8 +58,7 @@ class CommandSwitcher(ButtonWidget):
 
         self.connect("clicked", self.handle_click)
 
-        # reusing the fabricator to call specified intervals
-        reusable_fabricator.connect("changed", self.update_ui)
+        TickScheduler().register(1000, self.update_ui, widget=self)
         self.update_ui()  # Initial update
 
     # toggle the command on click
@@ -10,7 +10,6 @@ from fabric.utils import (
     bulk_connect,
     cooldown,
     get_relative_path,
-    invoke_repeater,
 )
 from fabric.widgets.box import Box
 from fabric.widgets.button import Button
@@ -24,6 +23,7 @@ from gi.repository import GLib, GObject
 from loguru import logger
 
 from services.mpris import MprisPlayer, MprisPlayerManager
+from services.polling import AdaptiveTimer
 from shared.buttons import HoverButton
 from shared.circle_image import CircleImage
 from utils.bezier import cubic_bezier
@@ -410,6 +410,10 @@ class PlayerBox(Box):
 
         self.children = [*self.children, self.overlay_box]
 
+        # One timer per player box, only running while the player is playing
+        self.seekbar_timer = AdaptiveTimer(1000, self._move_seekbar, start=False)
+        self.connect("destroy", lambda *_: self.seekbar_timer.stop())
+
         bulk_connect(
             self.player,
             {
@@ -429,7 +433,9 @@ class PlayerBox(Box):
             self.length_label.set_label(self.length_str(self.player.length))
             self.seek_bar.set_range(0, duration)
 
-        invoke_repeater(1000, self._move_seekbar)
+        self._move_seekbar()
+        if self.player.get_property("playback-status") == "playing":
+            self.seekbar_timer.start()
 
     def _set_notify_value(self, p, *_):
         self.image_box.angle = self.angle_direction * p.value
@@ -485,11 +491,15 @@ class PlayerBox(Box):
             self.play_pause_icon.set_label(
                 text_icons["mpris"]["playing"],
             )
+            # The position is frozen, no need to keep polling it
+            self.seekbar_timer.stop()
+            self._move_seekbar()
 
         if status == "playing":
             self.play_pause_icon.set_label(
                 text_icons["mpris"]["paused"],
             )
+            self.seekbar_timer.start()
 
     def _update_image(self, image_path):
         if image_path and os.path.isfile(image_path):
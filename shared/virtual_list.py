@@ -0,0 +1,257 @@
+from collections.abc import Callable, Sequence
+from typing import Any
+
+import gi
+from fabric.widgets.scrolledwindow import ScrolledWindow
+from gi.repository import Gdk, GLib, Gtk
+
+from utils.virtual_list import RowOffsets, move_selection, row_count
+
+gi.require_versions({"Gtk": "3.0", "Gdk": "3.0"})
+
+
+class VirtualList(ScrolledWindow):
+    """A scrolled list or grid that only builds widgets for visible rows.
+
+    `create_cell` makes an empty cell and `bind_cell(cell, item, index)` fills
+    it with an item. The pool of cells is sized to the viewport and cells are
+    rebound as the list scrolls or its items change, so the widget count
+    doesn't depend on how many items there are. Cells that are buttons
+    activate their item when clicked.
+
+    Rows have the natural height of a bound cell unless `row_height` is given.
+    `item_height(item, row_height)` can make some items taller, an image
+    preview say. With `visible_rows` the viewport is sized to that many rows.
+    `unbind_cell(cell)` is called when a cell stops showing its item, to
+    cancel work started for it.
+    """
+
+    def __init__(
+        self,
+        create_cell: Callable[[], Gtk.Widget],
+        bind_cell: Callable[[Gtk.Widget, Any, int], None],
+        on_activate: Callable[[Any], None] | None = None,
+        unbind_cell: Callable[[Gtk.Widget], None] | None = None,
+        columns: int = 1,
+        row_height: int | None = None,
+        item_height: Callable[[Any, int], int] | None = None,
+        visible_rows: int | None = None,
+        overscan: int = 1,
+        **kwargs,
+    ):
+        kwargs.setdefault("h_scrollbar_policy", "never")
+        super().__init__(**kwargs)
+        self.create_cell = create_cell
+        self.bind_cell = bind_cell
+        self.on_activate = on_activate
+        self.unbind_cell = unbind_cell
+        self.columns = max(columns, 1)
+        self.item_height = item_height
+        self.visible_rows = visible_rows
+        self.overscan = overscan
+
+        self.items: Sequence = []
+        self.selected = -1
+        self._row_height = row_height
+        self._offsets = RowOffsets([])
+        self._cells: list[Gtk.Widget] = []
+        # Cell -> index of the item it shows, -1 when hidden
+        self._bound: dict[Gtk.Widget, int] = {}
+        self._width = 0
+        self._refresh_id = 0
+
+        self.layout = Gtk.Layout()
+        self.layout.connect("size-allocate", self._on_size_allocate)
+        self.add(self.layout)
+
+        self.get_vadjustment().connect("value-changed", lambda *_: self._refresh())
+
+    @property
+    def selected_item(self):
+        if 0 <= self.selected < len(self.items):
+            return self.items[self.selected]
+        return None
+
+    def set_items(self, items: Sequence, selected: int = -1):
+        """Show new items from the top, keeping the existing cells."""
+        self.items = items
+        self.selected = selected if selected < len(items) else -1
+        for cell in self._cells:
+            self._unbind(cell)
+        self._layout_rows()
+        self.get_vadjustment().set_value(0)
+        self._refresh()
+
+    def extend_items(self, items: Sequence):
+        """Append items, keeping the scroll position and selection."""
+        if not items:
+            return
+        self.items = [*self.items, *items]
+        self._layout_rows()
+        self._refresh()
+
+    def _layout_rows(self):
+        if self._row_height is None:
+            self._offsets = RowOffsets([])
+            return
+        rows = row_count(len(self.items), self.columns)
+        if self.item_height is None:
+            heights = [self._row_height] * rows
+        else:
+            heights = [
+                max(
+                    self.item_height(item, self._row_height)
+                    for item in self.items[
+                        row * self.columns : (row + 1) * self.columns
+                    ]
+                )
+                for row in range(rows)
+            ]
+        self._offsets = RowOffsets(heights)
+        self.layout.set_size(self._width, self._offsets.total)
+
+    def _measure(self):
+        """Take the row height from the natural height of a bound cell."""
+        cell = self._cells[0] if self._cells else self._new_cell()
+        self._unbind(cell)
+        self.bind_cell(cell, self.items[0], 0)
+        self._bound[cell] = 0
+        self._row_height = max(cell.get_preferred_height()[1], 1)
+        width = cell.get_preferred_width()[1] * self.columns
+        if self.get_min_content_width() < width:
+            self.set_min_content_width(width)
+        if self.visible_rows:
+            height = self._row_height * self.visible_rows
+            self.set_min_content_height(height)
+            self.set_max_content_height(height)
+        self._layout_rows()
+
+    def _new_cell(self) -> Gtk.Widget:
+        cell = self.create_cell()
+        if isinstance(cell, Gtk.Button):
+            cell.connect("clicked", self._on_cell_clicked)
+        self._cells.append(cell)
+        self._bound[cell] = -1
+        self.layout.put(cell, 0, 0)
+        return cell
+
+    def _on_cell_clicked(self, cell):
+        index = self._bound.get(cell, -1)
+        if index >= 0:
+            self.activate(index)
+
+    def _on_size_allocate(self, _, allocation):
+        if allocation.width != self._width:
+            self._width = allocation.width
+            self.layout.set_size(self._width, self._offsets.total)
+        # Moving children during an allocation would queue another one
+        if not self._refresh_id:
+            self._refresh_id = GLib.idle_add(self._idle_refresh)
+
+    def _idle_refresh(self):
+        self._refresh_id = 0
+        self._refresh()
+        return False
+
+    def _refresh(self):
+        if not self.items:
+            for cell in self._cells:
+                cell.hide()
+                self._unbind(cell)
+            return
+        if self._row_height is None:
+            if not self.get_mapped():
+                return
+            self._measure()
+
+        adjustment = self.get_vadjustment()
+        page = adjustment.get_page_size() or self.get_allocated_height()
+        rows = self._offsets.visible(adjustment.get_value(), page, self.overscan)
+
+        while len(self._cells) < len(rows) * self.columns:
+            self._new_cell()
+
+        # Rows keep the same cells while they stay in view, so scrolling by a
+        # row only rebinds the cells of the row that came into view
+        pool_rows = len(self._cells) // self.columns
+        shown = set()
+        cell_width = max(self._width // self.columns, 1)
+        for row in rows:
+            for column in range(self.columns):
+                index = row * self.columns + column
+                position = (row % pool_rows) * self.columns + column
+                if index >= len(self.items):
+                    break
+                cell = self._cells[position]
+                shown.add(position)
+                if self._bound[cell] != index:
+                    self._unbind(cell)
+                    self.bind_cell(cell, self.items[index], index)
+                    self._bound[cell] = index
+                self._set_selected_class(cell, index == self.selected)
+                cell.set_size_request(cell_width, self._offsets.heights[row])
+                self.layout.move(cell, column * cell_width, self._offsets.top(row))
+                cell.show()
+
+        for position, cell in enumerate(self._cells):
+            if position not in shown:
+                self._unbind(cell)
+                cell.hide()
+
+    def _unbind(self, cell: Gtk.Widget):
+        if self._bound[cell] >= 0 and self.unbind_cell:
+            self.unbind_cell(cell)
+        self._bound[cell] = -1
+
+    @staticmethod
+    def _set_selected_class(cell: Gtk.Widget, selected: bool):
+        style_context = cell.get_style_context()
+        if selected:
+            style_context.add_class("selected")
+        else:
+            style_context.remove_class("selected")
+
+    def select(self, index: int):
+        """Select an item, -1 for none, and scroll it into view."""
+        self.selected = index if 0 <= index < len(self.items) else -1
+        if self.selected >= 0 and len(self._offsets):
+            adjustment = self.get_vadjustment()
+            adjustment.set_value(
+                self._offsets.scroll_to(
+                    self.selected // self.columns,
+                    adjustment.get_value(),
+                    adjustment.get_page_size(),
+                )
+            )
+        for cell, bound in self._bound.items():
+            if bound >= 0:
+                self._set_selected_class(cell, bound == self.selected)
+
+    def move(self, dx: int = 0, dy: int = 0):
+        self.select(
+            move_selection(self.selected, len(self.items), self.columns, dx, dy)
+        )
+
+    def activate(self, index: int | None = None):
+        """Activate an item, the selected one by default."""
+        index = self.selected if index is None else index
+        if self.on_activate and 0 <= index < len(self.items):
+            self.on_activate(self.items[index])
+
+    def handle_key(self, keyval: int) -> bool:
+        """Move the selection for a navigation key, True if handled."""
+        page_rows = self.visible_rows or 5
+        moves = {
+            Gdk.KEY_Down: (0, 1),
+            Gdk.KEY_Up: (0, -1),
+            Gdk.KEY_Page_Down: (0, page_rows),
+            Gdk.KEY_Page_Up: (0, -page_rows),
+        }
+        if self.columns > 1:
+            moves[Gdk.KEY_Right] = (1, 0)
+            moves[Gdk.KEY_Left] = (-1, 0)
+
+        if keyval not in moves:
+            return False
+        self.move(*moves[keyval])
+        return True
@@ -0,0 +1,93 @@
+"""Measure keystroke-to-result latency of the launcher search.
+
+Compares the substring filter the launcher used to run on every keystroke
+with AppSearchEngine, over a synthetic catalogue of a few thousand apps.
+Run from the repository root with `python -m tests.bench_app_search`.
+"""
+
+import random
+import time
+
+from utils.app_search import AppSearchEngine
+from utils.frecency import FrecencyStore
+
+WORDS = [
+    "audio", "browser", "calendar", "code", "disk", "editor", "files", "fire",
+    "font", "image", "mail", "manager", "media", "monitor", "music", "network",
+    "office", "player", "printer", "settings", "studio", "system", "terminal",
+    "text", "video", "viewer", "visual", "web",
+]  # fmt: skip
+QUERIES = ["firefox", "visual studio", "terminal", "xyzzy"]
+
+
+class App:
+    """Stand-in for the desktop apps AppUtils returns."""
+
+    def __init__(self, name: str, generic_name: str):
+        self.name = name
+        self.display_name = name
+        self.generic_name = generic_name
+
+
+def make_apps(count: int) -> list[App]:
+    rng = random.Random(0)
+    apps = [App("Firefox", "Web Browser"), App("Visual Studio Code", "Text Editor")]
+    while len(apps) < count:
+        name = " ".join(rng.choice(WORDS).title() for _ in range(rng.randint(1, 3)))
+        apps.append(App(f"{name} {len(apps)}", " ".join(rng.sample(WORDS, 2))))
+    return apps
+
+
+def substring_filter(apps: list[App], query: str) -> list[App]:
+    # What AppLauncher.arrange_viewport used to do
+    return [
+        app
+        for app in apps
+        if query.casefold()
+        in (
+            (app.display_name or "") + (" " + app.name + " ") + (app.generic_name or "")
+        ).casefold()
+    ]
+
+
+def type_query(search, query: str) -> list[float]:
+    """Latency of each keystroke while typing `query`, in seconds."""
+    latencies = []
+    for end in range(1, len(query) + 1):
+        start = time.perf_counter()
+        search(query[:end])
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def main(count: int = 2500, rounds: int = 20):
+    apps = make_apps(count)
+
+    start = time.perf_counter()
+    engine = AppSearchEngine(
+        key=lambda app: app.name,
+        fields=lambda app: (app.display_name, app.name, app.generic_name),
+        frecency=FrecencyStore(),
+    )
+    engine.set_items(apps)
+    print(f"{count} apps indexed in {(time.perf_counter() - start) * 1e3:.1f} ms")
+
+    for query in QUERIES:
+        naive, ranked = [], []
+        for _ in range(rounds):
+            naive += type_query(lambda q: substring_filter(apps, q), query)
+            # Clear the previous query so every round starts from scratch
+            engine.set_items(apps)
+            ranked += type_query(engine.search, query)
+
+        naive.sort()
+        ranked.sort()
+        print(
+            f"{query!r:>16}: substring {naive[len(naive) // 2] * 1e3:6.2f} ms, "
+            f"ranked median {ranked[len(ranked) // 2] * 1e3:6.2f} ms, "
+            f"p95 {ranked[int(len(ranked) * 0.95)] * 1e3:6.2f} ms per keystroke"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""Compare the per-sample cost of the psutil path against ProcStatsReader.
+
+Run from the repository root with `python -m tests.bench_procfs`.
+"""
+
+import timeit
+
+import psutil
+
+from utils.procfs import ProcStatsReader
+
+
+def psutil_sample():
+    # What stats_poll used to do every second for cpu, frequency and memory
+    round(psutil.cpu_percent(), 1)
+    psutil.cpu_freq()
+    round(psutil.virtual_memory().percent, 1)
+    psutil.virtual_memory()
+
+
+def main(number: int = 5000):
+    reader = ProcStatsReader()
+
+    def reader_sample():
+        reader.cpu_percent()
+        reader.cpu_freq()
+        reader.virtual_memory()
+
+    results = {
+        "psutil": min(timeit.repeat(psutil_sample, number=number, repeat=5)),
+        "procfs": min(timeit.repeat(reader_sample, number=number, repeat=5)),
+    }
+
+    for name, total in results.items():
+        print(f"{name:>8}: {total / number * 1e6:8.1f} µs/sample")
+
+    print(f"{'speedup':>8}: {results['psutil'] / results['procfs']:8.1f}x")
+    reader.close()
+
+
+if __name__ == "__main__":
+    main()
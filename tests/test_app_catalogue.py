@@ -0,0 +1,109 @@
+import os
+import tempfile
+import threading
+import unittest
+
+from utils.app_catalogue import AppCatalogue, scan_applications
+
+
+class AppCatalogueTest(unittest.TestCase):
+    """Test suite for the persisted desktop application catalogue."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.user = os.path.join(self.directory.name, "user")
+        self.system = os.path.join(self.directory.name, "system")
+        os.makedirs(os.path.join(self.system, "kde4"))
+        os.makedirs(self.user)
+        self.snapshot = os.path.join(self.directory.name, "cache", "apps.json")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, directory: str, name: str, content: str = "") -> str:
+        path = os.path.join(directory, name)
+        with open(path, "w") as f:
+            f.write(content)
+        return path
+
+    def parse(self, path: str):
+        with open(path) as f:
+            name = f.read()
+        return {"name": name} if name else None
+
+    def catalogue(self, context: str = "") -> AppCatalogue:
+        return AppCatalogue(
+            self.snapshot, [self.user, self.system], self.parse, context=context
+        )
+
+    def test_scan_follows_directory_precedence(self):
+        self.write(self.system, "foot.desktop")
+        user_foot = self.write(self.user, "foot.desktop")
+        self.write(os.path.join(self.system, "kde4"), "dolphin.desktop")
+        self.write(self.system, "README")
+
+        found = scan_applications([self.user, self.system])
+        self.assertEqual(set(found), {"foot.desktop", "kde4-dolphin.desktop"})
+        self.assertEqual(found["foot.desktop"][0], user_foot)
+
+    def test_only_changed_files_are_parsed(self):
+        self.write(self.system, "foot.desktop", "Foot")
+        kitty = self.write(self.system, "kitty.desktop", "Kitty")
+        self.write(self.system, "hidden.desktop")
+
+        catalogue = self.catalogue()
+        self.assertFalse(catalogue.load())
+        self.assertTrue(catalogue.update())
+        self.assertEqual(catalogue.parsed, 3)
+        self.assertEqual(
+            sorted(app["name"] for _, app in catalogue.apps()), ["Foot", "Kitty"]
+        )
+        catalogue.save()
+
+        # A new session starts from the snapshot and re-parses only the edit
+        self.write(self.system, "kitty.desktop", "Kitty 2")
+        os.utime(kitty, ns=(1, 1))
+        catalogue = self.catalogue()
+        self.assertTrue(catalogue.load())
+        self.assertEqual(len(catalogue.apps()), 2)
+        self.assertTrue(catalogue.update())
+        self.assertEqual(catalogue.parsed, 1)
+        self.assertIn("Kitty 2", [app["name"] for _, app in catalogue.apps()])
+
+        self.assertFalse(catalogue.update())
+        self.assertEqual(catalogue.parsed, 1)
+
+    def test_removed_files_are_dropped(self):
+        foot = self.write(self.system, "foot.desktop", "Foot")
+        catalogue = self.catalogue()
+        catalogue.update()
+        os.remove(foot)
+        self.assertTrue(catalogue.update())
+        self.assertEqual(catalogue.apps(), [])
+
+    def test_snapshot_from_another_context_is_ignored(self):
+        self.write(self.system, "foot.desktop", "Foot")
+        catalogue = self.catalogue("en_US")
+        catalogue.update()
+        catalogue.save()
+        self.assertFalse(self.catalogue("fr_FR").load())
+        self.assertTrue(self.catalogue("en_US").load())
+
+    def test_concurrent_saves_leave_a_valid_snapshot(self):
+        for number in range(50):
+            self.write(self.system, f"app{number}.desktop", f"App {number}")
+        catalogue = self.catalogue()
+        catalogue.update()
+
+        threads = [threading.Thread(target=catalogue.save) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        loaded = self.catalogue()
+        self.assertTrue(loaded.load())
+        self.assertEqual(len(loaded.apps()), 50)
+
+
+if __name__ == "__main__":
+    unittest.main()
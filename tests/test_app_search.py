@@ -0,0 +1,88 @@
+import unittest
+
+from utils.app_search import AppSearchEngine, fuzzy_score, word_starts
+from utils.frecency import FrecencyStore
+
+
+class App:
+    """Stand-in for the desktop apps AppUtils returns."""
+
+    def __init__(self, name: str, generic_name: str | None = None):
+        self.name = name
+        self.display_name = name
+        self.generic_name = generic_name
+
+
+def engine(apps, frecency=None) -> AppSearchEngine:
+    search = AppSearchEngine(
+        key=lambda app: app.name,
+        fields=lambda app: (app.display_name, app.name, app.generic_name),
+        frecency=frecency,
+    )
+    search.set_items(apps)
+    return search
+
+
+class FuzzyScoreTest(unittest.TestCase):
+    """Test suite for the fuzzy scoring function."""
+
+    def score(self, query: str, text: str):
+        return fuzzy_score(query, text, word_starts(text))
+
+    def test_subsequences(self):
+        self.assertIsNone(self.score("xyz", "firefox"))
+        self.assertIsNotNone(self.score("ffx", "firefox"))
+
+    def test_ranking(self):
+        # Prefix over substring over subsequence
+        self.assertGreater(self.score("fire", "firefox"), self.score("fox", "firefox"))
+        self.assertGreater(self.score("fox", "firefox"), self.score("ffx", "firefox"))
+        # Word starts are preferred
+        self.assertGreater(
+            self.score("vsc", "visual studio code"), self.score("vsc", "visible scan")
+        )
+
+
+class AppSearchEngineTest(unittest.TestCase):
+    """Test suite for the ranked, incremental app search."""
+
+    def setUp(self):
+        self.apps = [
+            App("Firefox", "Web Browser"),
+            App("Visual Studio Code", "Text Editor"),
+            App("Foot", "Terminal"),
+            App("Files", "File Manager"),
+        ]
+
+    def names(self, results):
+        return [app.name for app in results]
+
+    def test_empty_query_lists_everything(self):
+        self.assertEqual(len(engine(self.apps).search("")), 4)
+
+    def test_ranked_results(self):
+        search = engine(self.apps)
+        self.assertEqual(self.names(search.search("fi")), ["Files", "Firefox"])
+        self.assertEqual(self.names(search.search("vsc")), ["Visual Studio Code"])
+        self.assertEqual(self.names(search.search("browser")), ["Firefox"])
+
+    def test_narrowing_matches_a_full_search(self):
+        search = engine(self.apps)
+        for query in ["f", "fi", "fir", "fire"]:
+            self.assertEqual(
+                self.names(search.search(query)),
+                self.names(engine(self.apps).search(query)),
+            )
+        # The pool was narrowed to the previous matches
+        self.assertEqual(len(search._last_matches), 1)
+
+    def test_frecency_boosts_ranking(self):
+        frecency = FrecencyStore()
+        search = engine(self.apps, frecency)
+        for _ in range(5):
+            search.record_use(self.apps[0])
+        self.assertEqual(self.names(search.search("fi")), ["Firefox", "Files"])
+
+
+if __name__ == "__main__":
+    unittest.main()
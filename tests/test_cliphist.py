@@ -0,0 +1,128 @@
+import os
+import tempfile
+import unittest
+
+from utils.cliphist import (
+    ClipEntry,
+    ClipHistory,
+    ClipSearch,
+    parse_line,
+    read_entries,
+    slot_text,
+)
+
+
+class ClipHistoryParsingTest(unittest.TestCase):
+    """Test suite for parsing `cliphist list` output."""
+
+    def test_parse_line(self):
+        self.assertEqual(
+            parse_line("12\tHello\tWorld\n"),
+            ClipEntry("12", "Hello\tWorld", "text", "hello\tworld"),
+        )
+        self.assertEqual(
+            parse_line("7\t[[ binary data 20 KiB png 64x64 ]]").kind, "image"
+        )
+        self.assertIsNone(parse_line("\n"))
+        self.assertIsNone(parse_line('3\t<meta http-equiv="content-type">'))
+
+    def test_file_kind_needs_an_existing_image(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "shot one.png")
+            open(path, "wb").close()
+            self.assertEqual(
+                parse_line(f"1\tfile://{directory}/shot%20one.png").kind, "file"
+            )
+            self.assertEqual(parse_line(f"2\tfile://{directory}/gone.png").kind, "text")
+
+    def test_slot_text(self):
+        # What the menu binds for each kind of parsed entry
+        self.assertEqual(slot_text(parse_line("12\thello ")), ("hello", "hello"))
+        label, _ = slot_text(parse_line(f"13\t{'x' * 150}"))
+        self.assertEqual(len(label), 100)
+        self.assertTrue(label.endswith("..."))
+        self.assertEqual(
+            slot_text(parse_line("7\t[[ binary data 20 KiB png 64x64 ]]")),
+            ("[Image]", "Image in clipboard"),
+        )
+
+    def test_read_entries_chunks(self):
+        lines = [f"{n}\titem {n}\n".encode() for n in range(10, 0, -1)]
+        lines.insert(3, b"\n")
+        chunks = list(read_entries(iter(lines), first_chunk=2, chunk_size=4))
+
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 4, 4])
+        self.assertEqual(
+            [entry.id for chunk in chunks for entry in chunk],
+            [str(n) for n in range(10, 0, -1)],
+        )
+
+    def test_read_entries_decodes_invalid_utf8(self):
+        (chunk,) = read_entries([b"1\tcaf\xe9\n"])
+        self.assertEqual(chunk[0].preview, "caf�")
+
+
+def entries(*ids):
+    return [parse_line(f"{item_id}\tItem {item_id}") for item_id in ids]
+
+
+class ClipHistoryTest(unittest.TestCase):
+    """Test suite for the delta-updated clipboard history model."""
+
+    def setUp(self):
+        self.history = ClipHistory()
+        self.history.apply(entries(9, 7, 4, 2))
+
+    def ids(self):
+        return [entry.id for entry in self.history.entries]
+
+    def test_apply_returns_deltas(self):
+        added, removed = self.history.apply(entries(12, 10, 9, 4, 2))
+        self.assertEqual(added, entries(12, 10))
+        self.assertEqual(removed, entries(7))
+        self.assertEqual(self.ids(), ["12", "10", "9", "4", "2"])
+
+        self.assertEqual(self.history.apply(entries(12, 10, 9, 4, 2)), ([], []))
+
+    def test_add_keeps_newest_first(self):
+        self.history.add(entries(8, 1, 11))
+        self.assertEqual(self.ids(), ["11", "9", "8", "7", "4", "2", "1"])
+        self.assertTrue(self.history.ends_with(entries(2, 1)))
+        self.assertFalse(self.history.ends_with(entries(11)))
+
+    def test_remove_and_clear(self):
+        self.assertEqual(self.history.remove(["7", "5"]), entries(7))
+        self.assertNotIn("7", self.history)
+        self.assertEqual(self.ids(), ["9", "4", "2"])
+
+        self.assertEqual(self.history.clear(), entries(9, 4, 2))
+        self.assertEqual(len(self.history), 0)
+
+
+class ClipSearchTest(unittest.TestCase):
+    """Test suite for the narrowing clipboard search."""
+
+    def setUp(self):
+        self.history = ClipHistory()
+        self.history.apply(entries(31, 23, 13, 3))
+        self.search = ClipSearch(self.history)
+
+    def ids(self, query):
+        return [entry.id for entry in self.search.search(query)]
+
+    def test_narrows_and_widens(self):
+        self.assertEqual(self.ids("ITEM 3"), ["31", "3"])
+        self.assertEqual(self.ids("item 31"), ["31"])
+        self.assertEqual(self.ids("item"), ["31", "23", "13", "3"])
+        self.assertEqual(self.ids(""), ["31", "23", "13", "3"])
+
+    def test_history_changes_reset_narrowing(self):
+        self.assertEqual(self.ids("3"), ["31", "23", "13", "3"])
+        self.history.add(entries(33))
+        self.history.remove(["13"])
+        self.assertEqual(self.ids("33"), ["33"])
+        self.assertEqual(self.ids("3"), ["33", "31", "23", "3"])
+
+
+if __name__ == "__main__":
+    unittest.main()
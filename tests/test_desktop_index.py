@@ -0,0 +1,84 @@
+import os
+import tempfile
+import unittest
+
+from utils.desktop_index import DesktopFileIndex, exec_basename, tokenize
+
+
+def write_desktop_file(directory: str, name: str, **keys: str) -> str:
+    path = os.path.join(directory, name)
+    with open(path, "w") as f:
+        f.write("[Desktop Entry]\nType=Application\n")
+        for key, value in keys.items():
+            f.write(f"{key}={value}\n")
+        f.write("\n[Desktop Action new-window]\nName=Other\nIcon=wrong\n")
+    return path
+
+
+class DesktopFileIndexTest(unittest.TestCase):
+    """Test suite for the .desktop file token index."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.user = os.path.join(self.directory.name, "user")
+        self.system = os.path.join(self.directory.name, "system")
+        os.makedirs(self.user)
+        os.makedirs(self.system)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_tokens(self):
+        self.assertEqual(tokenize("org.gnome.Nautilus"), ["org", "gnome", "nautilus"])
+        self.assertEqual(exec_basename("env FOO=1 /usr/bin/code --new"), "code")
+
+    def test_lookup(self):
+        write_desktop_file(
+            self.system,
+            "org.gnome.Nautilus.desktop",
+            Name="Files",
+            Icon="org.gnome.Nautilus",
+            Exec="nautilus --new-window",
+        )
+        write_desktop_file(
+            self.system,
+            "code.desktop",
+            Name="Visual Studio Code",
+            Icon="vscode",
+            StartupWMClass="Code-OSS",
+        )
+        index = DesktopFileIndex([self.user, self.system])
+
+        self.assertEqual(index.lookup("org.gnome.Nautilus").icon, "org.gnome.Nautilus")
+        self.assertEqual(index.lookup("nautilus").icon, "org.gnome.Nautilus")
+        self.assertEqual(index.lookup("code-oss").icon, "vscode")
+        self.assertEqual(index.lookup("files").icon, "org.gnome.Nautilus")
+        self.assertIsNone(index.lookup("unknown"))
+
+    def test_user_files_shadow_system_files(self):
+        write_desktop_file(self.system, "foot.desktop", Icon="foot")
+        write_desktop_file(self.user, "foot.desktop", Icon="my-foot")
+        index = DesktopFileIndex([self.user, self.system])
+        self.assertEqual(index.lookup("foot").icon, "my-foot")
+
+    def test_updates(self):
+        index = DesktopFileIndex([self.user, self.system])
+        path = write_desktop_file(self.user, "kitty.desktop", Icon="kitty")
+        index.add(path)
+        self.assertEqual(index.lookup("kitty").icon, "kitty")
+
+        write_desktop_file(self.user, "kitty.desktop", Icon="kitty-2")
+        index.add(path)
+        self.assertEqual(index.lookup("kitty").icon, "kitty-2")
+
+        index.remove(path)
+        self.assertIsNone(index.lookup("kitty"))
+        self.assertEqual(index.tokens, {})
+
+    def test_hidden_files_are_skipped(self):
+        write_desktop_file(self.system, "foot.desktop", Icon="foot", Hidden="true")
+        self.assertIsNone(DesktopFileIndex([self.system]).lookup("foot"))
+
+
+if __name__ == "__main__":
+    unittest.main()
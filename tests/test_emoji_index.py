@@ -0,0 +1,60 @@
+import json
+import os
+import tempfile
+import unittest
+
+from utils.emoji_index import EmojiIndex
+
+EMOJI = {
+    "😀": {"name": "grinning face", "group": "Smileys & Emotion"},
+    "😺": {"name": "grinning cat", "group": "Smileys & Emotion"},
+    "🐶": {"name": "dog face", "group": "Animals & Nature"},
+    "🚗": {"name": "automobile", "group": "Travel & Places"},
+}
+
+
+class EmojiIndexTest(unittest.TestCase):
+    """Test suite for the emoji prefix index and its snapshot."""
+
+    def setUp(self):
+        self.index = EmojiIndex.from_emoji_data(EMOJI)
+
+    def chars(self, query: str) -> list[str]:
+        return [self.index.chars[emoji_id] for emoji_id in self.index.search(query)]
+
+    def test_search(self):
+        self.assertEqual(self.chars(""), list(EMOJI))
+        self.assertEqual(self.chars("grin"), ["😀", "😺"])
+        self.assertEqual(self.chars("GRINNING c"), ["😺"])
+        self.assertEqual(self.chars("face"), ["😀", "🐶"])
+        self.assertEqual(self.chars("animals"), ["🐶"])
+        self.assertEqual(self.chars("plane"), [])
+
+    def test_find(self):
+        self.assertEqual(self.index.find("🐶"), 2)
+        self.assertIsNone(self.index.find("🚀"))
+
+    def test_snapshot_follows_the_json(self):
+        with tempfile.TemporaryDirectory() as directory:
+            json_path = os.path.join(directory, "emoji.json")
+            index_path = os.path.join(directory, "cache", "emoji.index")
+            with open(json_path, "w") as f:
+                json.dump(EMOJI, f)
+
+            built = EmojiIndex.load(json_path, index_path)
+            self.assertTrue(os.path.exists(index_path))
+            loaded = EmojiIndex.load(json_path, index_path)
+            self.assertEqual(loaded.search("grin"), built.search("grin"))
+
+            # A changed JSON file makes the snapshot stale
+            with open(json_path, "w") as f:
+                json.dump({"🚀": {"name": "rocket", "group": "Travel"}}, f)
+            self.assertEqual(EmojiIndex.load(json_path, index_path).chars, ["🚀"])
+
+            with open(index_path, "wb") as f:
+                f.write(b"garbage")
+            self.assertEqual(EmojiIndex.load(json_path, index_path).chars, ["🚀"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,36 @@
+import os
+import tempfile
+import unittest
+
+from utils.frecency import FrecencyStore
+
+
+class FrecencyStoreTest(unittest.TestCase):
+    """Test suite for the decaying use counters."""
+
+    def test_decays_and_persists(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "frecency.json")
+            frecency = FrecencyStore(path, half_life=10)
+            frecency.record("foot", now=0)
+            frecency.record("foot", now=0)
+            self.assertAlmostEqual(frecency.score("foot", now=10), 1.0)
+            frecency.save()
+
+            # Read lazily on first use
+            restored = FrecencyStore(path, half_life=10)
+            self.assertEqual(restored.entries, {})
+            self.assertAlmostEqual(restored.score("foot", now=20), 0.5)
+
+    def test_capacity_forgets_the_coldest_key(self):
+        frecency = FrecencyStore(half_life=10, capacity=2)
+        frecency.record("a", now=0)
+        frecency.record("a", now=0)
+        frecency.record("b", now=0)
+        frecency.record("c", now=5)
+        self.assertEqual(set(frecency.entries), {"a", "c"})
+        self.assertEqual(frecency.top(2, now=5), ["a", "c"])
+
+
+if __name__ == "__main__":
+    unittest.main()
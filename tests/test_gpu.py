@@ -0,0 +1,129 @@
+import os
+import tempfile
+import unittest
+
+from utils.gpu import (
+    NvidiaSmiReader,
+    empty_sample,
+    find_sysfs_cards,
+    parse_nvtop_snapshot,
+)
+
+
+class SysfsGpuTest(unittest.TestCase):
+    """Test suite for reading GPU counters from a DRM sysfs tree."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.drm = self._tmp.name
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def write(self, path: str, value: str):
+        path = os.path.join(self.drm, path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            f.write(f"{value}\n")
+
+    def test_amdgpu(self):
+        self.write("card0/device/vendor", "0x1002")
+        self.write("card0/device/gpu_busy_percent", "37")
+        self.write("card0/device/mem_info_vram_used", str(512 * 1024**2))
+        self.write("card0/device/mem_info_vram_total", str(8 * 1024**3))
+        self.write("card0/device/pp_dpm_sclk", "0: 500Mhz\n1: 1850Mhz *\n2: 2400Mhz")
+        self.write("card0/device/hwmon/hwmon3/temp1_input", "52000")
+        # Connectors live next to the cards and must be ignored
+        self.write("card0-DP-1/status", "connected")
+
+        cards = find_sysfs_cards(self.drm)
+        self.assertEqual(len(cards), 1)
+        self.assertTrue(cards[0].has_usage)
+        self.assertEqual(
+            cards[0].sample(),
+            {
+                "name": "AMD card0",
+                "usage": 37.0,
+                "memory_used": 512 * 1024**2,
+                "memory_total": 8 * 1024**3,
+                "temperature": 52.0,
+                "frequency": 1850.0,
+            },
+        )
+
+        self.write("card0/device/gpu_busy_percent", "99")
+        self.assertEqual(cards[0].sample()["usage"], 99.0)
+        cards[0].close()
+
+    def test_intel_has_frequency_only(self):
+        self.write("card1/device/vendor", "0x8086")
+        self.write("card1/gt_act_freq_mhz", "1300")
+        self.write("card2/device/vendor", "0x10de")
+
+        cards = find_sysfs_cards(self.drm)
+        self.assertEqual([card.card for card in cards], ["card1"])
+        sample = cards[0].sample()
+        self.assertFalse(cards[0].has_usage)
+        self.assertIsNone(sample["usage"])
+        self.assertEqual(sample["frequency"], 1300.0)
+        cards[0].close()
+
+
+class GpuToolOutputTest(unittest.TestCase):
+    """Test suite for parsing nvidia-smi and nvtop output."""
+
+    def test_nvidia_smi_line(self):
+        sample = NvidiaSmiReader.parse(
+            ["NVIDIA GeForce RTX 3070", "12", "1024", "8192", "48", "1410"]
+        )
+        self.assertEqual(sample["usage"], 12.0)
+        self.assertEqual(sample["memory_used"], 1024 * 1024**2)
+        self.assertEqual(sample["memory_total"], 8192 * 1024**2)
+        self.assertEqual(sample["temperature"], 48.0)
+        self.assertEqual(sample["frequency"], 1410.0)
+
+    def test_nvidia_smi_zero_memory_used(self):
+        sample = NvidiaSmiReader.parse(["GPU", "0", "0", "8192", "40", "210"])
+        self.assertEqual(sample["usage"], 0.0)
+        self.assertEqual(sample["memory_used"], 0)
+
+    def test_nvidia_smi_without_driver(self):
+        with tempfile.TemporaryDirectory() as directory:
+            script = os.path.join(directory, "nvidia-smi")
+            with open(script, "w") as f:
+                f.write("#!/bin/sh\necho 'Failed to initialize NVML'\nexit 9\n")
+            os.chmod(script, 0o755)
+            path = os.environ["PATH"]
+            os.environ["PATH"] = f"{directory}:{path}"
+            try:
+                reader = NvidiaSmiReader(interval=1000)
+                reader.start()
+                self.assertFalse(reader.wait_ready(timeout=5))
+                process = reader._process
+                # Restarting waits for the backoff, no new helper per tick
+                self.assertEqual(reader.sample(), empty_sample())
+                self.assertIs(reader._process, process)
+                reader.close()
+            finally:
+                os.environ["PATH"] = path
+
+    def test_nvidia_smi_not_supported(self):
+        sample = NvidiaSmiReader.parse(
+            ["GPU", "[N/A]", "[N/A]", "[N/A]", "[N/A]", "[N/A]"]
+        )
+        self.assertIsNone(sample["usage"])
+        self.assertIsNone(sample["memory_total"])
+
+    def test_nvtop_snapshot(self):
+        sample = parse_nvtop_snapshot(
+            '[{"device_name": "Radeon", "gpu_util": "23%", "mem_util": "5%",'
+            ' "temp": "61C", "gpu_clock": "900MHz"}]\n'
+        )
+        self.assertEqual(sample["name"], "Radeon")
+        self.assertEqual(sample["usage"], 23.0)
+        self.assertEqual(sample["temperature"], 61.0)
+        self.assertEqual(sample["frequency"], 900.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
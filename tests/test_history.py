@@ -0,0 +1,61 @@
+import unittest
+
+from utils.history import MetricHistory
+
+
+class MetricHistoryTest(unittest.TestCase):
+    """Test suite for the ring-buffer metric history."""
+
+    def fill(self, history: MetricHistory, values):
+        for second, value in enumerate(values):
+            history.push(value, timestamp=second)
+
+    def test_wraps_at_capacity(self):
+        history = MetricHistory(capacity=4)
+        self.fill(history, [1, 2, 3, 4, 5, 6])
+
+        self.assertEqual(len(history), 4)
+        self.assertEqual(history.latest, 6)
+        self.assertEqual(list(history.values()), [3, 4, 5, 6])
+        self.assertEqual(list(history.values(2)), [5, 6])
+
+    def test_window_is_zero_copy(self):
+        history = MetricHistory(capacity=4)
+        self.fill(history, [1, 2, 3, 4, 5])
+
+        head, tail = history.window()
+        self.assertIsInstance(head, memoryview)
+        self.assertEqual(list(head) + list(tail), [2, 3, 4, 5])
+
+        # Views track the backing store rather than a snapshot
+        history.push(6, timestamp=10)
+        self.assertEqual(list(head), [6, 3, 4])
+
+    def test_resolution_averages_samples_in_slot(self):
+        history = MetricHistory(capacity=10, resolution=5)
+        for second, value in enumerate([10, 20, 30, 40, 50, 100]):
+            history.push(value, timestamp=second)
+
+        self.assertEqual(list(history.values()), [30, 100])
+
+    def test_summary_and_downsample(self):
+        history = MetricHistory(capacity=8)
+        self.fill(history, [1, 5, 2, 8, 3, 3])
+
+        self.assertEqual(history.summary(), (1, 8, 22 / 6))
+        self.assertEqual(history.summary(2), (3, 3, 3))
+        self.assertEqual(history.downsample(3, mode="max"), [5, 8, 3])
+        self.assertEqual(history.downsample(3, mode="min"), [1, 2, 3])
+        self.assertEqual(history.downsample(2, mode="avg"), [8 / 3, 14 / 3])
+        self.assertEqual(history.downsample(4, count=2), [3, 3])
+
+    def test_empty(self):
+        history = MetricHistory(capacity=3)
+        self.assertIsNone(history.latest)
+        self.assertIsNone(history.summary())
+        self.assertEqual(history.downsample(4), [])
+        self.assertEqual(list(history.values(5)), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+import os
+import socket
+import tempfile
+import threading
+import unittest
+
+from utils.hyprland_ipc import (
+    HyprlandCommandClient,
+    encode_batch,
+    split_batch_reply,
+)
+
+
+class FakeHyprland:
+    """Answers requests on a unix socket the way Hyprland does."""
+
+    def __init__(self, path: str, separator: bytes = b"\n\n\n"):
+        self.requests: list[bytes] = []
+        self.separator = separator
+        self.server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.server.bind(path)
+        self.server.listen()
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    def _serve(self):
+        while True:
+            try:
+                connection, _ = self.server.accept()
+            except OSError:
+                return
+            with connection:
+                request = connection.recv(65536)
+                self.requests.append(request)
+                connection.sendall(self._reply(request.decode()))
+
+    def _reply(self, request: str) -> bytes:
+        if not request.startswith("[[BATCH]]"):
+            return f"reply to {request}".encode()
+        commands = request.removeprefix("[[BATCH]]").split(";")
+        return b"".join(
+            f"reply to {command}".encode() + self.separator for command in commands
+        )
+
+    def close(self):
+        self.server.close()
+
+
+class BatchEncodingTest(unittest.TestCase):
+    """Test suite for the [[BATCH]] request format."""
+
+    def test_encode(self):
+        self.assertEqual(encode_batch(["j/monitors"]), b"j/monitors")
+        self.assertEqual(
+            encode_batch(["j/monitors", "j/clients"]),
+            b"[[BATCH]]j/monitors;j/clients",
+        )
+
+    def test_split(self):
+        self.assertEqual(split_batch_reply(b"ok", 1), [b"ok"])
+        self.assertEqual(split_batch_reply(b"a\n\n\nb\n\n\n", 2), [b"a", b"b"])
+        self.assertEqual(split_batch_reply(b"a\n\n\nb", 2), [b"a", b"b"])
+        self.assertIsNone(split_batch_reply(b"a\n\n\nb\n\n\nc", 2))
+
+
+class HyprlandCommandClientTest(unittest.TestCase):
+    """Test suite for the asynchronous command client."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, ".socket.sock")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_single_request(self):
+        server = FakeHyprland(self.path)
+        client = HyprlandCommandClient(path=self.path)
+        self.assertEqual(client.submit("j/monitors").result(2), b"reply to j/monitors")
+        client.close()
+        server.close()
+
+    def test_requests_sent_together_share_a_batch(self):
+        server = FakeHyprland(self.path)
+        client = HyprlandCommandClient(path=self.path, workers=1)
+        futures = client.submit_many(["j/monitors", "j/clients", "submap"])
+        self.assertEqual(
+            [future.result(2) for future in futures],
+            [b"reply to j/monitors", b"reply to j/clients", b"reply to submap"],
+        )
+        self.assertEqual(server.requests, [b"[[BATCH]]j/monitors;j/clients;submap"])
+        client.close()
+        server.close()
+
+    def test_commands_with_separators_go_alone(self):
+        server = FakeHyprland(self.path)
+        client = HyprlandCommandClient(path=self.path, workers=1)
+        futures = client.submit_many(["dispatch exec a; b", "j/clients"])
+        for future in futures:
+            future.result(2)
+        self.assertEqual(server.requests, [b"dispatch exec a; b", b"j/clients"])
+        client.close()
+        server.close()
+
+    def test_unexpected_batch_reply_falls_back(self):
+        server = FakeHyprland(self.path, separator=b"\n")
+        client = HyprlandCommandClient(path=self.path, workers=1)
+        futures = client.submit_many(["j/monitors", "j/clients"])
+        self.assertEqual(futures[1].result(2), b"reply to j/clients")
+        self.assertEqual(len(server.requests), 3)
+        client.close()
+        server.close()
+
+    def test_unreachable_socket(self):
+        client = HyprlandCommandClient(path=self.path)
+        with self.assertRaises(OSError):
+            client.submit("j/monitors").result(2)
+        client.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,153 @@
+import unittest
+
+from utils.hyprland_state import HyprlandState
+
+
+def make_state() -> HyprlandState:
+    state = HyprlandState()
+    state.seed(
+        monitors=[
+            {
+                "id": 0,
+                "name": "DP-1",
+                "focused": True,
+                "activeWorkspace": {"id": 1, "name": "1"},
+            },
+            {
+                "id": 1,
+                "name": "HDMI-A-1",
+                "focused": False,
+                "activeWorkspace": {"id": 2, "name": "2"},
+            },
+        ],
+        workspaces=[
+            {"id": 1, "name": "1", "monitor": "DP-1", "monitorID": 0, "windows": 1},
+            {"id": 2, "name": "2", "monitor": "HDMI-A-1", "monitorID": 1, "windows": 0},
+        ],
+        clients=[
+            {
+                "address": "0xaaa",
+                "mapped": True,
+                "at": [10, 10],
+                "size": [100, 100],
+                "workspace": {"id": 1, "name": "1"},
+                "monitor": 0,
+                "class": "foot",
+                "title": "foot",
+                "initialClass": "foot",
+            }
+        ],
+        devices={
+            "keyboards": [
+                {"name": "other", "main": False, "active_keymap": "French"},
+                {"name": "at-kbd", "main": True, "active_keymap": "English (US)"},
+            ]
+        },
+        active_window={"address": "0xaaa"},
+    )
+    return state
+
+
+class HyprlandStateTest(unittest.TestCase):
+    """Test suite for keeping the Hyprland model current from events."""
+
+    def test_seed(self):
+        state = make_state()
+        self.assertEqual(state.active_workspace["id"], 1)
+        self.assertEqual(state.active_window, "0xaaa")
+        self.assertEqual(state.main_keyboard["name"], "at-kbd")
+        self.assertEqual(state.window_count(1), 1)
+
+    def test_open_and_close_window(self):
+        state = make_state()
+        changed = state.apply("openwindow", "bbb,2,firefox,Mozilla, Firefox")
+        self.assertEqual(changed, {"clients", "workspaces"})
+
+        client = state.clients["0xbbb"]
+        self.assertEqual(client["title"], "Mozilla, Firefox")
+        self.assertEqual(client["monitor"], 1)
+        self.assertEqual(state.workspaces[2]["windows"], 1)
+        self.assertTrue(state.geometry_stale)
+
+        state.apply("closewindow", "bbb")
+        self.assertNotIn("0xbbb", state.clients)
+        self.assertEqual(state.workspaces[2]["windows"], 0)
+
+    def test_move_window(self):
+        state = make_state()
+        state.apply("movewindowv2", "aaa,2,2")
+        self.assertEqual(state.window_count(1), 0)
+        self.assertEqual(state.window_count(2), 1)
+        self.assertEqual(state.workspaces[2]["windows"], 1)
+        self.assertEqual(state.clients["0xaaa"]["monitor"], 1)
+
+    def test_active_workspace(self):
+        state = make_state()
+        self.assertEqual(state.apply("focusedmonv2", "HDMI-A-1,2"), {"active"})
+        self.assertEqual(state.active_workspace["id"], 2)
+
+        state.apply("workspacev2", "3,3")
+        self.assertEqual(state.active_workspace["id"], 3)
+        self.assertEqual(state.workspaces[3]["monitor"], "HDMI-A-1")
+
+        state.apply("destroyworkspacev2", "3,3")
+        self.assertNotIn(3, state.workspaces)
+
+    def test_fullscreen_applies_to_active_window(self):
+        state = make_state()
+        self.assertEqual(state.apply("fullscreen", "1"), {"clients"})
+        self.assertEqual(state.clients["0xaaa"]["fullscreen"], 1)
+        self.assertTrue(state.geometry_stale)
+
+    def test_monitor_removed_once(self):
+        state = make_state()
+        # Both versions arrive for one removal, v2 first
+        self.assertEqual(
+            state.apply("monitorremovedv2", "1,HDMI-A-1,Some Monitor"),
+            {"monitors", "active"},
+        )
+        self.assertEqual(state.apply("monitorremoved", "HDMI-A-1"), set())
+        self.assertNotIn("HDMI-A-1", state.monitors)
+        self.assertFalse(state.needs_resync)
+
+    def test_active_special(self):
+        state = make_state()
+        state.apply("createworkspacev2", "-98,special:magic")
+        self.assertEqual(state.apply("activespecial", "special:magic,DP-1"), {"active"})
+        self.assertEqual(
+            state.monitors["DP-1"]["specialWorkspace"],
+            {"id": -98, "name": "special:magic"},
+        )
+
+        state.apply("activespecial", ",DP-1")
+        self.assertEqual(
+            state.monitors["DP-1"]["specialWorkspace"], {"id": 0, "name": ""}
+        )
+        self.assertFalse(state.needs_resync)
+
+    def test_keyboard_layout(self):
+        state = make_state()
+        self.assertEqual(state.apply("activelayout", "at-kbd,German"), {"keyboard"})
+        self.assertEqual(state.main_keyboard["active_keymap"], "German")
+
+    def test_drift_requests_resync(self):
+        state = make_state()
+        self.assertEqual(state.apply("closewindow", "unknown"), set())
+        self.assertTrue(state.needs_resync)
+
+        state = make_state()
+        state.apply("movewindowv2", "garbage")
+        self.assertTrue(state.needs_resync)
+
+        state = make_state()
+        state.apply("configreloaded", "")
+        self.assertTrue(state.needs_resync)
+
+    def test_unknown_event_is_ignored(self):
+        state = make_state()
+        self.assertEqual(state.apply("urgent", "aaa"), set())
+        self.assertFalse(state.needs_resync)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import json
+import os
+import tempfile
+import unittest
+
+from utils.journal import JournalStore
+
+
+class JournalStoreTest(unittest.TestCase):
+    """Test suite for the snapshot and journal record store."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "notifications.json")
+        self.store = JournalStore(self.path, compact_min=4)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def reopen(self):
+        return JournalStore(self.path, compact_min=4).load()
+
+    def test_replays_journal_over_legacy_snapshot(self):
+        with open(self.path, "w") as f:
+            json.dump([{"id": 1}, {"id": 2}], f)
+        self.store.add({"id": 3})
+        self.store.remove(1)
+        self.assertEqual(self.reopen(), [{"id": 2}, {"id": 3}])
+
+        self.store.clear()
+        self.store.add({"id": 4})
+        self.assertEqual(self.reopen(), [{"id": 4}])
+
+    def test_writes_are_appends_until_compaction(self):
+        records = []
+        for record_id in range(1, 5):
+            records.append({"id": record_id})
+            self.store.add(records[-1])
+            self.store.compact_if_due(records)
+        self.assertFalse(os.path.exists(self.path))
+
+        records.pop(0)
+        self.store.remove(1)
+        self.store.compact_if_due(records)
+        self.assertTrue(os.path.exists(self.path))
+        self.assertFalse(os.path.exists(self.store.journal_path))
+        self.assertEqual(self.reopen(), records)
+
+    def test_replay_after_interrupted_compaction(self):
+        # The snapshot was replaced but the journal wasn't removed yet
+        self.store.add({"id": 1})
+        self.store.add({"id": 2})
+        self.store.remove(1)
+        with open(self.path, "w") as f:
+            json.dump([{"id": 2}], f)
+        self.assertEqual(self.reopen(), [{"id": 2}])
+
+    def test_damaged_line_is_skipped_and_compacted(self):
+        self.store.add({"id": 1})
+        with open(self.store.journal_path, "a") as f:
+            f.write('{"op": "add", "rec')
+        self.assertEqual(self.store.load(), [{"id": 1}])
+
+        self.store.add({"id": 2})
+        self.assertEqual(self.reopen(), [{"id": 1}, {"id": 2}])
+
+    def test_failed_append_is_logged_and_forces_compaction(self):
+        blocker = os.path.join(self.directory.name, "blocker")
+        open(blocker, "w").close()
+        store = JournalStore(os.path.join(blocker, "notifications.json"))
+        store.add({"id": 1})
+        self.assertEqual(store.pending, 0)
+        # The next compaction is due at once, here it fails the same way
+        with self.assertRaises(OSError):
+            store.compact_if_due([{"id": 1}])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+import unittest
+
+from utils.lru import SizedLRU
+
+
+class SizedLRUTest(unittest.TestCase):
+    """Test suite for the size-bounded LRU map."""
+
+    def test_evicts_least_recently_used(self):
+        cache = SizedLRU(100)
+        cache.put("a", "A", 40)
+        cache.put("b", "B", 40)
+        cache.get("a")
+        cache.put("c", "C", 40)
+
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertEqual(cache.size, 80)
+
+    def test_replacing_updates_size(self):
+        cache = SizedLRU(100)
+        cache.put("a", "A", 40)
+        cache.put("a", "A2", 10)
+        self.assertEqual(cache.size, 10)
+        self.assertEqual(cache.get("a"), "A2")
+
+    def test_oversized_value_is_not_kept(self):
+        cache = SizedLRU(100)
+        cache.put("a", "A", 40)
+        cache.put("big", "B", 200)
+        self.assertNotIn("big", cache)
+        self.assertIn("a", cache)
+
+    def test_get_or_load(self):
+        cache = SizedLRU(100)
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return "value"
+
+        self.assertEqual(cache.get_or_load("k", loader, len), "value")
+        self.assertEqual(cache.get_or_load("k", loader, len), "value")
+        self.assertEqual(len(calls), 1)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+        # Failed loads are not cached
+        self.assertIsNone(cache.get_or_load("none", lambda: None, len))
+        self.assertNotIn("none", cache)
+
+
+if __name__ == "__main__":
+    unittest.main()
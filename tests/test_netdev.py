@@ -0,0 +1,74 @@
+import os
+import tempfile
+import unittest
+
+from utils.netdev import NetDevRates, counter_delta
+
+HEADER = (
+    "Inter-|   Receive                            "
+    "                    |  Transmit\n"
+    " face |bytes    packets errs drop fifo frame compressed multicast"
+    "|bytes    packets errs drop fifo colls carrier compressed\n"
+)
+
+
+def net_dev_line(interface: str, received: int, transmitted: int) -> str:
+    return f"{interface:>6}: {received} 0 0 0 0 0 0 0 {transmitted} 0 0 0 0 0 0 0\n"
+
+
+class NetDevRatesTest(unittest.TestCase):
+    """Test suite for the /proc/net/dev rate engine."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        os.makedirs(os.path.join(self._tmp.name, "net"))
+        self.path = os.path.join(self._tmp.name, "net", "dev")
+
+        self.speed = NetDevRates(proc_root=self._tmp.name)
+
+    def tearDown(self):
+        self.speed.close()
+        self._tmp.cleanup()
+
+    def write(self, counters: dict[str, tuple[int, int]]):
+        with open(self.path, "w") as f:
+            f.write(HEADER)
+            for interface, (received, transmitted) in counters.items():
+                f.write(net_dev_line(interface, received, transmitted))
+
+    def test_per_interface_rates_use_elapsed_time(self):
+        self.write({"lo": (0, 0), "eth0": (1000, 500), "wlan0": (0, 0)})
+        self.speed.sample(now=10.0)
+
+        self.write({"lo": (10**9, 10**9), "eth0": (5000, 1500), "wlan0": (2000, 0)})
+        rates = self.speed.sample(now=12.0)
+
+        # Loopback is filtered, the rest is in bytes/ms over the 2s elapsed
+        self.assertEqual(sorted(rates), ["eth0", "wlan0"])
+        self.assertEqual(rates["eth0"], (2.0, 0.5))
+        self.assertEqual(rates["wlan0"], (1.0, 0.0))
+
+    def test_close_calls_reuse_sample(self):
+        self.write({"eth0": (0, 0)})
+        self.speed.sample(now=1.0)
+        self.write({"eth0": (1000, 0)})
+        first = self.speed.sample(now=2.0)
+        self.assertIs(self.speed.sample(now=2.1), first)
+
+    def test_smoothing(self):
+        self.speed.smoothing = 0.5
+        self.write({"eth0": (0, 0)})
+        self.speed.sample(now=0.0)
+        self.write({"eth0": (4000, 0)})
+        self.assertEqual(self.speed.sample(now=1.0)["eth0"].download, 2.0)
+        self.write({"eth0": (4000, 0)})
+        self.assertEqual(self.speed.sample(now=2.0)["eth0"].download, 1.0)
+
+    def test_counter_wrap_and_reset(self):
+        self.assertEqual(counter_delta(100, (1 << 32) - 50), 150)
+        self.assertEqual(counter_delta(10, 1 << 40), 0)
+        self.assertEqual(counter_delta(10, 1 << 31), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import unittest
+
+from utils.occlusion import OcclusionIndex, edge_region, monitor_rect
+
+
+class OcclusionIndexTest(unittest.TestCase):
+    """Test suite for in-memory occlusion queries."""
+
+    def setUp(self):
+        self.index = OcclusionIndex()
+        self.index.set_monitors(
+            [
+                {"name": "DP-1", "x": 0, "y": 0, "width": 1920, "height": 1080},
+                {
+                    "name": "DP-2",
+                    "x": 1920,
+                    "y": 0,
+                    "width": 2560,
+                    "height": 1440,
+                    "scale": 2,
+                    "transform": 1,
+                },
+            ]
+        )
+        self.index.set_clients(
+            [
+                {
+                    "workspace": {"id": 1},
+                    "at": [10, 40],
+                    "size": [900, 1030],
+                    "mapped": True,
+                },
+                {
+                    "workspace": {"id": 2},
+                    "at": [0, 0],
+                    "size": [1920, 1080],
+                    "mapped": True,
+                },
+                {
+                    "workspace": {"id": 1},
+                    "at": [0, 0],
+                    "size": [1920, 1080],
+                    "mapped": False,
+                },
+            ]
+        )
+
+    def test_monitor_rect(self):
+        self.assertEqual(self.index.monitors["DP-1"], (0, 0, 1920, 1080))
+        # Scaled and rotated
+        self.assertEqual(self.index.monitors["DP-2"], (1920, 0, 2640, 1280))
+        self.assertEqual(monitor_rect({}), (0, 0, 1920, 1080))
+
+    def test_edge_region(self):
+        bounds = (0, 0, 1920, 1080)
+        self.assertEqual(edge_region("top", 30, bounds), (0, 0, 1920, 30))
+        self.assertEqual(edge_region("bottom", 30, bounds), (0, 1050, 1920, 1080))
+        self.assertEqual(edge_region("right", 30, bounds), (1890, 0, 1920, 1080))
+        self.assertEqual(
+            edge_region("bottom", 80, bounds, 400), (760, 1000, 1160, 1080)
+        )
+        with self.assertRaises(ValueError):
+            edge_region("middle", 30, bounds)
+
+    def test_region_is_monitor_relative(self):
+        self.assertEqual(
+            self.index.region((10, 20, 100, 50), "DP-2"), (1930, 20, 2030, 70)
+        )
+        self.assertIsNone(self.index.region(("top", 30), "HDMI-A-1"))
+        self.assertIsNone(self.index.region((1, 2, 3), "DP-1"))
+
+    def test_overlap(self):
+        top = self.index.region(("top", 30), "DP-1")
+        self.assertFalse(self.index.occluded(1, top))
+        bottom = self.index.region(("bottom", 30), "DP-1")
+        self.assertTrue(self.index.occluded(1, bottom))
+        # Clear of the window on the right half
+        dock = self.index.region(("bottom", 30, 200), "DP-1")
+        self.assertTrue(self.index.occluded(1, dock))
+        self.assertFalse(self.index.occluded(1, (1000, 1050, 1200, 1080)))
+        self.assertFalse(self.index.occluded(3, bottom))
+
+    def test_full_cover(self):
+        top = self.index.region(("top", 1), "DP-1")
+        self.assertFalse(self.index.occluded(1, top, full=True))
+        self.assertTrue(self.index.occluded(2, top, full=True))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+
+from utils.polling import PollingPolicy
+
+
+class PollingPolicyTest(unittest.TestCase):
+    """Test suite for scaling poll intervals from the shell state."""
+
+    def test_multipliers_stack(self):
+        policy = PollingPolicy(idle_multiplier=4, battery_multiplier=2)
+        self.assertEqual(policy.interval(1000), 1000)
+
+        self.assertTrue(policy.set("battery", True))
+        self.assertEqual(policy.interval(1000), 2000)
+        self.assertTrue(policy.set("idle", True))
+        self.assertEqual(policy.interval(1000), 8000)
+
+        self.assertTrue(policy.set("battery", False))
+        self.assertEqual(policy.interval(1000), 4000)
+
+    def test_suspending_conditions(self):
+        policy = PollingPolicy()
+        self.assertTrue(policy.set("hidden", True))
+        self.assertIsNone(policy.interval(1000))
+        # Already suspended, nothing for pollers to do
+        self.assertFalse(policy.set("locked", True))
+
+        self.assertFalse(policy.set("hidden", False))
+        self.assertTrue(policy.set("locked", False))
+        self.assertEqual(policy.interval(1000), 1000)
+
+    def test_unchanged_condition(self):
+        policy = PollingPolicy()
+        self.assertFalse(policy.set("idle", False))
+        policy.set("idle", True)
+        self.assertFalse(policy.set("idle", True))
+
+    def test_disabled(self):
+        policy = PollingPolicy(enabled=False)
+        policy.set("hidden", True)
+        policy.set("battery", True)
+        self.assertFalse(policy.suspended)
+        self.assertEqual(policy.interval(1000), 1000)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import os
+import tempfile
+import unittest
+
+from utils.procfs import ProcStatsReader
+
+MEMINFO = """MemTotal:        1000000 kB
+MemFree:          200000 kB
+MemAvailable:     250000 kB
+Buffers:           10000 kB
+Cached:           300000 kB
+"""
+
+
+class ProcStatsReaderTest(unittest.TestCase):
+    """Test suite for the /proc and /sys metrics reader."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = self._tmp.name
+        self.proc = os.path.join(self.root, "proc")
+        self.sys = os.path.join(self.root, "sys")
+        os.makedirs(self.proc)
+
+        self.write("proc/stat", "cpu  100 0 100 800 0 0 0 0 0 0\ncpu0 1 2 3 4\n")
+        self.write("proc/meminfo", MEMINFO)
+
+        for policy, freq in (("policy0", 1000000), ("policy1", 3000000)):
+            self.write(
+                f"sys/devices/system/cpu/cpufreq/{policy}/scaling_cur_freq", f"{freq}\n"
+            )
+            self.write(
+                f"sys/devices/system/cpu/cpufreq/{policy}/cpuinfo_min_freq", "400000\n"
+            )
+            self.write(
+                f"sys/devices/system/cpu/cpufreq/{policy}/cpuinfo_max_freq", "5000000\n"
+            )
+
+        self.reader = ProcStatsReader(proc_root=self.proc, sys_root=self.sys)
+
+    def tearDown(self):
+        self.reader.close()
+        self._tmp.cleanup()
+
+    def write(self, relative_path: str, content: str):
+        # Rewrite in place so the reader's open descriptors see the change
+        path = os.path.join(self.root, relative_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "r+" if os.path.exists(path) else "w") as f:
+            f.write(content)
+            f.truncate()
+
+    def test_cpu_percent(self):
+        # First call has no baseline, like psutil
+        self.assertEqual(self.reader.cpu_percent(), 0.0)
+
+        # 100 busy jiffies out of 400 elapsed
+        self.write("proc/stat", "cpu  150 0 150 1100 0 0 0 0 0 0\n")
+        self.assertEqual(self.reader.cpu_percent(), 25.0)
+
+        # iowait counts as idle time
+        self.write("proc/stat", "cpu  150 0 150 1100 100 0 0 0 0 0\n")
+        self.assertEqual(self.reader.cpu_percent(), 0.0)
+
+    def test_virtual_memory(self):
+        memory = self.reader.virtual_memory()
+        self.assertEqual(memory.total, 1000000 * 1024)
+        self.assertEqual(memory.available, 250000 * 1024)
+        # total - available, as psutil >= 6 defines it
+        self.assertEqual(memory.used, 750000 * 1024)
+        self.assertEqual(memory.percent, 75.0)
+
+    def test_virtual_memory_without_memavailable(self):
+        self.write("proc/meminfo", "MemTotal: 1000 kB\nMemFree: 500 kB\n")
+        self.assertEqual(self.reader.virtual_memory().percent, 50.0)
+
+    def test_cpu_freq(self):
+        self.assertTrue(self.reader.has_cpu_freq)
+        frequency = self.reader.cpu_freq()
+        self.assertEqual(frequency.current, 2000.0)
+        self.assertEqual(frequency.min, 400.0)
+        self.assertEqual(frequency.max, 5000.0)
+
+    def test_missing_proc_raises(self):
+        with self.assertRaises(OSError):
+            ProcStatsReader(proc_root=os.path.join(self.root, "missing"))
+
+
+if __name__ == "__main__":
+    unittest.main()
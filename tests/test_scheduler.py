@@ -0,0 +1,79 @@
+import unittest
+
+from utils.scheduler import TickSchedule
+
+
+class TickScheduleTest(unittest.TestCase):
+    """Test suite for coalescing and aligning scheduler deadlines."""
+
+    def callback(self):
+        pass
+
+    def test_aligned_tasks_fire_on_boundaries(self):
+        schedule = TickSchedule()
+        clock = schedule.add(1000, self.callback, now=100.4, align="second")
+        minute = schedule.add(60000, self.callback, now=100.4, align="minute")
+
+        self.assertEqual(clock.deadline, 101)
+        self.assertEqual(minute.deadline, 120)
+        self.assertEqual(schedule.next_wakeup(), 101)
+
+        self.assertEqual(schedule.pop_due(101.002), [clock])
+        self.assertEqual(clock.deadline, 102)
+
+    def test_nearby_deadlines_share_a_wakeup(self):
+        schedule = TickSchedule()
+        first = schedule.add(10000, self.callback, now=0.0)
+        second = schedule.add(10000, self.callback, now=0.5)
+
+        # The first task may run a second late, by then both are due
+        self.assertEqual(schedule.next_wakeup(), 11.0)
+        self.assertEqual(schedule.pop_due(11.0), [first, second])
+        self.assertEqual(first.deadline, 20.0)
+
+    def test_lone_task_keeps_its_period(self):
+        schedule = TickSchedule()
+        task = schedule.add(1000, self.callback, now=0.0)
+
+        fired = []
+        for _ in range(5):
+            now = schedule.next_wakeup()
+            self.assertEqual(schedule.pop_due(now), [task])
+            fired.append(round(now, 6))
+        # Late by the slack each time, but the lateness does not add up
+        self.assertEqual(fired, [1.1, 2.1, 3.1, 4.1, 5.1])
+
+    def test_missed_deadlines_are_skipped(self):
+        schedule = TickSchedule()
+        task = schedule.add(1000, self.callback, now=0.0)
+
+        # A single run after a long gap, then back on the original beat
+        self.assertEqual(schedule.pop_due(7.5), [task])
+        self.assertEqual(task.deadline, 8.0)
+        self.assertEqual(schedule.pop_due(7.9), [])
+
+    def test_scale_stretches_only_unaligned_tasks(self):
+        schedule = TickSchedule()
+        poll = schedule.add(1000, self.callback, now=0.0, scale=4)
+        clock = schedule.add(1000, self.callback, now=0.0, align="second", scale=4)
+
+        self.assertEqual(poll.deadline, 4.0)
+        self.assertEqual(clock.deadline, 1.0)
+
+    def test_clock_going_backwards(self):
+        schedule = TickSchedule()
+        task = schedule.add(5000, self.callback, now=1000.0)
+
+        self.assertEqual(schedule.pop_due(10.0), [])
+        self.assertEqual(task.deadline, 15.0)
+
+    def test_remove(self):
+        schedule = TickSchedule()
+        task = schedule.add(1000, self.callback, now=0.0)
+        schedule.remove(task.id)
+        self.assertIsNone(schedule.next_wakeup())
+        self.assertEqual(len(schedule), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from utils.sensors import TemperatureSensor
+
+
+class TemperatureSensorTest(unittest.TestCase):
+    """Test suite for resolving and reading hwmon temperature inputs."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.hwmon = os.path.join(self._tmp.name, "hwmon")
+        self.thermal = os.path.join(self._tmp.name, "thermal")
+        os.makedirs(self.thermal)
+
+        self.add_device("hwmon0", "acpitz", {"temp1_input": "27800"})
+        self.add_device(
+            "hwmon1",
+            "k10temp",
+            {"temp1_input": "41000", "temp2_input": "45500", "temp10_input": "1"},
+        )
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def add_device(self, device: str, name: str, inputs: dict[str, str]):
+        path = os.path.join(self.hwmon, device)
+        os.makedirs(path, exist_ok=True)
+        with open(os.path.join(path, "name"), "w") as f:
+            f.write(f"{name}\n")
+        for filename, value in inputs.items():
+            with open(os.path.join(path, filename), "w") as f:
+                f.write(f"{value}\n")
+
+    def sensor(self, name: str) -> TemperatureSensor:
+        return TemperatureSensor(name, hwmon_root=self.hwmon, thermal_root=self.thermal)
+
+    def test_resolves_last_input_of_named_device(self):
+        sensor = self.sensor("k10temp")
+        # psutil orders by "tempN", so temp2 sorts after temp10
+        self.assertTrue(sensor.path.endswith("hwmon1/temp2_input"))
+        self.assertEqual(sensor.read(), 45.5)
+
+    def test_reads_updated_value_from_same_file(self):
+        sensor = self.sensor("acpitz")
+        self.assertEqual(sensor.read(), 27.8)
+        with open(sensor.path, "r+") as f:
+            f.write("30000\n")
+            f.truncate()
+        self.assertEqual(sensor.read(), 30.0)
+
+    def test_unknown_sensor(self):
+        sensor = self.sensor("nvme")
+        self.assertIsNone(sensor.path)
+        self.assertIsNone(sensor.read())
+
+    def test_hotplug_rescans(self):
+        sensor = self.sensor("nvme")
+        sensor.RESCAN_INTERVAL = 0
+
+        self.add_device("hwmon2", "nvme", {"temp1_input": "38000"})
+        self.assertEqual(sensor.read(), 38.0)
+
+        # Device unplugged and re-enumerated under another hwmon index
+        shutil.rmtree(os.path.join(self.hwmon, "hwmon2"))
+        self.add_device("hwmon3", "nvme", {"temp1_input": "39000"})
+        # A removed sysfs file fails on read; an empty read stands in for that
+        sensor.close()
+        sensor._fd = os.open(os.devnull, os.O_RDONLY)
+        self.assertEqual(sensor.read(), 39.0)
+        self.assertTrue(sensor.path.endswith("hwmon3/temp1_input"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+import unittest
+
+from utils.substring_index import SubstringIndex
+
+
+class SubstringIndexTest(unittest.TestCase):
+    """Test suite for the trigram substring index."""
+
+    def setUp(self):
+        self.index = SubstringIndex(
+            [
+                ("Firefox", "Firefox Web Browser", None, "firefox", "firefox %u"),
+                ("Visual Studio Code", None, "Code", "/usr/bin/code", "code %F"),
+                ("Foot", "Foot Server", "foot", "foot", "foot --server"),
+            ]
+        )
+
+    def test_matches_like_a_scan(self):
+        documents = list(self.index.fields)
+        for query in ["fire", "code", "SERVER", "oo", "o", "bin/co", "xyz", "web b"]:
+            expected = next(
+                (
+                    number
+                    for number, fields in enumerate(documents)
+                    if any(query.lower() in field for field in fields)
+                ),
+                None,
+            )
+            self.assertEqual(self.index.find(query), expected, query)
+
+    def test_first_document_wins(self):
+        self.assertEqual(self.index.find("o"), 0)
+        self.assertEqual(self.index.find("foot"), 2)
+
+    def test_results_are_memoized(self):
+        self.assertEqual(self.index.find("studio"), 1)
+        self.index.fields[1] = ()
+        self.assertEqual(self.index.find("studio"), 1)
+        self.assertIsNone(self.index.find("missing"))
+        self.assertIn("missing", self.index._memo)
+
+
+if __name__ == "__main__":
+    unittest.main()
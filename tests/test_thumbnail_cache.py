@@ -0,0 +1,50 @@
+import os
+import tempfile
+import unittest
+
+from utils.thumbnail_cache import ThumbnailCache
+
+
+class ThumbnailCacheTest(unittest.TestCase):
+    """Test suite for the size-bounded thumbnail cache."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = ThumbnailCache(self.directory.name, max_bytes=25)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_key_follows_content(self):
+        self.assertEqual(ThumbnailCache.key("1", "png"), ThumbnailCache.key("1", "png"))
+        self.assertNotEqual(
+            ThumbnailCache.key("1", "png"), ThumbnailCache.key("1", "jpg")
+        )
+
+    def test_put_and_get(self):
+        self.assertIsNone(self.cache.get("a"))
+        path = self.cache.put("a", b"0123456789")
+        self.assertEqual(self.cache.get("a"), path)
+        with open(path, "rb") as f:
+            self.assertEqual(f.read(), b"0123456789")
+
+    def test_evicts_least_recently_used(self):
+        for key in "abc":
+            os.utime(self.cache.put(key, b"0123456789"), (0, 0))
+        self.assertIsNone(self.cache.get("a"))
+
+        self.cache.get("b")
+        self.cache.put("d", b"0123456789")
+        self.assertIsNone(self.cache.get("c"))
+        self.assertIsNotNone(self.cache.get("b"))
+        self.assertLessEqual(self.cache.size, 25)
+
+    def test_reads_existing_directory(self):
+        self.cache.put("a", b"0123456789")
+        cache = ThumbnailCache(self.directory.name, max_bytes=25)
+        self.assertIsNotNone(cache.get("a"))
+        self.assertEqual(cache.size, 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
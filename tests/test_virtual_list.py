@@ -0,0 +1,49 @@
+import unittest
+
+from utils.virtual_list import RowOffsets, move_selection, row_count
+
+
+class RowOffsetsTest(unittest.TestCase):
+    """Test suite for the row geometry of virtualized lists."""
+
+    def setUp(self):
+        self.offsets = RowOffsets([20, 20, 80, 20, 20])
+
+    def test_positions(self):
+        self.assertEqual(self.offsets.total, 160)
+        self.assertEqual(self.offsets.top(3), 120)
+        self.assertEqual(self.offsets.row_at(0), 0)
+        self.assertEqual(self.offsets.row_at(119), 2)
+        self.assertEqual(self.offsets.row_at(500), 4)
+
+    def test_visible_rows(self):
+        self.assertEqual(self.offsets.visible(0, 40), range(0, 2))
+        self.assertEqual(self.offsets.visible(30, 40), range(1, 3))
+        self.assertEqual(self.offsets.visible(30, 40, overscan=1), range(0, 4))
+        self.assertEqual(RowOffsets([]).visible(0, 40), range(0))
+
+    def test_scroll_to(self):
+        # Already visible, above and below the page
+        self.assertEqual(self.offsets.scroll_to(1, 0, 60), 0)
+        self.assertEqual(self.offsets.scroll_to(0, 30, 60), 0)
+        self.assertEqual(self.offsets.scroll_to(2, 0, 60), 60)
+
+
+class MoveSelectionTest(unittest.TestCase):
+    """Test suite for keyboard selection in a grid."""
+
+    def test_grid_moves(self):
+        # 3 columns, 8 items: rows [0 1 2] [3 4 5] [6 7]
+        self.assertEqual(row_count(8, 3), 3)
+        self.assertEqual(move_selection(-1, 8, 3, 0, 1), 0)
+        self.assertEqual(move_selection(-1, 8, 3, 0, -1), 7)
+        self.assertEqual(move_selection(2, 8, 3, 1, 0), 3)
+        self.assertEqual(move_selection(4, 8, 3, 0, 1), 7)
+        self.assertEqual(move_selection(5, 8, 3, 0, 1), 7)
+        self.assertEqual(move_selection(1, 8, 3, 0, -1), 1)
+        self.assertEqual(move_selection(0, 8, 3, -1, 0), 0)
+        self.assertEqual(move_selection(0, 0, 3, 0, 1), -1)
+
+
+if __name__ == "__main__":
+    unittest.main()
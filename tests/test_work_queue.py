@@ -0,0 +1,57 @@
+import unittest
+
+from utils.work_queue import WorkQueue
+
+
+class WorkQueueTest(unittest.TestCase):
+    """Test suite for the bounded, cancellable work queue."""
+
+    def setUp(self):
+        # Drain loops are run by hand to control what runs when
+        self.drains = []
+        self.queue = WorkQueue(workers=2, submit=self.drains.append)
+        self.results = []
+
+    def add(self, key):
+        self.queue.submit(key, lambda: key * 10, self.results.append)
+
+    def test_bounded_drains_run_newest_first(self):
+        for key in range(1, 5):
+            self.add(key)
+        self.assertEqual(len(self.drains), 2)
+
+        self.drains.pop()()
+        self.assertEqual(self.results, [40, 30, 20, 10])
+        self.assertEqual(len(self.queue), 0)
+
+    def test_cancel_pending_and_running(self):
+        self.add(1)
+        self.add(2)
+        self.queue.cancel(1)
+        self.drains.pop()()
+        self.assertEqual(self.results, [20])
+
+        def job():
+            self.queue.cancel(3)
+            return 30
+
+        self.queue.submit(3, job, self.results.append)
+        self.drains.pop()()
+        self.assertEqual(self.results, [20])
+
+    def test_duplicate_keys_run_once_with_latest_callback(self):
+        stale = []
+        self.queue.submit(1, lambda: 10, stale.append)
+        self.add(1)
+        self.drains.pop()()
+        self.assertEqual((stale, self.results), ([], [10]))
+
+    def test_failing_job_skips_callback(self):
+        self.queue.submit(1, lambda: 1 / 0, self.results.append)
+        self.add(2)
+        self.drains.pop()()
+        self.assertEqual(self.results, [20])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,90 @@
-from fabric.utils.helpers import get_desktop_applications
+import os
+
+from gi.repository import Gio, GLib, Gtk
+from loguru import logger
+
+from .app_catalogue import AppCatalogue
+from .colors import Colors
+from .constants import APP_CATALOGUE_FILE
+from .substring_index import SubstringIndex
+from .thread import thread
+
+
+def _parse_desktop_file(path: str) -> dict | None:
+    """The fields of a desktop file the bar uses, None if it isn't listed."""
+    try:
+        app_info = Gio.DesktopAppInfo.new_from_filename(path)
+    except (TypeError, GLib.Error):
+        return None
+    if app_info is None or not app_info.should_show():
+        return None
+    icon = app_info.get_icon()
+    return {
+        "name": app_info.get_name(),
+        "generic_name": app_info.get_generic_name(),
+        "display_name": app_info.get_display_name(),
+        "description": app_info.get_description(),
+        "window_class": app_info.get_startup_wm_class(),
+        "executable": app_info.get_executable(),
+        "command_line": app_info.get_commandline(),
+        "icon_name": icon.to_string() if icon is not None else None,
+    }
+
+
+class CatalogueApp:
+    """A desktop application served from the catalogue snapshot.
+
+    Exposes the same fields as fabric's `DesktopApp`; the desktop file is
+    only opened again when the app is launched or has no themed icon.
+    """
+
+    def __init__(self, path: str, fields: dict):
+        self.path = path
+        self.name = fields.get("name")
+        self.generic_name = fields.get("generic_name")
+        self.display_name = fields.get("display_name")
+        self.description = fields.get("description")
+        self.window_class = fields.get("window_class")
+        self.executable = fields.get("executable")
+        self.command_line = fields.get("command_line")
+        self.icon_name = fields.get("icon_name")
+        self._app_info = None
+
+    @property
+    def app_info(self) -> Gio.DesktopAppInfo | None:
+        if self._app_info is None:
+            try:
+                self._app_info = Gio.DesktopAppInfo.new_from_filename(self.path)
+            except TypeError:
+                return None
+        return self._app_info
+
+    def launch(self):
+        if self.app_info is None:
+            logger.warning(
+                f"{Colors.WARNING}[AppUtils] {self.path} can no longer be launched"
+            )
+            return False
+        return self.app_info.launch([], None)
+
+    def get_icon_pixbuf(
+        self,
+        size: int = 48,
+        default_icon: str | None = "image-missing",
+        flags: Gtk.IconLookupFlags = Gtk.IconLookupFlags.FORCE_SIZE,
+    ):
+        theme = Gtk.IconTheme.get_default()
+        icon = self.app_info.get_icon() if self.app_info else None
+        try:
+            if icon is not None:
+                icon_info = theme.lookup_by_gicon(icon, size, flags)
+                if icon_info is not None:
+                    return icon_info.load_icon()
+            if default_icon:
+                return theme.load_icon(default_icon, size, flags)
+        except GLib.Error:
+            pass
+        return None
 
 
 class AppUtils:
@@ -12,24 +98,95 @@ class AppUtils:
         return cls._instance
 
     def __init__(self):
-        self._all_applications = get_desktop_applications()
+        if getattr(self, "_initialized", False):
+            return
+        self._initialized = True
+
+        self._stale = False
+        data_dirs = [GLib.get_user_data_dir(), *GLib.get_system_data_dirs()]
+        self._catalogue = AppCatalogue(
+            APP_CATALOGUE_FILE,
+            [os.path.join(data_dir, "applications") for data_dir in data_dirs],
+            _parse_desktop_file,
+            # Both change what the parsed entries say
+            context=" ".join(
+                (GLib.get_language_names()[0], os.getenv("XDG_CURRENT_DESKTOP", ""))
+            ),
+        )
+
+        # Serve the snapshot right away and check it against the disk later
+        if self._catalogue.load():
+            self._load()
+            thread(self._validate)
+        else:
+            self._update()
+
+        # GIO watches every applications directory, rescan only when it says so
+        self._app_monitor = Gio.AppInfoMonitor.get()
+        self._app_monitor.connect("changed", self._on_applications_changed)
+
+    def _load(self):
+        self._all_applications = [
+            CatalogueApp(path, fields) for path, fields in self._catalogue.apps()
+        ]
         self._app_identifiers = self.build_app_identifiers_map()
+        self._partial_index = SubstringIndex(
+            (
+                app.name,
+                app.display_name,
+                app.window_class,
+                app.executable,
+                app.command_line,
+            )
+            for app in self._all_applications
+        )
+
+    def _save(self):
+        try:
+            self._catalogue.save()
+        except OSError as e:
+            logger.warning(
+                f"{Colors.WARNING}[AppUtils] Failed to save the app catalogue: {e}"
+            )
+
+    def _update(self) -> bool:
+        changed = self._catalogue.update()
+        if changed:
+            self._load()
+            self._save()
+        return changed
+
+    def _validate(self):
+        if self._catalogue.update():
+            self._save()
+            GLib.idle_add(self._on_validated)
+
+    def _on_validated(self):
+        logger.debug("[AppUtils] Desktop applications changed since the snapshot")
+        self._load()
+        return False
+
+    def _on_applications_changed(self, *_):
+        self._stale = True
 
     @property
     def all_applications(self):
         """Return all desktop applications."""
+        self.refresh()
         return self._all_applications
 
     @property
     def app_identifiers(self):
         """Return the mapping of app identifiers to DesktopApp objects."""
+        self.refresh()
         return self._app_identifiers
 
-    def refresh(self):
-        """Return all desktop applications, optionally refreshing the list."""
-        self._all_applications = get_desktop_applications()
-        self._app_identifiers = self.build_app_identifiers_map()
-        return True
+    def refresh(self, force: bool = False):
+        """Re-parse the desktop files that changed since the last scan."""
+        if not (self._stale or force):
+            return False
+        self._stale = False
+        return self._update()
 
     def _normalize_window_class(self, class_name):
         """Normalize window class by removing common suffixes and lowercase."""
@@ -104,25 +261,11 @@ class AppUtils:
         """Find app by identifier or partial match."""
         if not key_value:
             return None
+        self.refresh()
         normalized_id = str(key_value).lower()
         if normalized_id in self._app_identifiers:
             return self._app_identifiers[normalized_id]
 
-        # Fallback partial matching
-        return next(
-            (
-                app
-                for app in self._all_applications
-                if any(
-                    normalized_id in (getattr(app, attr) or "").lower()
-                    for attr in [
-                        "name",
-                        "display_name",
-                        "window_class",
-                        "executable",
-                        "command_line",
-                    ]
-                )
-            ),
-            None,
-        )
+        # Fallback partial matching, memoized until the catalogue changes
+        found = self._partial_index.find(normalized_id)
+        return self._all_applications[found] if found is not None else None
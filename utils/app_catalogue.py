@@ -0,0 +1,131 @@
+import json
+import os
+import threading
+from typing import Callable
+
+CATALOGUE_VERSION = 1
+
+# The fields of fabric's DesktopApp that the bar reads
+APP_FIELDS = (
+    "name",
+    "generic_name",
+    "display_name",
+    "description",
+    "window_class",
+    "executable",
+    "command_line",
+    "icon_name",
+)
+
+
+def scan_applications(directories: list[str]) -> dict[str, tuple[str, int]]:
+    """Map desktop ids to the (path, mtime) of the file that provides them.
+
+    Directories are given in XDG order and the first file for an id wins,
+    the same way GIO resolves `kde4/foo.desktop` into `kde4-foo.desktop`.
+    """
+    found: dict[str, tuple[str, int]] = {}
+    for directory in directories:
+        for root, _, names in os.walk(directory):
+            for name in names:
+                if not name.endswith(".desktop"):
+                    continue
+                path = os.path.join(root, name)
+                desktop_id = os.path.relpath(path, directory).replace(os.sep, "-")
+                if desktop_id in found:
+                    continue
+                try:
+                    found[desktop_id] = (path, os.stat(path).st_mtime_ns)
+                except OSError:
+                    continue
+    return found
+
+
+class AppCatalogue:
+    """Parsed desktop applications, persisted between sessions.
+
+    Entries are keyed by desktop file path and remember its mtime, so an
+    update only hands new or modified files to `parse`. `parse` returns a
+    dict of `APP_FIELDS`, or None for files that shouldn't be listed; both
+    outcomes are remembered. The snapshot is dropped when `context` (locale
+    and desktop, say) differs from the one it was written with.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        directories: list[str],
+        parse: Callable[[str], dict | None],
+        context: str = "",
+    ):
+        self.path = path
+        self.directories = directories
+        self.parse = parse
+        self.context = context
+        self.parsed = 0
+        # desktop id -> {"path", "mtime", "app"}, in listing order
+        self.entries: dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def load(self) -> bool:
+        """Read the snapshot from disk, returns whether there was a usable one."""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != CATALOGUE_VERSION
+            or data.get("context") != self.context
+            or not isinstance(data.get("entries"), dict)
+        ):
+            return False
+        self.entries = data["entries"]
+        return True
+
+    def save(self):
+        """Write the snapshot, safe to call from several threads at once."""
+        # Held so two writers don't interleave in the temporary file
+        with self._lock:
+            data = {
+                "version": CATALOGUE_VERSION,
+                "context": self.context,
+                "entries": self.entries,
+            }
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(temp_path, self.path)
+
+    def update(self) -> bool:
+        """Re-parse what changed on disk, returns whether anything did.
+
+        Safe to call from a worker thread, the entries are swapped at once.
+        """
+        with self._lock:
+            entries = {}
+            changed = False
+            for desktop_id, (path, mtime) in scan_applications(
+                self.directories
+            ).items():
+                entry = self.entries.get(desktop_id)
+                if entry is None or entry["path"] != path or entry["mtime"] != mtime:
+                    entry = {"path": path, "mtime": mtime, "app": self.parse(path)}
+                    self.parsed += 1
+                    changed = True
+                entries[desktop_id] = entry
+
+            if changed or entries.keys() != self.entries.keys():
+                self.entries = entries
+                return True
+            return False
+
+    def apps(self) -> list[tuple[str, dict]]:
+        """(path, fields) of every listed application."""
+        return [
+            (entry["path"], entry["app"])
+            for entry in self.entries.values()
+            if entry["app"] is not None
+        ]
@@ -0,0 +1,140 @@
+import math
+import time
+from collections.abc import Callable, Iterable
+from typing import Generic, TypeVar
+
+from .frecency import FrecencyStore
+
+T = TypeVar("T")
+
+FRECENCY_WEIGHT = 10.0
+
+EXACT_BONUS = 100.0
+PREFIX_BONUS = 50.0
+BOUNDARY_BONUS = 8.0
+CONSECUTIVE_BONUS = 4.0
+GAP_PENALTY = 0.2
+
+# Earlier fields count for more, a display name hit beats a generic name hit
+FIELD_WEIGHTS = (1.0, 0.9, 0.6)
+
+
+def normalize(text: str | None) -> str:
+    return " ".join((text or "").lower().split())
+
+
+def word_starts(text: str) -> frozenset[int]:
+    return frozenset(
+        i for i, char in enumerate(text) if i == 0 or not text[i - 1].isalnum()
+    )
+
+
+def fuzzy_score(query: str, text: str, starts: frozenset[int]) -> float | None:
+    """Score `query` as a subsequence of `text`, None if it isn't one.
+
+    A plain substring scores highest, more so at the start of the text or of
+    a word. Otherwise characters are matched left to right, with bonuses for
+    word starts and runs of consecutive characters and a penalty for the
+    gaps between them.
+    """
+    if not query:
+        return 0.0
+
+    position = text.find(query)
+    if position == 0:
+        return EXACT_BONUS + PREFIX_BONUS - len(text) * GAP_PENALTY
+    if position > 0:
+        bonus = BOUNDARY_BONUS * len(query) if position in starts else 0.0
+        return EXACT_BONUS + bonus - position * GAP_PENALTY
+
+    score = 0.0
+    previous = -1
+    for char in query:
+        found = text.find(char, previous + 1)
+        if found < 0:
+            return None
+        score += 1.0
+        if found in starts:
+            score += BOUNDARY_BONUS
+        if found == previous + 1:
+            score += CONSECUTIVE_BONUS
+        elif previous >= 0:
+            score -= (found - previous - 1) * GAP_PENALTY
+        previous = found
+    return score
+
+
+class _Candidate:
+    __slots__ = ("fields", "item", "key", "name", "starts")
+
+    def __init__(self, item, key: str, fields: Iterable[str | None]):
+        self.item = item
+        self.key = key
+        self.fields = tuple(normalize(field) for field in fields)
+        self.starts = tuple(word_starts(field) for field in self.fields)
+        self.name = self.fields[0] if self.fields else ""
+
+
+class AppSearchEngine(Generic[T]):
+    """Ranks items against a query by fuzzy score and frecency.
+
+    Fields are normalized once in `set_items`. When a query extends the
+    previous one, only the previous matches are scored again, since a
+    longer query can never match an item the shorter one didn't.
+    """
+
+    def __init__(
+        self,
+        key: Callable[[T], str],
+        fields: Callable[[T], Iterable[str | None]],
+        frecency: FrecencyStore | None = None,
+    ):
+        self.key = key
+        self.fields = fields
+        self.frecency = frecency or FrecencyStore()
+        self.candidates: list[_Candidate] = []
+        self._last_query: str | None = None
+        self._last_matches: list[_Candidate] = []
+
+    def set_items(self, items: Iterable[T]):
+        self.candidates = [
+            _Candidate(item, self.key(item), self.fields(item)) for item in items
+        ]
+        self._last_query = None
+        self._last_matches = []
+
+    def record_use(self, item: T):
+        self.frecency.record(self.key(item))
+
+    def _score(self, query: str, candidate: _Candidate) -> float | None:
+        best = None
+        for field, starts, weight in zip(
+            candidate.fields, candidate.starts, FIELD_WEIGHTS
+        ):
+            score = fuzzy_score(query, field, starts)
+            if score is not None and (best is None or score * weight > best):
+                best = score * weight
+        return best
+
+    def search(self, query: str, limit: int | None = None) -> list[T]:
+        query = normalize(query)
+        now = time.time()
+
+        if self._last_query and query.startswith(self._last_query):
+            pool = self._last_matches
+        else:
+            pool = self.candidates
+
+        ranked = []
+        for candidate in pool:
+            score = self._score(query, candidate)
+            if score is None:
+                continue
+            frecency = self.frecency.score(candidate.key, now)
+            ranked.append((score + FRECENCY_WEIGHT * math.log1p(frecency), candidate))
+        ranked.sort(key=lambda entry: (-entry[0], entry[1].name))
+
+        self._last_query = query
+        self._last_matches = [candidate for _, candidate in ranked]
+        results = self._last_matches if limit is None else self._last_matches[:limit]
+        return [candidate.item for candidate in results]
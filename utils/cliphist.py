@@ -0,0 +1,224 @@
+import os
+import re
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator
+from typing import NamedTuple
+from urllib.parse import unquote, urlparse
+
+# Rows delivered before the rest of the history, about a panel's worth
+FIRST_CHUNK_SIZE = 16
+CHUNK_SIZE = 256
+
+IMAGE_EXTENSIONS = ("jpg", "jpeg", "png", "bmp", "gif")
+IMG_TAG = re.compile(r"^\s*<img\s+")
+
+
+class ClipEntry(NamedTuple):
+    """One line of `cliphist list`: its id, preview text and kind of content."""
+
+    id: str
+    preview: str
+    kind: str  # "image", "file" or "text"
+    lowered: str  # The preview lowered once, for searching
+
+
+def file_path(content: str) -> str:
+    return unquote(urlparse(content).path)
+
+
+def is_file_image(content: str) -> bool:
+    return content.startswith("file:///") and content.endswith(
+        tuple(f".{extension}" for extension in IMAGE_EXTENSIONS)
+    )
+
+
+def is_image_data(content: str) -> bool:
+    """Determine if clipboard content is likely an image"""
+    lowered = content.lower()
+    return (
+        content.startswith("data:image/")
+        or content.startswith("\x89PNG")
+        or content.startswith("GIF8")
+        or content.startswith("\xff\xd8\xff")  # JPEG
+        or IMG_TAG.match(content) is not None  # HTML image tag
+        or (
+            "binary" in lowered
+            and any(extension in lowered for extension in IMAGE_EXTENSIONS)
+        )
+    )
+
+
+def classify(content: str) -> str:
+    if is_image_data(content):
+        return "image"
+    if is_file_image(content) and os.path.exists(file_path(content)):
+        return "file"
+    return "text"
+
+
+def parse_line(line: str) -> ClipEntry | None:
+    line = line.rstrip("\n")
+    if not line or "<meta http-equiv" in line:
+        return None
+    parts = line.split("\t", 1)
+    item_id = parts[0] if len(parts) > 1 else "0"
+    content = parts[1] if len(parts) > 1 else line
+    return ClipEntry(item_id, content, classify(content), content.lower())
+
+
+def slot_text(entry: ClipEntry) -> tuple[str, str]:
+    """The label and tooltip showing an entry in the menu."""
+    if entry.kind == "image":
+        return "[Image]", "Image in clipboard"
+    if entry.kind == "file":
+        return "[File]", "File in clipboard"
+    # Truncate content for display
+    text = entry.preview.strip()
+    if len(text) > 100:
+        text = text[:97] + "..."
+    return text, text
+
+
+def read_entries(
+    lines: Iterable[bytes | str],
+    first_chunk: int = FIRST_CHUNK_SIZE,
+    chunk_size: int = CHUNK_SIZE,
+) -> Iterator[list[ClipEntry]]:
+    """Parse `cliphist list` output as it arrives, in chunks of entries.
+
+    The first chunk is small so the visible rows can be shown right away.
+    """
+    chunk: list[ClipEntry] = []
+    limit = first_chunk
+    for line in lines:
+        if isinstance(line, bytes):
+            line = line.decode("utf-8", errors="replace")
+        entry = parse_line(line)
+        if entry is None:
+            continue
+        chunk.append(entry)
+        if len(chunk) >= limit:
+            yield chunk
+            chunk = []
+            limit = chunk_size
+    if chunk:
+        yield chunk
+
+
+def db_path() -> str:
+    """Where cliphist keeps its database, following its own defaults."""
+    if path := os.environ.get("CLIPHIST_DB_PATH"):
+        return path
+    cache = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(cache, "cliphist", "db")
+
+
+def _order(entry: ClipEntry) -> int:
+    # cliphist ids grow with every copy, the newest entry comes first
+    return -int(entry.id) if entry.id.isdigit() else 0
+
+
+class ClipHistory:
+    """Clipboard entries newest first, kept in step with cliphist by deltas.
+
+    A fresh listing is diffed by id against the entries already known, and
+    only the entries that appeared or disappeared are inserted or removed.
+    `version` changes with every insertion or removal.
+    """
+
+    def __init__(self):
+        self.version = 0
+        self.entries: list[ClipEntry] = []
+        self._keys: list[int] = []
+        self._by_id: dict[str, ClipEntry] = {}
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, item_id: str) -> bool:
+        return item_id in self._by_id
+
+    def add(self, entries: Iterable[ClipEntry]) -> list[ClipEntry]:
+        """Insert new entries in order, returning the ones not known yet."""
+        added = []
+        for entry in entries:
+            if entry.id in self._by_id:
+                continue
+            key = _order(entry)
+            position = bisect_right(self._keys, key)
+            self._keys.insert(position, key)
+            self.entries.insert(position, entry)
+            self._by_id[entry.id] = entry
+            added.append(entry)
+        if added:
+            self.version += 1
+        return added
+
+    def remove(self, item_ids: Iterable[str]) -> list[ClipEntry]:
+        """Drop entries by id, returning the ones that were known."""
+        removed = [
+            self._by_id.pop(item_id) for item_id in item_ids if item_id in self._by_id
+        ]
+        if removed:
+            kept = [
+                (key, entry)
+                for key, entry in zip(self._keys, self.entries, strict=True)
+                if entry.id in self._by_id
+            ]
+            self._keys = [key for key, _ in kept]
+            self.entries = [entry for _, entry in kept]
+            self.version += 1
+        return removed
+
+    def clear(self) -> list[ClipEntry]:
+        removed = self.entries
+        self.entries, self._keys, self._by_id = [], [], {}
+        self.version += 1
+        return removed
+
+    def apply(
+        self, listing: list[ClipEntry]
+    ) -> tuple[list[ClipEntry], list[ClipEntry]]:
+        """Bring the entries in line with a full listing: (added, removed)."""
+        listed = {entry.id for entry in listing}
+        removed = self.remove(
+            [item_id for item_id in self._by_id if item_id not in listed]
+        )
+        return self.add(listing), removed
+
+    def ends_with(self, entries: list[ClipEntry]) -> bool:
+        """Whether `entries` are the last ones, as when an older page arrives."""
+        return (
+            bool(entries)
+            and self.entries[len(self.entries) - len(entries) :] == entries
+        )
+
+
+class ClipSearch:
+    """Substring search over a history, narrowing its last result.
+
+    While the query only grows, and the history hasn't changed, the entries
+    matching the previous query are the only ones that can still match.
+    """
+
+    def __init__(self, history: ClipHistory):
+        self.history = history
+        self._query = ""
+        self._version = -1
+        self._matches: list[ClipEntry] = []
+
+    def search(self, query: str) -> list[ClipEntry]:
+        query = query.lower()
+        if not query:
+            return list(self.history.entries)
+
+        if self._version == self.history.version and query.startswith(self._query):
+            if query == self._query:
+                return self._matches
+            candidates = self._matches
+        else:
+            candidates = self.history.entries
+        self._matches = [entry for entry in candidates if query in entry.lowered]
+        self._query = query
+        self._version = self.history.version
+        return self._matches
@@ -20,6 +20,11 @@ NOTIFICATION_CACHE_FILE = f"{APP_DATA_DIRECTORY}/notifications.json"
 WEATHER_CACHE_FILE = f"{APP_DATA_DIRECTORY}/weather.json"
 QUOTES_CACHE_FILE = f"{APP_DATA_DIRECTORY}/quotes.json"
 ICON_CACHE_FILE = f"{APP_DATA_DIRECTORY}/icons.json"
+APP_CATALOGUE_FILE = f"{APP_DATA_DIRECTORY}/applications.json"
+APP_FRECENCY_FILE = f"{APP_DATA_DIRECTORY}/app_frecency.json"
+EMOJI_INDEX_FILE = f"{APP_DATA_DIRECTORY}/emoji.index"
+EMOJI_USAGE_FILE = f"{APP_DATA_DIRECTORY}/emoji_usage.json"
+CLIPBOARD_THUMBNAIL_DIRECTORY = f"{APP_DATA_DIRECTORY}/clipboard_thumbnails"
 PINNED_APPS_FILE = f"{APP_DATA_DIRECTORY}/pinned_apps.json"
 
 WALLPAPER_DIR = f"{HOME_DIR}/Pictures/Wallpapers"
@@ -112,6 +117,7 @@ DEFAULT_CONFIG = {
             "sensor": "",
             "mode": "circular",
             "graph_length": 4,
+            "interval": 1000,
         },
         "gpu": {
             "show_icon": True,
@@ -119,6 +125,7 @@ DEFAULT_CONFIG = {
             "tooltip": True,
             "mode": "circular",
             "graph_length": 4,
+            "interval": 1000,
         },
         "date_time": {
             "format": "%b %d %H:%M",
@@ -191,6 +198,7 @@ DEFAULT_CONFIG = {
             "mode": "circular",
             "graph_length": 4,
             "unit": "gb",
+            "interval": 1000,
         },
         "network_usage": {
             "upload_icon": "",
@@ -202,6 +210,7 @@ DEFAULT_CONFIG = {
             "download_threshold": 1024,
             "kb_digits": 0,
             "mb_digits": 2,
+            "smoothing": 0.0,
         },
         "microphone": {
             "label": False,
@@ -261,6 +270,7 @@ DEFAULT_CONFIG = {
             "tooltip": True,
             "graph_length": 4,
             "unit": "gb",  # Default unit for storage
+            "interval": 5000,  # disk usage moves slowly
         },
         "submap": {
             "icon": "󰌌",
@@ -393,6 +403,7 @@ DEFAULT_CONFIG = {
             "tooltip": False,
             "layer": "top",
             "show_when_no_windows": False,
+            "intellihide": False,
             "preview_apps": True,  # this is to enable the preview of apps in the dock
             "preview_size": [
                 200,
@@ -414,6 +425,11 @@ DEFAULT_CONFIG = {
         "monitor_styles": True,
         "location": "top",
         "auto_reload": True,
+        "history_duration": 10800,  # seconds of stats history kept in memory
+        "history_resolution": 1,  # seconds per history point
+        "adaptive_polling": True,
+        "idle_polling_multiplier": 4,
+        "battery_polling_multiplier": 2,
     },
 }
 
@@ -0,0 +1,162 @@
+import os
+import re
+
+TOKEN_SEPARATORS = re.compile(r"[-._\s/]+")
+
+
+def tokenize(text: str | None) -> list[str]:
+    if not text:
+        return []
+    return [token for token in TOKEN_SEPARATORS.split(text.lower()) if token]
+
+
+def normalize_id(app_id: str) -> str:
+    return "".join(app_id.lower().split())
+
+
+def exec_basename(command: str | None) -> str | None:
+    """Name of the program an `Exec` line runs, skipping `env VAR=...`."""
+    for word in (command or "").split():
+        if word == "env" or "=" in word:
+            continue
+        return os.path.basename(word.strip("\"'"))
+    return None
+
+
+def parse_desktop_entry(path: str) -> dict[str, str]:
+    """Unlocalized keys of the [Desktop Entry] group of a .desktop file."""
+    entry = {}
+    in_group = False
+    try:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            for line in f:
+                line = line.strip()
+                if line.startswith("["):
+                    if in_group:
+                        break
+                    in_group = line == "[Desktop Entry]"
+                elif in_group and "=" in line and not line.startswith("#"):
+                    key, value = line.split("=", 1)
+                    key = key.strip()
+                    if "[" not in key:
+                        entry.setdefault(key, value.strip())
+    except OSError:
+        return {}
+    return entry
+
+
+class DesktopFile:
+    """What the index keeps of one parsed .desktop file."""
+
+    __slots__ = ("icon", "path", "priority", "stem", "tokens", "wm_class")
+
+    def __init__(self, path: str, priority: int, entry: dict[str, str]):
+        self.path = path
+        self.priority = priority
+        self.stem = os.path.basename(path).removesuffix(".desktop").lower()
+        self.icon = entry.get("Icon", "").strip() or None
+        self.wm_class = entry.get("StartupWMClass", "").lower() or None
+
+        self.tokens = set(tokenize(self.stem))
+        self.tokens.update(tokenize(self.wm_class))
+        self.tokens.update(tokenize(exec_basename(entry.get("Exec"))))
+        self.tokens.update(tokenize(entry.get("Name")))
+
+
+class DesktopFileIndex:
+    """Inverted index from name tokens to the .desktop files that mention them.
+
+    Each file contributes the tokens of its file name, `StartupWMClass`,
+    `Exec` program and `Name`. Lookups cost one dictionary probe per token
+    of the app id. Directories are given in XDG order, so a user's file
+    shadows a system one with the same name.
+    """
+
+    def __init__(self, directories: list[str] | None = None):
+        self.directories: list[str] = []
+        self.files: dict[str, DesktopFile] = {}
+        self.tokens: dict[str, set[str]] = {}
+        # Lower-cased stem and WM class, both exact-match shortcuts
+        self.names: dict[str, set[str]] = {}
+
+        if directories:
+            self.scan(directories)
+
+    def scan(self, directories: list[str]):
+        self.directories = list(directories)
+        self.files.clear()
+        self.tokens.clear()
+        self.names.clear()
+        for directory in self.directories:
+            try:
+                names = os.listdir(directory)
+            except OSError:
+                continue
+            for name in names:
+                if name.endswith(".desktop"):
+                    self.add(os.path.join(directory, name))
+
+    def _priority(self, path: str) -> int:
+        directory = os.path.dirname(path)
+        if directory in self.directories:
+            return self.directories.index(directory)
+        return len(self.directories)
+
+    def add(self, path: str):
+        """Index or re-index one file."""
+        self.remove(path)
+        entry = parse_desktop_entry(path)
+        if not entry or entry.get("Hidden", "").lower() == "true":
+            return
+
+        desktop_file = DesktopFile(path, self._priority(path), entry)
+        self.files[path] = desktop_file
+        for token in desktop_file.tokens:
+            self.tokens.setdefault(token, set()).add(path)
+        for name in filter(None, (desktop_file.stem, desktop_file.wm_class)):
+            self.names.setdefault(name, set()).add(path)
+
+    def remove(self, path: str):
+        desktop_file = self.files.pop(path, None)
+        if desktop_file is None:
+            return
+        for token in desktop_file.tokens:
+            self._discard(self.tokens, token, path)
+        for name in filter(None, (desktop_file.stem, desktop_file.wm_class)):
+            self._discard(self.names, name, path)
+
+    @staticmethod
+    def _discard(index: dict[str, set[str]], key: str, path: str):
+        paths = index.get(key)
+        if paths is not None:
+            paths.discard(path)
+            if not paths:
+                del index[key]
+
+    def _best(self, paths) -> DesktopFile | None:
+        return min(
+            (self.files[path] for path in paths),
+            key=lambda desktop_file: (desktop_file.priority, desktop_file.path),
+            default=None,
+        )
+
+    def lookup(self, app_id: str) -> DesktopFile | None:
+        """The .desktop file that best matches a window's app id."""
+        if not app_id:
+            return None
+
+        # An exact file name or WM class wins outright
+        normalized = normalize_id(app_id)
+        if paths := self.names.get(normalized):
+            return self._best(paths)
+
+        # Otherwise the file sharing the most tokens with the app id
+        scores: dict[str, int] = {}
+        for token in set(tokenize(app_id)):
+            for path in self.tokens.get(token, ()):
+                scores[path] = scores.get(path, 0) + 1
+        if not scores:
+            return None
+
+        top = max(scores.values())
+        return self._best(path for path, score in scores.items() if score == top)
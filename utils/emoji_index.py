@@ -0,0 +1,141 @@
+import contextlib
+import hashlib
+import json
+import marshal
+import os
+import re
+from array import array
+from bisect import bisect_left
+
+INDEX_MAGIC = b"TSKEMJ01"
+# Prefix lookups remembered while typing, cleared past this many
+PREFIX_MEMO_SIZE = 512
+TOKEN_SEPARATORS = re.compile(r"[^\w]+")
+
+
+def tokenize(text: str) -> list[str]:
+    return [token for token in TOKEN_SEPARATORS.split(text.casefold()) if token]
+
+
+class EmojiIndex:
+    """Emoji names and groups with a prefix index over their words.
+
+    Every word of an emoji's name and group is casefolded and kept in a
+    sorted token list, each token with the packed ids of the emoji using
+    it. A query matches the emoji that have, for each of its words, a token
+    starting with it. The whole index is snapshotted with `marshal`, keyed
+    by the hash of the JSON it was built from.
+    """
+
+    def __init__(
+        self,
+        chars: list[str],
+        names: list[str],
+        groups: list[str],
+        tokens: list[str],
+        postings: list[bytes],
+    ):
+        self.chars = chars
+        self.names = names
+        self.groups = groups
+        self.tokens = tokens
+        self.postings = postings
+        self._prefixes: dict[str, frozenset[int]] = {}
+        self._ids: dict[str, int] | None = None
+
+    def __len__(self) -> int:
+        return len(self.chars)
+
+    @classmethod
+    def from_emoji_data(cls, data: dict[str, dict]) -> "EmojiIndex":
+        chars, names, groups = [], [], []
+        token_ids: dict[str, list[int]] = {}
+        for emoji_id, (char, info) in enumerate(data.items()):
+            name = info.get("name", "")
+            group = info.get("group", "")
+            chars.append(char)
+            names.append(name)
+            groups.append(group)
+            for token in dict.fromkeys(tokenize(f"{name} {group}")):
+                token_ids.setdefault(token, []).append(emoji_id)
+
+        tokens = sorted(token_ids)
+        postings = [array("H", token_ids[token]).tobytes() for token in tokens]
+        return cls(chars, names, groups, tokens, postings)
+
+    @classmethod
+    def load(cls, json_path: str, index_path: str | None = None) -> "EmojiIndex":
+        """Read the snapshot for this JSON file, or build and save one."""
+        with open(json_path, "rb") as f:
+            raw = f.read()
+        digest = hashlib.sha256(raw).digest()
+
+        if index_path:
+            index = cls._read_snapshot(index_path, digest)
+            if index is not None:
+                return index
+
+        index = cls.from_emoji_data(json.loads(raw))
+        if index_path:
+            with contextlib.suppress(OSError):
+                index.save(index_path, digest)
+        return index
+
+    @classmethod
+    def _read_snapshot(cls, path: str, digest: bytes) -> "EmojiIndex | None":
+        try:
+            with open(path, "rb") as f:
+                if f.read(len(INDEX_MAGIC)) != INDEX_MAGIC or f.read(32) != digest:
+                    return None
+                payload = marshal.load(f)
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        try:
+            return cls(*payload)
+        except TypeError:
+            return None
+
+    def save(self, path: str, digest: bytes):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(INDEX_MAGIC)
+            f.write(digest)
+            marshal.dump(
+                (self.chars, self.names, self.groups, self.tokens, self.postings), f
+            )
+        os.replace(temp_path, path)
+
+    def find(self, emoji_char: str) -> int | None:
+        """Id of an emoji character, None if the index doesn't have it."""
+        if self._ids is None:
+            self._ids = {char: emoji_id for emoji_id, char in enumerate(self.chars)}
+        return self._ids.get(emoji_char)
+
+    def _ids_for_prefix(self, prefix: str) -> frozenset[int]:
+        ids = self._prefixes.get(prefix)
+        if ids is None:
+            start = bisect_left(self.tokens, prefix)
+            end = bisect_left(self.tokens, prefix + "\U0010ffff", start)
+            found = set()
+            for posting in self.postings[start:end]:
+                found.update(array("H", posting))
+            if len(self._prefixes) >= PREFIX_MEMO_SIZE:
+                self._prefixes.clear()
+            ids = self._prefixes[prefix] = frozenset(found)
+        return ids
+
+    def search(self, query: str) -> list[int]:
+        """Ids of the emoji matching every word of `query`, in file order."""
+        words = tokenize(query)
+        if not words:
+            return list(range(len(self.chars)))
+
+        # Shortest posting set first keeps the intersection cheap
+        sets = sorted((self._ids_for_prefix(word) for word in words), key=len)
+        found = set(sets[0])
+        for ids in sets[1:]:
+            found &= ids
+            if not found:
+                break
+        return sorted(found)
@@ -0,0 +1,65 @@
+import atexit
+
+from gi.repository import GLib
+from loguru import logger
+
+from .colors import Colors
+from .constants import EMOJI_USAGE_FILE
+from .frecency import FrecencyStore
+
+# Enough for the emoji anyone actually reuses
+EMOJI_USAGE_CAPACITY = 64
+EMOJI_USAGE_SAVE_DELAY = 5  # seconds
+EMOJI_USAGE_HALF_LIFE = 14 * 24 * 3600
+
+
+class EmojiUsage:
+    """Shared record of picked emoji, saved a moment after the last pick."""
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if getattr(self, "_initialized", False):
+            return
+        self._initialized = True
+
+        self.store = FrecencyStore(
+            EMOJI_USAGE_FILE,
+            half_life=EMOJI_USAGE_HALF_LIFE,
+            capacity=EMOJI_USAGE_CAPACITY,
+        )
+        self._save_id = 0
+        # Picks still waiting for the delayed save would be lost on exit
+        atexit.register(self.flush)
+
+    def record(self, emoji_char: str):
+        self.store.record(emoji_char)
+        # Picking several emoji in a row ends up as a single write
+        if self._save_id:
+            GLib.source_remove(self._save_id)
+        self._save_id = GLib.timeout_add_seconds(EMOJI_USAGE_SAVE_DELAY, self._save)
+
+    def flush(self):
+        """Save now if picks are waiting for the delayed save."""
+        if self._save_id:
+            GLib.source_remove(self._save_id)
+            self._save()
+
+    def _save(self):
+        self._save_id = 0
+        try:
+            self.store.save()
+        except OSError as e:
+            logger.warning(f"{Colors.WARNING}[EmojiUsage] Failed to save usage: {e}")
+        return False
+
+    def score(self, emoji_char: str) -> float:
+        return self.store.score(emoji_char)
+
+    def frequent(self, count: int) -> list[str]:
+        return self.store.top(count)
@@ -0,0 +1,86 @@
+import json
+import math
+import os
+import time
+
+# Uses lose half their weight every week
+FRECENCY_HALF_LIFE = 7 * 24 * 3600
+
+
+class FrecencyStore:
+    """Use counts that decay over time, persisted as JSON.
+
+    Each key keeps a score and the time it was last updated; the score
+    halves every `half_life` seconds and grows by one per use. With a
+    `capacity`, the lowest scoring key is forgotten when a new one would
+    go past it. The file is read on first use.
+    """
+
+    def __init__(
+        self,
+        path: str | None = None,
+        half_life: float = FRECENCY_HALF_LIFE,
+        capacity: int | None = None,
+    ):
+        self.path = path
+        self.decay = math.log(2) / half_life
+        self.capacity = capacity
+        self.entries: dict[str, tuple[float, float]] = {}
+        self.dirty = False
+        self._loaded = False
+
+    def load(self):
+        self._loaded = True
+        if not self.path:
+            return
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict):
+            self.entries = {
+                key: (float(value[0]), float(value[1]))
+                for key, value in data.items()
+                if isinstance(value, list) and len(value) == 2
+            }
+
+    def _ensure_loaded(self):
+        if not self._loaded:
+            self.load()
+
+    def save(self):
+        if not self.path or not self.dirty:
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump({key: list(value) for key, value in self.entries.items()}, f)
+        os.replace(temp_path, self.path)
+        self.dirty = False
+
+    def score(self, key: str, now: float | None = None) -> float:
+        self._ensure_loaded()
+        entry = self.entries.get(key)
+        if entry is None:
+            return 0.0
+        score, updated = entry
+        now = time.time() if now is None else now
+        return score * math.exp(-self.decay * max(0.0, now - updated))
+
+    def record(self, key: str, now: float | None = None):
+        now = time.time() if now is None else now
+        self.entries[key] = (self.score(key, now) + 1.0, now)
+        if self.capacity is not None and len(self.entries) > self.capacity:
+            coldest = min(
+                (entry for entry in self.entries if entry != key),
+                key=lambda entry: self.score(entry, now),
+            )
+            del self.entries[coldest]
+        self.dirty = True
+
+    def top(self, count: int, now: float | None = None) -> list[str]:
+        """The `count` highest scoring keys, best first."""
+        self._ensure_loaded()
+        now = time.time() if now is None else now
+        return sorted(self.entries, key=lambda key: -self.score(key, now))[:count]
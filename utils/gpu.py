@@ -0,0 +1,302 @@
+import contextlib
+import glob
+import json
+import os
+import re
+import shutil
+import subprocess
+import threading
+import time
+
+from loguru import logger
+
+GPU_VENDORS = {
+    "0x1002": "AMD",
+    "0x8086": "Intel",
+    "0x10de": "NVIDIA",
+}
+
+
+def empty_sample(name: str = "N/A") -> dict:
+    """Return a GPU sample with every metric unknown."""
+    return {
+        "name": name,
+        "usage": None,  # percent
+        "memory_used": None,  # bytes
+        "memory_total": None,  # bytes
+        "temperature": None,  # celsius
+        "frequency": None,  # MHz
+    }
+
+
+def _leading_number(value: str | None) -> float | None:
+    if not value:
+        return None
+    match = re.match(r"\s*([0-9]+(?:\.[0-9]+)?)", value)
+    return float(match.group(1)) if match else None
+
+
+class SysfsGpuCard:
+    """One DRM card whose counters are read straight from sysfs.
+
+    Counter files are opened once and re-read with `preadv`, so a sample costs
+    a few syscalls and never forks.
+    """
+
+    def __init__(self, card_path: str):
+        self.card_path = card_path
+        self.device_path = f"{card_path}/device"
+        self.card = os.path.basename(card_path)
+
+        self.vendor = GPU_VENDORS.get(self._read_text("vendor"), "GPU")
+        try:
+            self.driver = os.path.basename(os.readlink(f"{self.device_path}/driver"))
+        except OSError:
+            self.driver = ""
+        self.name = self._read_text("product_name") or " ".join(
+            filter(None, (self.vendor, self.driver, self.card))
+        )
+
+        self._buffer = bytearray(4096)
+        self._fds: dict[str, int] = {}
+
+        hwmon = sorted(glob.glob(f"{self.device_path}/hwmon/hwmon*"))
+        hwmon_path = hwmon[0] if hwmon else None
+
+        candidates = {
+            # amdgpu
+            "usage": [f"{self.device_path}/gpu_busy_percent"],
+            "memory_used": [f"{self.device_path}/mem_info_vram_used"],
+            "memory_total": [f"{self.device_path}/mem_info_vram_total"],
+            # hwmon freq1_input is the shader clock in Hz on amdgpu
+            "frequency_hz": [f"{hwmon_path}/freq1_input"] if hwmon_path else [],
+            "frequency_dpm": [f"{self.device_path}/pp_dpm_sclk"],
+            # i915 / xe
+            "frequency_mhz": [
+                f"{card_path}/gt_act_freq_mhz",
+                f"{card_path}/gt/gt0/rps_act_freq_mhz",
+                f"{self.device_path}/tile0/gt0/freq0/act_freq",
+            ],
+            "temperature": [f"{hwmon_path}/temp1_input"] if hwmon_path else [],
+        }
+
+        for metric, paths in candidates.items():
+            for path in paths:
+                with contextlib.suppress(OSError):
+                    self._fds[metric] = os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+                    break
+
+        # The total never changes, read it once
+        self._memory_total = self._read_int("memory_total")
+
+    @property
+    def has_counters(self) -> bool:
+        return bool(self._fds.keys() - {"memory_total"})
+
+    @property
+    def has_usage(self) -> bool:
+        return "usage" in self._fds
+
+    def _read_text(self, name: str) -> str | None:
+        try:
+            with open(f"{self.device_path}/{name}") as f:
+                return f.read().strip() or None
+        except OSError:
+            return None
+
+    def _read_raw(self, metric: str) -> str | None:
+        fd = self._fds.get(metric)
+        if fd is None:
+            return None
+        try:
+            size = os.preadv(fd, [self._buffer], 0)
+        except OSError:
+            return None
+        return self._buffer[:size].decode(errors="ignore")
+
+    def _read_int(self, metric: str) -> int | None:
+        value = self._read_raw(metric)
+        try:
+            return int(value) if value is not None else None
+        except ValueError:
+            return None
+
+    def _read_frequency(self) -> float | None:
+        if (hz := self._read_int("frequency_hz")) is not None:
+            return hz / 1_000_000
+        if (mhz := self._read_int("frequency_mhz")) is not None:
+            return float(mhz)
+        # "0: 500Mhz\n1: 1800Mhz *\n", the active level is starred
+        dpm = self._read_raw("frequency_dpm")
+        for line in (dpm or "").splitlines():
+            if line.rstrip().endswith("*"):
+                return _leading_number(line.split(":", 1)[-1])
+        return None
+
+    def sample(self) -> dict:
+        sample = empty_sample(self.name)
+
+        if (usage := self._read_int("usage")) is not None:
+            sample["usage"] = float(usage)
+        sample["memory_used"] = self._read_int("memory_used")
+        sample["memory_total"] = self._memory_total
+        if (temperature := self._read_int("temperature")) is not None:
+            sample["temperature"] = temperature / 1000
+        sample["frequency"] = self._read_frequency()
+
+        return sample
+
+    def close(self):
+        for fd in self._fds.values():
+            with contextlib.suppress(OSError):
+                os.close(fd)
+        self._fds.clear()
+
+
+def find_sysfs_cards(drm_root: str = "/sys/class/drm") -> list[SysfsGpuCard]:
+    """Return the DRM cards exposing counters we can read without a helper."""
+    cards = []
+    for card_path in sorted(glob.glob(f"{drm_root}/card[0-9]*")):
+        # Skip connectors such as card0-DP-1
+        if not re.fullmatch(r"card[0-9]+", os.path.basename(card_path)):
+            continue
+        card = SysfsGpuCard(card_path)
+        if card.has_counters:
+            cards.append(card)
+        else:
+            card.close()
+    return cards
+
+
+class NvidiaSmiReader:
+    """Keep one `nvidia-smi` running in loop mode and remember its last line.
+
+    The proprietary driver exposes nothing useful in sysfs, so instead of
+    forking a tool every tick a single long-lived helper streams samples.
+    A helper that dies is restarted with a growing delay, and given up on
+    after `MAX_RESTARTS` attempts in a row without a sample.
+    """
+
+    QUERY = "name,utilization.gpu,memory.used,memory.total,temperature.gpu,clocks.gr"
+    # Seconds to wait for the first line when probing the helper
+    STARTUP_TIMEOUT = 5
+    MAX_RESTARTS = 5
+    MAX_BACKOFF = 60
+
+    def __init__(self, interval: int = 1000):
+        self.interval = interval
+        self._process: subprocess.Popen | None = None
+        self._latest = empty_sample()
+        self._lock = threading.Lock()
+        # Set once the current helper printed a sample or exited
+        self._settled = threading.Event()
+        self._ready = False
+        self._restarts = 0
+        self._retry_at = 0.0
+
+    @staticmethod
+    def available() -> bool:
+        return shutil.which("nvidia-smi") is not None
+
+    def start(self):
+        if self._process is not None and self._process.poll() is None:
+            return
+        self._settled.clear()
+        self._process = subprocess.Popen(
+            [
+                "nvidia-smi",
+                # Only the primary GPU, so each line is a complete sample
+                "--id=0",
+                f"--query-gpu={self.QUERY}",
+                "--format=csv,noheader,nounits",
+                f"-lms={self.interval}",
+            ],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            stdin=subprocess.DEVNULL,
+            text=True,
+        )
+        threading.Thread(
+            target=self._read_stream,
+            args=(self._process,),
+            name="nvidia-smi",
+            daemon=True,
+        ).start()
+
+    def wait_ready(self, timeout: float = STARTUP_TIMEOUT) -> bool:
+        """Whether the helper printed a sample, e.g. false without a driver."""
+        self._settled.wait(timeout)
+        return self._ready
+
+    def _read_stream(self, process: subprocess.Popen):
+        for line in process.stdout:
+            fields = [field.strip() for field in line.split(",")]
+            if len(fields) != 6:
+                continue
+            with self._lock:
+                self._latest = self.parse(fields)
+                self._restarts = 0
+            self._ready = True
+            self._settled.set()
+
+        code = process.wait()
+        with self._lock:
+            # Don't keep showing the last sample of a dead helper
+            self._latest = empty_sample()
+            self._restarts += 1
+            delay = min(self.interval / 1000 * 2**self._restarts, self.MAX_BACKOFF)
+            self._retry_at = time.monotonic() + delay
+        self._settled.set()
+        logger.warning(f"[GPU] nvidia-smi exited with {code}")
+
+    @staticmethod
+    def parse(fields: list[str]) -> dict:
+        name, usage, memory_used, memory_total, temperature, clock = fields
+        mib = 1024 * 1024
+        sample = empty_sample(name)
+        sample["usage"] = _leading_number(usage)
+        sample["memory_used"] = (
+            int(value * mib)
+            if (value := _leading_number(memory_used)) is not None
+            else None
+        )
+        sample["memory_total"] = (
+            int(value * mib)
+            if (value := _leading_number(memory_total)) is not None
+            else None
+        )
+        sample["temperature"] = _leading_number(temperature)
+        sample["frequency"] = _leading_number(clock)
+        return sample
+
+    def sample(self) -> dict:
+        process = self._process
+        if process is not None and process.poll() is not None:
+            # Restart a helper that died, e.g. after a driver reload
+            with self._lock:
+                restarts, retry_at = self._restarts, self._retry_at
+            if restarts > self.MAX_RESTARTS:
+                logger.warning("[GPU] nvidia-smi keeps exiting, giving up on it")
+                self._process = None
+            elif time.monotonic() >= retry_at:
+                self.start()
+        with self._lock:
+            return dict(self._latest)
+
+    def close(self):
+        if self._process is not None and self._process.poll() is None:
+            self._process.terminate()
+        self._process = None
+
+
+def parse_nvtop_snapshot(output: str) -> dict:
+    """Convert `nvtop -s` json output to a GPU sample."""
+    stats = json.loads(output.strip("\n"))
+    if isinstance(stats, list):
+        stats = stats[0] if stats else {}
+
+    sample = empty_sample(stats.get("device_name", "N/A"))
+    sample["usage"] = _leading_number(stats.get("gpu_util"))
+    sample["temperature"] = _leading_number(stats.get("temp"))
+    sample["frequency"] = _leading_number(stats.get("gpu_clock"))
+    return sample
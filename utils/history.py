@@ -0,0 +1,146 @@
+import math
+import time
+from array import array
+from itertools import chain, islice
+from typing import Iterator, Literal
+
+Reducer = Literal["min", "max", "avg"]
+
+
+class MetricHistory:
+    """Fixed-capacity ring buffer of float samples for one metric.
+
+    Samples that land in the same `resolution` slot are averaged into a single
+    point, so `capacity * resolution` seconds of history always fit in the same
+    `array("d")`. Readers get `memoryview` slices of the backing store instead
+    of copies.
+    """
+
+    def __init__(self, capacity: int, resolution: float = 1.0):
+        self.capacity = max(int(capacity), 1)
+        self.resolution = max(resolution, 0.001)
+
+        self._data = array("d", bytes(8 * self.capacity))
+        self._view = memoryview(self._data)
+        self._head = 0  # index the next point is written to
+        self._size = 0
+
+        self._slot = None
+        self._slot_count = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def latest(self) -> float | None:
+        if not self._size:
+            return None
+        return self._data[(self._head - 1) % self.capacity]
+
+    def push(self, value: float, timestamp: float | None = None):
+        """Record a sample, folding it into the current slot if it is still open."""
+        if value is None or math.isnan(value):
+            return
+
+        slot = (time.monotonic() if timestamp is None else timestamp) // self.resolution
+
+        if slot == self._slot and self._size:
+            last = (self._head - 1) % self.capacity
+            self._slot_count += 1
+            self._data[last] += (value - self._data[last]) / self._slot_count
+            return
+
+        self._slot = slot
+        self._slot_count = 1
+        self._data[self._head] = value
+        self._head = (self._head + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+
+    def window(self, count: int | None = None) -> tuple[memoryview, memoryview]:
+        """Return the last `count` points, oldest first, as two zero-copy views.
+
+        The second view is only non-empty when the window wraps around the end
+        of the ring.
+        """
+        count = self._size if count is None else max(min(count, self._size), 0)
+        start = (self._head - count) % self.capacity
+
+        if start + count <= self.capacity:
+            return self._view[start : start + count], self._view[0:0]
+        return self._view[start:], self._view[: self._head]
+
+    def values(self, count: int | None = None) -> Iterator[float]:
+        """Iterate over the last `count` points, oldest first."""
+        return chain(*self.window(count))
+
+    def window_for(self, seconds: float) -> int:
+        """Return how many points cover the last `seconds` of history."""
+        return max(int(seconds // self.resolution), 1)
+
+    def summary(self, count: int | None = None) -> tuple[float, float, float] | None:
+        """Return (min, max, avg) over the last `count` points."""
+        head, tail = self.window(count)
+        total = len(head) + len(tail)
+        if not total:
+            return None
+        return (
+            min(min(head, default=math.inf), min(tail, default=math.inf)),
+            max(max(head, default=-math.inf), max(tail, default=-math.inf)),
+            (sum(head) + sum(tail)) / total,
+        )
+
+    def downsample(
+        self, points: int, count: int | None = None, mode: Reducer = "avg"
+    ) -> list[float]:
+        """Reduce the last `count` points to at most `points` buckets."""
+        count = self._size if count is None else min(count, self._size)
+        if points <= 0 or not count:
+            return []
+
+        bucket_size = math.ceil(count / points)
+        samples = self.values(count)
+        reducer = _REDUCERS[mode]
+
+        result = []
+        for _ in range(math.ceil(count / bucket_size)):
+            bucket = list(islice(samples, bucket_size))
+            result.append(reducer(bucket))
+        return result
+
+
+_REDUCERS = {
+    "min": min,
+    "max": max,
+    "avg": lambda bucket: sum(bucket) / len(bucket),
+}
+
+
+class HistoryStore:
+    """Process-wide registry of metric histories shared by widgets and tooltips."""
+
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._histories = {}
+        return cls._instance
+
+    def __init__(self, duration: float = 3 * 3600, resolution: float = 1.0):
+        if getattr(self, "_initialized", False):
+            return
+        self._initialized = True
+        self.duration = duration
+        self.resolution = resolution
+
+    def get(self, metric: str) -> MetricHistory:
+        history = self._histories.get(metric)
+        if history is None:
+            history = self._histories[metric] = MetricHistory(
+                capacity=math.ceil(self.duration / self.resolution),
+                resolution=self.resolution,
+            )
+        return history
+
+    def push(self, metric: str, value: float, timestamp: float | None = None):
+        self.get(metric).push(value, timestamp)
@@ -0,0 +1,158 @@
+import os
+import socket
+import threading
+from collections import deque
+from concurrent.futures import Future
+
+from loguru import logger
+
+BATCH_PREFIX = "[[BATCH]]"
+# Hyprland separates the replies of a batch with two blank lines
+BATCH_SEPARATOR = b"\n\n\n"
+
+
+def socket_path(name: str = ".socket.sock") -> str:
+    """Path of one of the sockets of the running Hyprland instance."""
+    signature = os.environ.get("HYPRLAND_INSTANCE_SIGNATURE", "")
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR", f"/run/user/{os.getuid()}")
+    path = os.path.join(runtime_dir, "hypr", signature, name)
+    legacy = os.path.join("/tmp/hypr", signature, name)
+    # Hyprland before 0.40 kept its sockets in /tmp
+    return legacy if not os.path.exists(path) and os.path.exists(legacy) else path
+
+
+def can_batch(command: str) -> bool:
+    # Batched commands are split on ";", so a command containing one can't be
+    return ";" not in command
+
+
+def encode_batch(commands: list[str]) -> bytes:
+    if len(commands) == 1:
+        return commands[0].encode()
+    return (BATCH_PREFIX + ";".join(commands)).encode()
+
+
+def split_batch_reply(reply: bytes, count: int) -> list[bytes] | None:
+    """Split a batch reply into `count` replies, or None if it doesn't add up."""
+    if count == 1:
+        return [reply]
+    parts = reply.split(BATCH_SEPARATOR)
+    if len(parts) == count + 1 and not parts[-1].strip():
+        parts.pop()
+    return parts if len(parts) == count else None
+
+
+class HyprlandCommandClient:
+    """Sends requests to Hyprland's command socket without blocking the caller.
+
+    Every request returns a Future. A small pool of worker threads drains the
+    queue, each on its own connection, and packs whatever queued up while it
+    was busy into a single `[[BATCH]]` round trip. A compositor stall only
+    delays the futures, never the thread that submitted them.
+    """
+
+    def __init__(
+        self,
+        path: str | None = None,
+        workers: int = 2,
+        max_batch: int = 16,
+        timeout: float = 2.0,
+    ):
+        self.path = path
+        self.workers = workers
+        self.max_batch = max_batch
+        self.timeout = timeout
+
+        self._queue: deque[tuple[str, Future]] = deque()
+        self._condition = threading.Condition()
+        self._threads: list[threading.Thread] = []
+        self._closed = False
+
+    def submit(self, command: str) -> Future:
+        """Queue one request; the future resolves to the raw reply bytes."""
+        return self.submit_many([command])[0]
+
+    def submit_many(self, commands: list[str]) -> list[Future]:
+        """Queue requests together so they share a round trip when possible."""
+        futures = [Future() for _ in commands]
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("The command client is closed")
+            self._queue.extend(zip(commands, futures))
+            self._ensure_workers()
+            self._condition.notify()
+        return futures
+
+    def close(self):
+        with self._condition:
+            self._closed = True
+            pending, self._queue = list(self._queue), deque()
+            self._condition.notify_all()
+        for _, future in pending:
+            future.cancel()
+
+    def _ensure_workers(self):
+        # Started lazily, most shells never issue two requests at once
+        self._threads = [thread for thread in self._threads if thread.is_alive()]
+        if len(self._threads) < self.workers and (
+            not self._threads or len(self._queue) > 1
+        ):
+            thread = threading.Thread(
+                target=self._worker, name="hyprland-ipc", daemon=True
+            )
+            self._threads.append(thread)
+            thread.start()
+
+    def _take_batch(self) -> list[tuple[str, Future]] | None:
+        with self._condition:
+            while not self._queue and not self._closed:
+                self._condition.wait()
+            if self._closed:
+                return None
+
+            batch = [self._queue.popleft()]
+            if can_batch(batch[0][0]):
+                while (
+                    self._queue
+                    and len(batch) < self.max_batch
+                    and can_batch(self._queue[0][0])
+                ):
+                    batch.append(self._queue.popleft())
+            return batch
+
+    def _worker(self):
+        while (batch := self._take_batch()) is not None:
+            batch = [item for item in batch if item[1].set_running_or_notify_cancel()]
+            if batch:
+                self._send(batch)
+
+    def _round_trip(self, payload: bytes) -> bytes:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(self.timeout)
+            sock.connect(self.path or socket_path())
+            sock.sendall(payload)
+
+            chunks = []
+            while chunk := sock.recv(65536):
+                chunks.append(chunk)
+            return b"".join(chunks)
+
+    def _send(self, batch: list[tuple[str, Future]]):
+        commands = [command for command, _ in batch]
+        try:
+            replies = split_batch_reply(
+                self._round_trip(encode_batch(commands)), len(batch)
+            )
+            if replies is None:
+                logger.warning(
+                    f"[HyprlandIPC] Unexpected batch reply for {commands}, "
+                    "sending one by one"
+                )
+                replies = [self._round_trip(command.encode()) for command in commands]
+        except OSError as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+
+        for (_, future), reply in zip(batch, replies):
+            future.set_result(reply)
@@ -0,0 +1,369 @@
+from typing import Literal
+
+StateDomain = Literal["monitors", "workspaces", "clients", "active", "keyboard"]
+
+# Events that can move or resize windows without saying where they ended up
+GEOMETRY_EVENTS = frozenset(
+    {
+        "openwindow",
+        "closewindow",
+        "movewindowv2",
+        "changefloatingmode",
+        "fullscreen",
+        "moveworkspacev2",
+        "monitoraddedv2",
+        "monitorremovedv2",
+        "configreloaded",
+    }
+)
+
+
+def normalize_address(address: str) -> str:
+    """Events carry bare hex addresses, `j/clients` prefixes them with 0x."""
+    return address if address.startswith("0x") else f"0x{address}"
+
+
+def _int(value: str) -> int | None:
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+class HyprlandState:
+    """In-memory model of Hyprland monitors, workspaces and clients.
+
+    Seeded once from the json replies and then kept current by applying the
+    events from the socket. Events do not report window geometry, so the
+    ones that may change it only mark `geometry_stale`. Events that do not
+    fit the model (an unknown window, say) mark `needs_resync` instead of
+    being guessed at.
+    """
+
+    def __init__(self):
+        self.monitors: dict[str, dict] = {}
+        self.workspaces: dict[int, dict] = {}
+        self.clients: dict[str, dict] = {}
+        self.keyboards: list[dict] = []
+
+        self.focused_monitor: str | None = None
+        self.active_window: str | None = None
+
+        self.geometry_stale = False
+        self.needs_resync = False
+        # Bumped by every applied event, tells replies from before it apart
+        self.serial = 0
+
+    # Seeding
+
+    def seed(
+        self,
+        monitors: list[dict],
+        workspaces: list[dict],
+        clients: list[dict],
+        devices: dict | None = None,
+        active_window: dict | None = None,
+    ):
+        """Replace the whole model with fresh `j/` replies."""
+        self.monitors = {monitor["name"]: monitor for monitor in monitors}
+        self.workspaces = {workspace["id"]: workspace for workspace in workspaces}
+        self.set_clients(clients)
+
+        if devices is not None:
+            self.set_devices(devices)
+
+        self.focused_monitor = next(
+            (monitor["name"] for monitor in monitors if monitor.get("focused")),
+            next(iter(self.monitors), None),
+        )
+        self.active_window = (active_window or {}).get("address") or None
+        self.needs_resync = False
+
+    def set_clients(self, clients: list[dict]):
+        self.clients = {client["address"]: client for client in clients}
+        self.geometry_stale = False
+
+    def set_devices(self, devices: dict):
+        self.keyboards = devices.get("keyboards", [])
+
+    def update_geometry(self, clients: list[dict]):
+        """Take positions and sizes from a reply older than the model."""
+        for client in clients:
+            known = self.clients.get(client["address"])
+            if known is not None:
+                for key in ("at", "size", "floating", "fullscreen"):
+                    if key in client:
+                        known[key] = client[key]
+
+    # Queries
+
+    def monitor_by_id(self, monitor_id: int) -> dict | None:
+        return next(
+            (m for m in self.monitors.values() if m.get("id") == monitor_id), None
+        )
+
+    def workspace_by_name(self, name: str) -> dict | None:
+        return next((w for w in self.workspaces.values() if w["name"] == name), None)
+
+    @property
+    def active_workspace(self) -> dict | None:
+        monitor = self.monitors.get(self.focused_monitor or "")
+        if monitor is None:
+            return None
+        workspace_id = monitor.get("activeWorkspace", {}).get("id")
+        return self.workspaces.get(workspace_id)
+
+    def workspace_clients(self, workspace_id: int) -> list[dict]:
+        return [
+            client
+            for client in self.clients.values()
+            if client["workspace"]["id"] == workspace_id and client.get("mapped", True)
+        ]
+
+    def window_count(self, workspace_id: int) -> int:
+        return len(self.workspace_clients(workspace_id))
+
+    def find_client(self, **fields) -> dict | None:
+        """Return the first client whose fields all match, e.g. class="foot"."""
+        return next(
+            (
+                client
+                for client in self.clients.values()
+                if all(client.get(key) == value for key, value in fields.items())
+            ),
+            None,
+        )
+
+    @property
+    def main_keyboard(self) -> dict | None:
+        if not self.keyboards:
+            return None
+        return next((kb for kb in self.keyboards if kb.get("main")), self.keyboards[-1])
+
+    # Events
+
+    def apply(self, name: str, payload: str) -> set[StateDomain]:
+        """Apply one `EVENT>>DATA` line and return what it changed."""
+        handler = getattr(self, f"_on_{name}", None)
+        self.serial += 1
+        if name in GEOMETRY_EVENTS:
+            self.geometry_stale = True
+        if handler is None:
+            return set()
+        try:
+            return handler(payload)
+        except ValueError:
+            # Malformed or from a newer protocol than the model understands
+            return self._drift()
+
+    def _count_windows(self, *workspace_ids: int):
+        for workspace_id in workspace_ids:
+            workspace = self.workspaces.get(workspace_id)
+            if workspace is not None:
+                workspace["windows"] = self.window_count(workspace_id)
+
+    def _drift(self) -> set[StateDomain]:
+        self.needs_resync = True
+        return set()
+
+    def _on_openwindow(self, payload: str) -> set[StateDomain]:
+        # ADDRESS,WORKSPACENAME,CLASS,TITLE
+        address, workspace_name, window_class, title = payload.split(",", 3)
+        workspace = self.workspace_by_name(workspace_name)
+        if workspace is None:
+            return self._drift()
+
+        monitor = self.monitors.get(workspace.get("monitor", ""))
+        address = normalize_address(address)
+        self.clients[address] = {
+            "address": address,
+            "mapped": True,
+            "hidden": False,
+            "at": [0, 0],
+            "size": [0, 0],
+            "workspace": {"id": workspace["id"], "name": workspace["name"]},
+            "floating": False,
+            "monitor": monitor["id"] if monitor else workspace.get("monitorID", -1),
+            "class": window_class,
+            "title": title,
+            "initialClass": window_class,
+            "initialTitle": title,
+        }
+        self._count_windows(workspace["id"])
+        return {"clients", "workspaces"}
+
+    def _on_closewindow(self, payload: str) -> set[StateDomain]:
+        client = self.clients.pop(normalize_address(payload), None)
+        if client is None:
+            return self._drift()
+        self._count_windows(client["workspace"]["id"])
+        return {"clients", "workspaces"}
+
+    def _on_movewindowv2(self, payload: str) -> set[StateDomain]:
+        # ADDRESS,WORKSPACEID,WORKSPACENAME
+        address, workspace_id, workspace_name = payload.split(",", 2)
+        client = self.clients.get(normalize_address(address))
+        workspace_id = _int(workspace_id)
+        if client is None or workspace_id is None:
+            return self._drift()
+
+        previous = client["workspace"]["id"]
+        client["workspace"] = {"id": workspace_id, "name": workspace_name}
+        if (workspace := self.workspaces.get(workspace_id)) is not None:
+            monitor = self.monitors.get(workspace.get("monitor", ""))
+            if monitor is not None:
+                client["monitor"] = monitor["id"]
+        self._count_windows(previous, workspace_id)
+        return {"clients", "workspaces"}
+
+    def _on_windowtitlev2(self, payload: str) -> set[StateDomain]:
+        # ADDRESS,TITLE
+        address, title = payload.split(",", 1)
+        client = self.clients.get(normalize_address(address))
+        if client is None:
+            return self._drift()
+        client["title"] = title
+        return {"clients"}
+
+    def _on_changefloatingmode(self, payload: str) -> set[StateDomain]:
+        # ADDRESS,FLOATING
+        address, floating = payload.split(",", 1)
+        client = self.clients.get(normalize_address(address))
+        if client is None:
+            return self._drift()
+        client["floating"] = floating == "1"
+        return {"clients"}
+
+    def _on_fullscreen(self, payload: str) -> set[StateDomain]:
+        # 0/1, always about the active window
+        client = self.clients.get(self.active_window or "")
+        if client is None:
+            return self._drift()
+        client["fullscreen"] = int(payload)
+        return {"clients"}
+
+    def _on_activewindowv2(self, payload: str) -> set[StateDomain]:
+        self.active_window = normalize_address(payload) if payload else None
+        return {"active"}
+
+    def _on_createworkspacev2(self, payload: str) -> set[StateDomain]:
+        # ID,NAME
+        workspace_id, name = payload.split(",", 1)
+        workspace_id = _int(workspace_id)
+        if workspace_id is None:
+            return self._drift()
+        monitor = self.monitors.get(self.focused_monitor or "")
+        self.workspaces.setdefault(
+            workspace_id,
+            {
+                "id": workspace_id,
+                "name": name,
+                "monitor": monitor["name"] if monitor else "",
+                "monitorID": monitor["id"] if monitor else -1,
+                "windows": 0,
+                "hasfullscreen": False,
+            },
+        )
+        return {"workspaces"}
+
+    def _on_destroyworkspacev2(self, payload: str) -> set[StateDomain]:
+        workspace_id = _int(payload.split(",", 1)[0])
+        if self.workspaces.pop(workspace_id, None) is None:
+            return set()
+        return {"workspaces"}
+
+    def _on_moveworkspacev2(self, payload: str) -> set[StateDomain]:
+        # ID,NAME,MONITORNAME
+        workspace_id, _, monitor_name = payload.split(",", 2)
+        workspace = self.workspaces.get(_int(workspace_id))
+        monitor = self.monitors.get(monitor_name)
+        if workspace is None or monitor is None:
+            return self._drift()
+        workspace["monitor"] = monitor_name
+        workspace["monitorID"] = monitor["id"]
+        for client in self.workspace_clients(workspace["id"]):
+            client["monitor"] = monitor["id"]
+        return {"workspaces", "clients"}
+
+    def _on_workspacev2(self, payload: str) -> set[StateDomain]:
+        # ID,NAME, the workspace became active on the focused monitor
+        workspace_id, name = payload.split(",", 1)
+        workspace_id = _int(workspace_id)
+        if workspace_id is None:
+            return self._drift()
+
+        if workspace_id not in self.workspaces:
+            self._on_createworkspacev2(payload)
+
+        workspace = self.workspaces[workspace_id]
+        monitor = self.monitors.get(workspace.get("monitor") or "")
+        if monitor is None:
+            monitor = self.monitors.get(self.focused_monitor or "")
+        if monitor is None:
+            return self._drift()
+
+        monitor["activeWorkspace"] = {"id": workspace_id, "name": name}
+        self.focused_monitor = monitor["name"]
+        return {"active"}
+
+    def _on_focusedmonv2(self, payload: str) -> set[StateDomain]:
+        # MONITORNAME,WORKSPACEID
+        monitor_name, workspace_id = payload.split(",", 1)
+        monitor = self.monitors.get(monitor_name)
+        workspace = self.workspaces.get(_int(workspace_id))
+        if monitor is None:
+            return self._drift()
+
+        for other in self.monitors.values():
+            other["focused"] = other is monitor
+        self.focused_monitor = monitor_name
+        if workspace is not None:
+            monitor["activeWorkspace"] = {
+                "id": workspace["id"],
+                "name": workspace["name"],
+            }
+        return {"active"}
+
+    def _on_monitoraddedv2(self, payload: str) -> set[StateDomain]:
+        # Geometry, scale and transform only come with a full reply
+        return self._drift()
+
+    # Hyprland sends `monitorremoved` alongside, it is left unhandled so a
+    # removal is only applied once
+    def _on_monitorremovedv2(self, payload: str) -> set[StateDomain]:
+        # ID,NAME,DESCRIPTION
+        monitor_name = payload.split(",", 2)[1]
+        if self.monitors.pop(monitor_name, None) is None:
+            return self._drift()
+        if self.focused_monitor == monitor_name:
+            self.focused_monitor = next(iter(self.monitors), None)
+        return {"monitors", "active"}
+
+    def _on_activespecial(self, payload: str) -> set[StateDomain]:
+        # WORKSPACENAME,MONITORNAME, the name is empty once the special
+        # workspace is closed
+        name, monitor_name = payload.split(",", 1)
+        monitor = self.monitors.get(monitor_name)
+        if monitor is None:
+            return self._drift()
+
+        workspace_id = 0
+        if name:
+            workspace = self.workspace_by_name(name)
+            if workspace is None:
+                return self._drift()
+            workspace_id = workspace["id"]
+
+        monitor["specialWorkspace"] = {"id": workspace_id, "name": name}
+        return {"active"}
+
+    def _on_configreloaded(self, payload: str) -> set[StateDomain]:
+        return self._drift()
+
+    def _on_activelayout(self, payload: str) -> set[StateDomain]:
+        # KEYBOARDNAME,LAYOUTNAME
+        keyboard_name, layout = payload.split(",", 1)
+        for keyboard in self.keyboards:
+            if keyboard.get("name") == keyboard_name:
+                keyboard["active_keymap"] = layout
+        return {"keyboard"}
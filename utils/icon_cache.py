@@ -0,0 +1,119 @@
+import hashlib
+import os
+
+import gi
+from gi.repository import GdkPixbuf, GLib, Gtk
+from loguru import logger
+
+from .lru import SizedLRU
+
+gi.require_versions({"Gtk": "3.0", "GdkPixbuf": "2.0"})
+
+# Enough for a few hundred icons at dock and launcher sizes
+ICON_CACHE_BUDGET = 32 * 1024 * 1024
+
+
+def pixbuf_size(pixbuf: GdkPixbuf.Pixbuf) -> int:
+    return pixbuf.get_rowstride() * pixbuf.get_height()
+
+
+class IconCache:
+    """Process-wide cache of decoded and scaled icon pixbufs.
+
+    Entries are keyed by where the icon came from (theme name, file, or the
+    pixels of a tray pixmap) and by size and scale, so every widget on every
+    monitor shares the same pixbuf. The cache is bounded by pixel memory and
+    is emptied when the icon theme changes.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self, budget: int = ICON_CACHE_BUDGET):
+        if getattr(self, "_initialized", False):
+            return
+        self._initialized = True
+
+        self._cache: SizedLRU[GdkPixbuf.Pixbuf] = SizedLRU(budget)
+        self._themes: dict[str, Gtk.IconTheme] = {}
+
+        Gtk.IconTheme.get_default().connect("changed", self._on_theme_changed)
+
+    def _on_theme_changed(self, *_):
+        logger.debug(
+            f"[IconCache] Icon theme changed, dropping {len(self._cache)} icons"
+        )
+        self._cache.clear()
+
+    def _get(self, key, loader, sizeof=pixbuf_size):
+        return self._cache.get_or_load(key, loader, sizeof)
+
+    def _theme(self, search_path: str | None) -> Gtk.IconTheme:
+        if not search_path:
+            return Gtk.IconTheme.get_default()
+        # One theme per search path, building one rescans the whole path
+        if search_path not in self._themes:
+            theme = Gtk.IconTheme.new()
+            theme.prepend_search_path(search_path)
+            self._themes[search_path] = theme
+        return self._themes[search_path]
+
+    def load_icon(
+        self,
+        icon_name: str,
+        size: int,
+        scale: int = 1,
+        search_path: str | None = None,
+    ) -> GdkPixbuf.Pixbuf:
+        """Like `Gtk.IconTheme.load_icon` with FORCE_SIZE, raises GLib.Error."""
+        theme = self._theme(search_path)
+        return self._get(
+            ("icon", icon_name, size, scale, search_path),
+            lambda: theme.load_icon_for_scale(
+                icon_name, size, scale, Gtk.IconLookupFlags.FORCE_SIZE
+            ),
+        )
+
+    def load_file(self, path: str, size: int) -> GdkPixbuf.Pixbuf:
+        """Like `GdkPixbuf.Pixbuf.new_from_file_at_size`, raises GLib.Error."""
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError as e:
+            raise GLib.Error(str(e)) from e
+        return self._get(
+            ("file", path, mtime, size),
+            lambda: GdkPixbuf.Pixbuf.new_from_file_at_size(path, size, size),
+        )
+
+    def load_pixmap(self, pixmap, size: int) -> GdkPixbuf.Pixbuf:
+        """Scale a pixmap icon, a tray item's say, once per content and size.
+
+        Gray pixmaps don't expose their raw data, so the key hashes a nearest
+        neighbour rendering, which is cheap next to the smooth scaling it saves.
+        """
+        preview = pixmap.as_pixbuf(size, GdkPixbuf.InterpType.NEAREST)
+        digest = hashlib.blake2b(
+            preview.read_pixel_bytes().get_data(), digest_size=16
+        ).hexdigest()
+        return self._get(
+            ("pixmap", digest, preview.get_width(), preview.get_height(), size),
+            lambda: pixmap.as_pixbuf(size, GdkPixbuf.InterpType.HYPER),
+        )
+
+    def load_app_icon(self, app, size: int) -> GdkPixbuf.Pixbuf | None:
+        """The icon of a fabric `DesktopApp`, shared between apps that use it."""
+        icon_name = getattr(app, "icon_name", None)
+        if isinstance(icon_name, str) and icon_name:
+            try:
+                if os.path.isabs(icon_name):
+                    return self.load_file(icon_name, size)
+                return self.load_icon(icon_name, size)
+            except GLib.Error:
+                pass
+        return self._get(
+            ("app", app.name, size), lambda: app.get_icon_pixbuf(size=size)
+        )
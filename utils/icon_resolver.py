@@ -1,13 +1,14 @@
 import os
-import re
 
 import gi
-from gi.repository import GdkPixbuf, GLib, Gtk
+from gi.repository import GdkPixbuf, Gio, GLib, Gtk
 from loguru import logger
 
 from utils.functions import read_json_file, write_json_file
 
 from .constants import ICON_CACHE_FILE
+from .desktop_index import DesktopFileIndex
+from .icon_cache import IconCache
 from .icons import symbolic_icons
 
 gi.require_versions({"Gtk": "3.0", "GdkPixbuf": "2.0"})
@@ -24,6 +25,13 @@ class IconResolver:
         return cls._instance
 
     def __init__(self):
+        if getattr(self, "_initialized", False):
+            return
+        self._initialized = True
+        self._icon_cache = IconCache()
+        self._desktop_index: DesktopFileIndex | None = None
+        self._monitors: list[Gio.FileMonitor] = []
+
         if os.path.exists(ICON_CACHE_FILE):
             self._icon_dict = read_json_file(ICON_CACHE_FILE) or {}
 
@@ -45,13 +53,7 @@ class IconResolver:
             return (
                 pixmap.as_pixbuf(icon_size, GdkPixbuf.InterpType.HYPER)
                 if pixmap is not None
-                else Gtk.IconTheme()
-                .get_default()
-                .load_icon(
-                    icon_name,
-                    icon_size,
-                    Gtk.IconLookupFlags.FORCE_SIZE,
-                )
+                else self._icon_cache.load_icon(icon_name, icon_size)
             )
         except GLib.GError:
             return self.get_icon_pixbuf(app_id, icon_size)
@@ -59,61 +61,84 @@ class IconResolver:
     def get_icon_pixbuf(self, app_id: str, size: int = 16):
         icon_name = self.get_icon_name(app_id)
         try:
-            return Gtk.IconTheme.get_default().load_icon(
-                icon_name,
-                size,
-                Gtk.IconLookupFlags.FORCE_SIZE,
-            )
+            return self._icon_cache.load_icon(icon_name, size)
         except GLib.GError:
-            return (
-                Gtk.IconTheme()
-                .get_default()
-                .load_icon(
-                    "image-missing",
-                    size,
-                    Gtk.IconLookupFlags.FORCE_SIZE,
-                )
-            )
+            return self._icon_cache.load_icon("image-missing", size)
 
     def _store_new_icon(self, app_id: str, icon: str):
         self._icon_dict[app_id] = icon
         write_json_file(self._icon_dict, ICON_CACHE_FILE)
 
-    def _get_icon_from_desktop_file(self, desktop_file_path: str):
-        with open(desktop_file_path, "r") as f:
-            for line in f.readlines():
-                if "Icon=" in line:
-                    return "".join(line[5:].split())
-            return symbolic_icons["fallback"]["executable"]
-
-    def _get_desktop_file(self, app_id: str) -> str | None:
-        data_dirs = GLib.get_system_data_dirs()
-        for data_dir in data_dirs:
-            data_dir = data_dir + "/applications/"
-            if os.path.exists(data_dir):
-                # Do name resolving here
-                files = os.listdir(data_dir)
-                matching = [
-                    s for s in files if "".join(app_id.lower().split()) in s.lower()
-                ]
-                if matching:
-                    return data_dir + matching[0]
-
-                for word in list(filter(None, re.split(r"-|\.|_|\s", app_id))):
-                    matching = [s for s in files if word.lower() in s.lower()]
-                    if matching:
-                        return data_dir + matching[0]
-
-        return None
+    @staticmethod
+    def _applications_dirs() -> list[str]:
+        data_dirs = [GLib.get_user_data_dir(), *GLib.get_system_data_dirs()]
+        return [os.path.join(data_dir, "applications") for data_dir in data_dirs]
+
+    @property
+    def desktop_index(self) -> DesktopFileIndex:
+        """Token index of .desktop files, built on first use and kept current."""
+        if self._desktop_index is None:
+            directories = self._applications_dirs()
+            self._desktop_index = DesktopFileIndex(directories)
+            for directory in directories:
+                self._monitor_directory(directory)
+            logger.debug(
+                f"[ICONS] Indexed {len(self._desktop_index.files)} desktop files"
+            )
+        return self._desktop_index
+
+    def _monitor_directory(self, directory: str):
+        if not os.path.isdir(directory):
+            return
+        try:
+            monitor = Gio.File.new_for_path(directory).monitor_directory(
+                Gio.FileMonitorFlags.WATCH_MOVES, None
+            )
+        except GLib.Error as e:
+            logger.warning(f"[ICONS] Failed to monitor {directory}: {e}")
+            return
+        monitor.connect("changed", self._on_applications_changed)
+        self._monitors.append(monitor)
+
+    def _on_applications_changed(self, _monitor, file, other_file, event_type):
+        index = self._desktop_index
+        if index is None:
+            return
+        path = file.get_path()
+        other_path = other_file.get_path() if other_file else None
+        if not any(p and p.endswith(".desktop") for p in (path, other_path)):
+            return
+
+        events = Gio.FileMonitorEvent
+        if event_type in (
+            events.CHANGES_DONE_HINT,
+            events.CREATED,
+            events.MOVED_IN,
+        ):
+            index.add(path)
+        elif event_type in (events.DELETED, events.MOVED_OUT):
+            index.remove(path)
+        elif event_type == events.RENAMED:
+            index.remove(path)
+            if other_path and other_path.endswith(".desktop"):
+                index.add(other_path)
+        else:
+            return
+
+        # Apps that had no desktop file may have one now
+        fallback = symbolic_icons["fallback"]["executable"]
+        stale = [key for key, icon in self._icon_dict.items() if icon == fallback]
+        if stale:
+            for key in stale:
+                del self._icon_dict[key]
+            write_json_file(self._icon_dict, ICON_CACHE_FILE)
 
     def _compositor_find_icon(self, app_id: str):
         if Gtk.IconTheme.get_default().has_icon(app_id):
             return app_id
         if Gtk.IconTheme.get_default().has_icon(app_id + "-desktop"):
             return app_id + "-desktop"
-        desktop_file = self._get_desktop_file(app_id)
-        return (
-            self._get_icon_from_desktop_file(desktop_file)
-            if desktop_file
-            else symbolic_icons["fallback"]["executable"]
-        )
+        desktop_file = self.desktop_index.lookup(app_id)
+        if desktop_file and desktop_file.icon:
+            return desktop_file.icon
+        return symbolic_icons["fallback"]["executable"]
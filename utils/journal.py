@@ -0,0 +1,130 @@
+import contextlib
+import json
+import os
+import threading
+
+from loguru import logger
+
+# Journal entries tolerated before compacting, however few records there are
+COMPACT_MIN = 64
+
+
+class JournalStore:
+    """Records kept as a JSON snapshot plus an append-only journal of changes.
+
+    Adding, removing and clearing records each append one JSON line to
+    `<path>.journal`, so a write costs the same however many records there
+    are. Once the journal outgrows the records, they are written to a new
+    snapshot that atomically replaces `path` and the journal is emptied.
+    Records are identified by `key`; replaying is idempotent, so a crash
+    between the two steps of a compaction loses nothing.
+    """
+
+    def __init__(self, path: str, key: str = "id", compact_min: int = COMPACT_MIN):
+        self.path = path
+        self.journal_path = f"{path}.journal"
+        self.key = key
+        self.compact_min = compact_min
+        self._lock = threading.Lock()
+        self._pending = 0
+        # Set when an append failed, the journal then misses a change
+        self._lost = False
+
+    def load(self) -> list[dict]:
+        """Read the snapshot and replay the journal on top of it."""
+        records: dict = {}
+        with contextlib.suppress(OSError, ValueError):
+            with open(self.path, encoding="utf-8") as f:
+                snapshot = json.load(f)
+            if isinstance(snapshot, list):
+                for record in snapshot:
+                    self._replay_add(records, record)
+
+        self._pending = 0
+        self._lost = False
+        damaged = False
+        with (
+            contextlib.suppress(OSError),
+            open(self.journal_path, encoding="utf-8") as f,
+        ):
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    operation = entry["op"]
+                except (ValueError, KeyError, TypeError):
+                    # A write cut short by a crash, everything before it holds
+                    damaged = True
+                    logger.warning(
+                        f"[Journal] Skipping damaged line in {self.journal_path}"
+                    )
+                    continue
+                self._pending += 1
+                if operation == "add":
+                    self._replay_add(records, entry.get("record"))
+                elif operation == "remove":
+                    records.pop(entry.get("key"), None)
+                elif operation == "clear":
+                    records.clear()
+
+        loaded = list(records.values())
+        if damaged:
+            # Later appends would otherwise be glued to the damaged line
+            with contextlib.suppress(OSError):
+                self.compact(loaded)
+        return loaded
+
+    def _replay_add(self, records: dict, record):
+        if not isinstance(record, dict):
+            return
+        # Records without a key can't be removed, they only need to be kept
+        key = record.get(self.key, object())
+        records.setdefault(key, record)
+
+    @property
+    def pending(self) -> int:
+        """Journal entries written since the last compaction."""
+        return self._pending
+
+    def _append(self, entry: dict):
+        line = json.dumps(entry, ensure_ascii=False)
+        with self._lock:
+            try:
+                os.makedirs(os.path.dirname(self.journal_path) or ".", exist_ok=True)
+                with open(self.journal_path, "a", encoding="utf-8") as f:
+                    f.write(f"{line}\n")
+            except OSError as e:
+                # The records in memory stay right, the next compaction
+                # writes them all out again
+                logger.warning(
+                    f"[Journal] Failed to append to {self.journal_path}: {e}"
+                )
+                self._lost = True
+                return
+            self._pending += 1
+
+    def add(self, record: dict):
+        self._append({"op": "add", "record": record})
+
+    def remove(self, key):
+        self._append({"op": "remove", "key": key})
+
+    def clear(self):
+        self._append({"op": "clear"})
+
+    def compact_if_due(self, records: list[dict]):
+        """Compact once the journal holds more entries than there are records."""
+        if self._lost or self._pending > max(self.compact_min, len(records)):
+            self.compact(records)
+
+    def compact(self, records: list[dict]):
+        """Write `records` as the new snapshot and empty the journal."""
+        with self._lock:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(records, f, indent=4, ensure_ascii=False)
+            os.replace(temp_path, self.path)
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(self.journal_path)
+            self._pending = 0
+            self._lost = False
@@ -0,0 +1,66 @@
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SizedLRU(Generic[T]):
+    """A least-recently-used map bounded by the total size of its values.
+
+    Every entry carries its own size, in bytes say, and the oldest entries
+    are evicted until the total fits the budget again. A single value larger
+    than the whole budget is returned to the caller but never kept.
+    """
+
+    def __init__(self, budget: int):
+        self.budget = budget
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, tuple[T, int]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable, default: T | None = None) -> T | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key: Hashable, value: T, size: int):
+        self.pop(key)
+        if size > self.budget:
+            return
+        self._entries[key] = (value, size)
+        self.size += size
+        while self.size > self.budget:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self.size -= evicted
+
+    def get_or_load(
+        self, key: Hashable, loader: Callable[[], T], sizeof: Callable[[T], int]
+    ) -> T:
+        value = self.get(key)
+        if value is None:
+            value = loader()
+            if value is not None:
+                self.put(key, value, sizeof(value))
+        return value
+
+    def pop(self, key: Hashable) -> T | None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return None
+        self.size -= entry[1]
+        return entry[0]
+
+    def clear(self):
+        self._entries.clear()
+        self.size = 0
@@ -5,8 +5,6 @@ from fabric.hyprland import Hyprland
 from gi.repository import Gdk
 from loguru import logger
 
-from .functions import ttl_lru_cache
-
 warnings.filterwarnings("ignore", category=DeprecationWarning)
 
 
@@ -24,10 +22,19 @@ class HyprlandWithMonitors(Hyprland):
         super().__init__(commands_only, **kwargs)
         self.display: Gdk.Display = Gdk.Display.get_default()
 
-    @ttl_lru_cache(100, 5)
+    @property
+    def state(self):
+        # Imported lazily, the state service pulls in the services package
+        from services.hyprland_state import HyprlandStateService
+
+        return HyprlandStateService()
+
     def get_all_monitors(self) -> dict | None:
         try:
-            monitors = json.loads(self.send_command("j/monitors").reply)
+            if self.state.ready:
+                monitors = self.state.monitors
+            else:
+                monitors = json.loads(self.send_command("j/monitors").reply)
             return {monitor["id"]: monitor["name"] for monitor in monitors}
         except Exception as e:
             logger.error(f"[Monitors] Error getting all monitors: {e}")
@@ -49,7 +56,12 @@ class HyprlandWithMonitors(Hyprland):
 
     def get_current_gdk_monitor_id(self) -> int | None:
         try:
-            active_workspace = json.loads(self.send_command("j/activeworkspace").reply)
+            if self.state.ready:
+                active_workspace = self.state.active_workspace
+            else:
+                active_workspace = json.loads(
+                    self.send_command("j/activeworkspace").reply
+                )
             return self.get_gdk_monitor_id_from_name(active_workspace["monitor"])
         except Exception as e:
             logger.error(f"[Monitors] Error getting current GDK monitor ID: {e}")
@@ -0,0 +1,135 @@
+import contextlib
+import os
+import re
+import time
+from typing import NamedTuple
+
+from loguru import logger
+
+# Virtual interfaces that would double count traffic of the physical ones
+IGNORED_INTERFACES = re.compile(r"lo|(?:ifb|lxdbr|virbr|br|vnet|tun|tap)[0-9]+")
+
+# Byte counters are 64 bit on modern kernels, but some drivers still wrap at 32
+COUNTER_32_BIT = 1 << 32
+
+
+class InterfaceRate(NamedTuple):
+    """Transfer rate of one interface, in bytes/ms."""
+
+    download: float
+    upload: float
+
+
+def counter_delta(current: int, last: int) -> int:
+    """Return how much a byte counter advanced, handling wraps and resets."""
+    if current >= last:
+        return current - last
+    if last < COUNTER_32_BIT:
+        wrapped = COUNTER_32_BIT - last + current
+        # A jump over half the range is a counter reset, not a wrap
+        if wrapped < COUNTER_32_BIT // 2:
+            return wrapped
+    # Interface was re-created or its driver reloaded
+    return 0
+
+
+class NetDevRates:
+    """Per-interface transfer rates computed from `/proc/net/dev`.
+
+    The file is kept open and re-read with `preadv`, counters are tracked per
+    interface and rates use the real monotonic time elapsed between samples.
+    `smoothing` is the EWMA weight given to the previous rate, 0 disables it.
+    """
+
+    # Calls closer together than this reuse the last sample, so several bars
+    # polling on the same tick do not see near-zero deltas
+    MIN_SAMPLE_INTERVAL = 0.25
+
+    def __init__(self, proc_root: str = "/proc", smoothing: float = 0.0):
+        self.smoothing = min(max(smoothing, 0.0), 0.99)
+
+        self._path = f"{proc_root}/net/dev"
+        self._fd: int | None = None
+        self._buffer = bytearray(4096)
+
+        self._counters: dict[str, tuple[int, int]] = {}
+        self._rates: dict[str, InterfaceRate] = {}
+        self._last_sample: float | None = None
+
+    def _read(self) -> bytes:
+        if self._fd is None:
+            self._fd = os.open(self._path, os.O_RDONLY | os.O_CLOEXEC)
+
+        while True:
+            size = os.preadv(self._fd, [self._buffer], 0)
+            if size < len(self._buffer):
+                return bytes(self._buffer[:size])
+            # Lots of interfaces, grow until the whole table fits
+            self._buffer = bytearray(len(self._buffer) * 2)
+
+    def read_counters(self) -> dict[str, tuple[int, int]]:
+        """Return the (received, transmitted) byte counters per interface."""
+        counters = {}
+        # The first two lines are the table header
+        for line in self._read().decode().splitlines()[2:]:
+            interface, _, fields = line.partition(":")
+            interface = interface.strip()
+            if IGNORED_INTERFACES.fullmatch(interface):
+                continue
+
+            fields = fields.split()
+            try:
+                counters[interface] = (int(fields[0]), int(fields[8]))
+            except (IndexError, ValueError):
+                continue
+        return counters
+
+    def sample(self, now: float | None = None) -> dict[str, InterfaceRate]:
+        """Return the current rate of every tracked interface."""
+        now = time.monotonic() if now is None else now
+
+        if (
+            self._last_sample is not None
+            and now - self._last_sample < self.MIN_SAMPLE_INTERVAL
+        ):
+            return self._rates
+
+        try:
+            counters = self.read_counters()
+        except OSError as e:
+            logger.warning(f"[NetDev] Failed to read {self._path}: {e}")
+            self.close()
+            return self._rates
+
+        elapsed = (
+            (now - self._last_sample) * 1000 if self._last_sample is not None else 0
+        )
+        rates = {}
+
+        for interface, (received, transmitted) in counters.items():
+            last = self._counters.get(interface)
+            if last is None or elapsed <= 0:
+                # Nothing to compare against yet
+                rates[interface] = InterfaceRate(0.0, 0.0)
+                continue
+
+            download = counter_delta(received, last[0]) / elapsed
+            upload = counter_delta(transmitted, last[1]) / elapsed
+
+            previous = self._rates.get(interface)
+            if self.smoothing and previous is not None:
+                download += self.smoothing * (previous.download - download)
+                upload += self.smoothing * (previous.upload - upload)
+
+            rates[interface] = InterfaceRate(download, upload)
+
+        self._counters = counters
+        self._rates = rates
+        self._last_sample = now
+        return rates
+
+    def close(self):
+        if self._fd is not None:
+            with contextlib.suppress(OSError):
+                os.close(self._fd)
+            self._fd = None
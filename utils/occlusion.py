@@ -1,61 +1,127 @@
-import json
-import subprocess
+from typing import Literal
 
 from loguru import logger
 
+# (x1, y1, x2, y2) in Hyprland's global layout coordinates
+Rect = tuple[int, int, int, int]
 
-def get_current_workspace():
-    """
-    Get the current workspace ID using hyprctl.
-    """
-    try:
-        result = subprocess.run(
-            ["hyprctl", "activeworkspace"], capture_output=True, text=True
-        )
-        # Assume the output similar to: "ID <number>"
-        # Extracting the number from the output
-        parts = result.stdout.split()
-        for i, part in enumerate(parts):
-            if part == "ID" and i + 1 < len(parts):
-                return int(parts[i + 1])
-    except Exception as e:
-        logger.exception(f"Error getting current workspace: {e}")
-    return -1
-
-
-def get_screen_dimensions():
-    """
-    Get screen dimensions from hyprctl.
+Side = Literal["top", "bottom", "left", "right"]
 
-    Returns:
-        tuple: (width, height) of the monitor containing the current workspace
-    """
-    try:
-        # Get current workspace
-        workspace_id = get_current_workspace()
 
-        # Get monitor information
-        result = subprocess.run(
-            ["hyprctl", "-j", "monitors"], capture_output=True, text=True
-        )
-        monitors = json.loads(result.stdout)
+def intersects(a: Rect, b: Rect) -> bool:
+    return not (a[2] <= b[0] or a[0] >= b[2] or a[3] <= b[1] or a[1] >= b[3])
+
+
+def covers(outer: Rect, inner: Rect) -> bool:
+    return (
+        outer[0] <= inner[0]
+        and outer[1] <= inner[1]
+        and outer[2] >= inner[2]
+        and outer[3] >= inner[3]
+    )
 
-        # Find the monitor containing our workspace
-        for monitor in monitors:
-            if monitor.get("activeWorkspace", {}).get("id") == workspace_id:
-                return monitor.get("width", 1920), monitor.get("height", 1080)
 
-        # Fallback to first monitor
-        if monitors:
-            return monitors[0].get("width", 1920), monitors[0].get("height", 1080)
-    except Exception as e:
-        logger.exception(f"Error getting screen dimensions: {e}")
+def monitor_rect(monitor: dict) -> Rect:
+    """Logical rectangle of a `j/monitors` entry, after scale and rotation."""
+    scale = monitor.get("scale") or 1
+    width = round(monitor.get("width", 1920) / scale)
+    height = round(monitor.get("height", 1080) / scale)
+    if monitor.get("transform", 0) % 2:
+        width, height = height, width
+    x, y = monitor.get("x", 0), monitor.get("y", 0)
+    return (x, y, x + width, y + height)
 
-    # Default fallback values
-    return 1920, 1080
 
+def edge_region(
+    side: Side, size: int, monitor: Rect, length: int | None = None
+) -> Rect:
+    """A strip of `size` pixels along one edge of a monitor.
 
-def check_occlusion(occlusion_region, workspace=None):
+    With `length` the strip is centered on the edge instead of spanning it.
+    """
+    x1, y1, x2, y2 = monitor
+    if length is not None:
+        if side.lower() in ("top", "bottom"):
+            x1 = (x1 + x2 - length) // 2
+            x2 = x1 + length
+        else:
+            y1 = (y1 + y2 - length) // 2
+            y2 = y1 + length
+    match side.lower():
+        case "top":
+            return (x1, y1, x2, y1 + size)
+        case "bottom":
+            return (x1, y2 - size, x2, y2)
+        case "left":
+            return (x1, y1, x1 + size, y2)
+        case "right":
+            return (x2 - size, y1, x2, y2)
+    raise ValueError(f"Unknown side: {side}")
+
+
+class OcclusionIndex:
+    """Window rectangles indexed by workspace, plus cached monitor geometry.
+
+    Regions are given either as `(side, size)` or `(side, size, length)`
+    along an edge of a monitor, or as a monitor-relative
+    `(x, y, width, height)`. A query is a rectangle test
+    against the windows of a single workspace and never touches the socket.
+    """
+
+    def __init__(self):
+        self.monitors: dict[str, Rect] = {}
+        self.workspaces: dict[int, list[Rect]] = {}
+
+    def set_monitors(self, monitors: list[dict]):
+        self.monitors = {monitor["name"]: monitor_rect(monitor) for monitor in monitors}
+
+    def set_clients(self, clients: list[dict]):
+        workspaces: dict[int, list[Rect]] = {}
+        for client in clients:
+            if not client.get("mapped", True) or client.get("hidden", False):
+                continue
+
+            position, size = client.get("at"), client.get("size")
+            workspace_id = client.get("workspace", {}).get("id")
+            if not position or not size or workspace_id is None:
+                continue
+
+            x, y = position
+            workspaces.setdefault(workspace_id, []).append(
+                (x, y, x + size[0], y + size[1])
+            )
+        self.workspaces = workspaces
+
+    def region(self, region: tuple, monitor: str) -> Rect | None:
+        """Resolve a region spec on `monitor` to global coordinates."""
+        bounds = self.monitors.get(monitor)
+        if bounds is None:
+            return None
+
+        if len(region) in (2, 3) and isinstance(region[0], str):
+            return edge_region(*region[:2], bounds, *region[2:])
+
+        if len(region) == 4:
+            x, y, width, height = region
+            return (
+                bounds[0] + x,
+                bounds[1] + y,
+                bounds[0] + x + width,
+                bounds[1] + y + height,
+            )
+
+        logger.warning(f"[Occlusion] Invalid occlusion region format: {region}")
+        return None
+
+    def occluded(self, workspace_id: int, rect: Rect, full: bool = False) -> bool:
+        """Whether a window on the workspace overlaps, or with `full` covers, rect."""
+        test = covers if full else intersects
+        return any(
+            test(window, rect) for window in self.workspaces.get(workspace_id, ())
+        )
+
+
+def check_occlusion(occlusion_region, workspace=None, monitor=None) -> bool:
     """
     Check if a region is occupied by any window on a given workspace.
 
@@ -63,75 +129,18 @@ def check_occlusion(occlusion_region, workspace=None):
         occlusion_region: Can be one of:
             - tuple (side, size): where side is "top", "bottom", "left", or "right"
               and size is the pixel width of the region
-            - tuple (x, y, width, height): The full region coordinates (legacy format)
+            - tuple (x, y, width, height): The region, relative to the monitor
         workspace (int, optional): The workspace ID to check. If None,
-        the current workspace is used.
+        the active workspace of the monitor is used.
+        monitor (str, optional): The monitor name. If None, the focused
+        monitor is used.
 
     Returns:
         bool: True if any window overlaps with the occlusion region, False otherwise.
     """
-    if workspace is None:
-        workspace = get_current_workspace()
-
-    # Handle simplified side-based format
-    if isinstance(occlusion_region, tuple) and len(occlusion_region) == 2:
-        side, size = occlusion_region
-        if isinstance(side, str):
-            # Convert side-based format to coordinates
-            screen_width, screen_height = get_screen_dimensions()
-
-            if side.lower() == "bottom":
-                occlusion_region = (0, screen_height - size, screen_width, size)
-            elif side.lower() == "top":
-                occlusion_region = (0, 0, screen_width, size)
-            elif side.lower() == "left":
-                occlusion_region = (0, 0, size, screen_height)
-            elif side.lower() == "right":
-                occlusion_region = (screen_width - size, 0, size, screen_height)
-
-    # Ensure occlusion_region is in the correct format (x, y, width, height)
-    if not isinstance(occlusion_region, tuple) or len(occlusion_region) != 4:
-        logger.exception(f"Invalid occlusion region format: {occlusion_region}")
-        return False
-
-    try:
-        result = subprocess.run(
-            ["hyprctl", "-j", "clients"], capture_output=True, text=True
-        )
-        clients = json.loads(result.stdout)
-    except Exception as e:
-        logger.exception(f"Error retrieving client windows: {e}")
-        return False
-
-    occ_x, occ_y, occ_width, occ_height = occlusion_region
-    occ_x2 = occ_x + occ_width
-    occ_y2 = occ_y + occ_height
-
-    for client in clients:
-        # Check if client is mapped
-        if not client.get("mapped", False):
-            continue
-
-        # Ensure client has proper workspace information and matches the workspace
-        client_workspace = client.get("workspace", {})
-        if client_workspace.get("id") != workspace:
-            continue
-
-        # Ensure client has position and size info
-        position = client.get("at")
-        size = client.get("size")
-        if not position or not size:
-            continue
-
-        x, y = position
-        width, height = size
-        win_x1, win_y1 = x, y
-        win_x2, win_y2 = x + width, y + height
-
-        # Check for intersection between the window and occlusion region
-        if not (
-            win_x2 <= occ_x or win_x1 >= occ_x2 or win_y2 <= occ_y or win_y1 >= occ_y2
-        ):
-            return True  # Occlusion region is occupied
-
-    return False  # No window overlaps the occlusion region
+    # Imported lazily, the service pulls in the services package
+    from services.occlusion import OcclusionService
+
+    return OcclusionService().occluded(
+        occlusion_region, monitor=monitor, workspace=workspace
+    )
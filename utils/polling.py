@@ -0,0 +1,60 @@
+from typing import Literal
+
+PollingCondition = Literal["hidden", "occluded", "locked", "idle", "battery"]
+
+
+class PollingPolicy:
+    """Decide how fast pollers may run given the shell's power and visibility state.
+
+    While the bar is hidden or occluded, or the screen is locked, polling is
+    suspended. Idle sessions and running on battery stretch every interval by
+    their multiplier; both together multiply.
+    """
+
+    SUSPENDING: frozenset[str] = frozenset({"hidden", "occluded", "locked"})
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        idle_multiplier: float = 4.0,
+        battery_multiplier: float = 2.0,
+    ):
+        self.enabled = enabled
+        self.multipliers = {
+            "idle": max(idle_multiplier, 1.0),
+            "battery": max(battery_multiplier, 1.0),
+        }
+        self._active: set[str] = set()
+
+    @property
+    def active(self) -> frozenset[str]:
+        return frozenset(self._active)
+
+    @property
+    def suspended(self) -> bool:
+        return self.enabled and not self._active.isdisjoint(self.SUSPENDING)
+
+    @property
+    def scale(self) -> float:
+        if not self.enabled:
+            return 1.0
+        scale = 1.0
+        for condition, multiplier in self.multipliers.items():
+            if condition in self._active:
+                scale *= multiplier
+        return scale
+
+    def set(self, condition: PollingCondition, active: bool) -> bool:
+        """Update one condition; return True if pollers need to reschedule."""
+        before = (self.suspended, self.scale)
+        if active:
+            self._active.add(condition)
+        else:
+            self._active.discard(condition)
+        return (self.suspended, self.scale) != before
+
+    def interval(self, base: int) -> int | None:
+        """Return the scaled interval in ms, or None while polling is suspended."""
+        if self.suspended:
+            return None
+        return round(base * self.scale)
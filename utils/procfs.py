@@ -0,0 +1,164 @@
+import contextlib
+import glob
+import os
+from typing import NamedTuple
+
+from loguru import logger
+
+
+class MemoryInfo(NamedTuple):
+    """The subset of `psutil.virtual_memory()` the widgets use."""
+
+    total: int
+    available: int
+    percent: float
+    used: int
+
+
+class CpuFrequency(NamedTuple):
+    """Average cpu frequency in MHz, shaped like `psutil.cpu_freq()`."""
+
+    current: float
+    min: float
+    max: float
+
+
+class ProcStatsReader:
+    """Read cpu, memory and frequency metrics straight from /proc and /sys.
+
+    Every file is opened once and re-read with `preadv` at offset 0 into a
+    preallocated buffer, so a sample costs a handful of syscalls and only the
+    fields the widgets show are parsed. Construction raises `OSError` when the
+    files are not there, in which case callers should fall back to psutil.
+    """
+
+    def __init__(self, proc_root: str = "/proc", sys_root: str = "/sys"):
+        self._buffer = bytearray(4096)
+        self._small_buffer = bytearray(32)
+
+        self._stat_fd = os.open(f"{proc_root}/stat", os.O_RDONLY | os.O_CLOEXEC)
+        self._meminfo_fd = os.open(f"{proc_root}/meminfo", os.O_RDONLY | os.O_CLOEXEC)
+
+        self._last_busy = 0
+        self._last_total = 0
+
+        self._freq_fds: list[int] = []
+        self._freq_min = 0.0
+        self._freq_max = 0.0
+
+        policies = sorted(glob.glob(f"{sys_root}/devices/system/cpu/cpufreq/policy*"))
+        for policy in policies:
+            try:
+                self._freq_fds.append(
+                    os.open(f"{policy}/scaling_cur_freq", os.O_RDONLY | os.O_CLOEXEC)
+                )
+            except OSError:
+                continue
+
+        if policies:
+            # The hardware limits do not change at runtime, read them once
+            self._freq_min = self._read_static_khz(policies, "cpuinfo_min_freq")
+            self._freq_max = self._read_static_khz(policies, "cpuinfo_max_freq")
+
+        logger.debug(
+            f"[ProcStats] Reading from {proc_root} with "
+            f"{len(self._freq_fds)} cpufreq policies"
+        )
+
+    @property
+    def has_cpu_freq(self) -> bool:
+        return bool(self._freq_fds)
+
+    def close(self):
+        for fd in (self._stat_fd, self._meminfo_fd, *self._freq_fds):
+            with contextlib.suppress(OSError):
+                os.close(fd)
+        self._freq_fds = []
+
+    def _read(self, fd: int, buffer: bytearray) -> int:
+        return os.preadv(fd, [buffer], 0)
+
+    def _read_static_khz(self, policies: list[str], name: str) -> float:
+        values = []
+        for policy in policies:
+            try:
+                with open(f"{policy}/{name}", "rb") as f:
+                    values.append(int(f.read()))
+            except (OSError, ValueError):
+                continue
+        return (sum(values) / len(values)) / 1000 if values else 0.0
+
+    def cpu_percent(self) -> float:
+        """Return system-wide cpu usage since the previous call.
+
+        Mirrors `psutil.cpu_percent()`: the first call has nothing to compare
+        against and returns 0.0.
+        """
+        buffer = self._buffer
+        size = self._read(self._stat_fd, buffer)
+        end = buffer.find(b"\n", 0, size)
+
+        # "cpu  user nice system idle iowait irq softirq steal guest guest_nice"
+        times = [int(value) for value in buffer[4 : end if end != -1 else size].split()]
+
+        # guest and guest_nice are already accounted for in user and nice
+        total = sum(times[:8])
+        busy = total - times[3] - (times[4] if len(times) > 4 else 0)
+
+        total_delta = total - self._last_total
+        busy_delta = busy - self._last_busy
+        first_call = self._last_total == 0
+
+        self._last_total = total
+        self._last_busy = busy
+
+        if first_call or total_delta <= 0:
+            return 0.0
+
+        return round(min(max(busy_delta / total_delta * 100, 0.0), 100.0), 1)
+
+    def virtual_memory(self) -> MemoryInfo:
+        buffer = self._buffer
+        size = self._read(self._meminfo_fd, buffer)
+
+        total = self._meminfo_field(buffer, size, b"MemTotal:")
+        available = self._meminfo_field(buffer, size, b"MemAvailable:")
+
+        if available is None:
+            # Kernels older than 3.14 do not export MemAvailable
+            available = self._meminfo_field(buffer, size, b"MemFree:") or 0
+
+        total = total or 0
+        percent = round((total - available) / total * 100, 1) if total else 0.0
+
+        # psutil >= 6, the versions this project requires, also reports `used`
+        # as total - available on Linux, so both backends agree
+        return MemoryInfo(total, available, percent, total - available)
+
+    def _meminfo_field(self, buffer: bytearray, size: int, key: bytes) -> int | None:
+        start = buffer.find(key, 0, size)
+        if start == -1:
+            return None
+        end = buffer.find(b"\n", start, size)
+        # "MemTotal:       16318412 kB"
+        value = buffer[start + len(key) : end if end != -1 else size].split()[0]
+        return int(value) * 1024
+
+    def cpu_freq(self) -> CpuFrequency | None:
+        if not self._freq_fds:
+            return None
+
+        buffer = self._small_buffer
+        values = []
+        for fd in self._freq_fds:
+            try:
+                size = self._read(fd, buffer)
+                values.append(int(buffer[:size]))
+            except (OSError, ValueError):
+                continue
+
+        if not values:
+            return None
+
+        current = (sum(values) / len(values)) / 1000
+        return CpuFrequency(current, self._freq_min, self._freq_max)
@@ -0,0 +1,132 @@
+import math
+from itertools import count
+from typing import Callable, Literal
+
+Alignment = Literal["second", "minute"]
+
+ALIGNMENT_SECONDS = {"second": 1, "minute": 60}
+
+# Unaligned tasks may run up to this fraction of their interval late, which lets
+# tasks with nearby deadlines share a wakeup
+SLACK_RATIO = 0.1
+MAX_SLACK = 1.0
+
+
+class ScheduledTask:
+    """A callback the scheduler runs every `interval` ms."""
+
+    __slots__ = (
+        "align",
+        "callback",
+        "deadline",
+        "id",
+        "interval",
+        "missed",
+        "slack",
+        "widget",
+    )
+
+    def __init__(
+        self,
+        task_id: int,
+        interval: int,
+        callback: Callable,
+        align: Alignment | None = None,
+        widget=None,
+    ):
+        self.id = task_id
+        self.interval = max(interval, 1) / 1000
+        self.callback = callback
+        self.align = align
+        self.widget = widget
+        # Clock-like tasks must never show the previous second or minute
+        self.slack = 0.0 if align else min(self.interval * SLACK_RATIO, MAX_SLACK)
+        self.deadline = 0.0
+        self.missed = False
+
+    def period(self, scale: float = 1.0) -> float:
+        # Stretching an aligned clock would make it skip visible ticks
+        return self.interval if self.align else self.interval * scale
+
+    def next_deadline(self, now: float, scale: float = 1.0) -> float:
+        """Return the first deadline after `now`, on a boundary if aligned."""
+        if self.align is None:
+            return now + self.period(scale)
+        unit = ALIGNMENT_SECONDS[self.align]
+        step = max(math.ceil(self.interval / unit), 1) * unit
+        return (now // step + 1) * step
+
+    def advance(self, now: float, scale: float = 1.0):
+        """Move the deadline past `now` once the task ran.
+
+        Unaligned tasks step from their previous deadline, so running within
+        the slack delays a single tick instead of every following one.
+        """
+        if self.align is not None:
+            self.deadline = self.next_deadline(now, scale)
+            return
+        period = self.period(scale)
+        self.deadline += period
+        if self.deadline <= now:
+            # Skip the deadlines missed, e.g. while suspended
+            self.deadline += ((now - self.deadline) // period + 1) * period
+
+
+class TickSchedule:
+    """Deadline bookkeeping for the tick scheduler, in wall-clock seconds.
+
+    The schedule only decides when to wake up and which tasks are due; the
+    caller owns the actual timer.
+    """
+
+    def __init__(self):
+        self._tasks: dict[int, ScheduledTask] = {}
+        self._ids = count(1)
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    @property
+    def tasks(self) -> list[ScheduledTask]:
+        return list(self._tasks.values())
+
+    def get(self, task_id: int) -> ScheduledTask | None:
+        return self._tasks.get(task_id)
+
+    def add(
+        self,
+        interval: int,
+        callback: Callable,
+        now: float,
+        align: Alignment | None = None,
+        widget=None,
+        scale: float = 1.0,
+    ) -> ScheduledTask:
+        task = ScheduledTask(next(self._ids), interval, callback, align, widget)
+        task.deadline = task.next_deadline(now, scale)
+        self._tasks[task.id] = task
+        return task
+
+    def remove(self, task_id: int) -> ScheduledTask | None:
+        return self._tasks.pop(task_id, None)
+
+    def next_wakeup(self) -> float | None:
+        """Return the latest time that still runs every task within its slack."""
+        if not self._tasks:
+            return None
+        return min(task.deadline + task.slack for task in self._tasks.values())
+
+    def pop_due(self, now: float, scale: float = 1.0) -> list[ScheduledTask]:
+        """Return the tasks due at `now`, oldest deadline first, and reschedule them."""
+        due = []
+        for task in self._tasks.values():
+            if task.deadline <= now:
+                due.append(task)
+            elif task.deadline - now > task.period(scale) + task.slack:
+                # The wall clock went backwards, do not wait for the old deadline
+                task.deadline = task.next_deadline(now, scale)
+
+        due.sort(key=lambda task: task.deadline)
+        for task in due:
+            task.advance(now, scale)
+        return due
@@ -0,0 +1,154 @@
+import contextlib
+import glob
+import os
+import time
+
+from loguru import logger
+
+
+class TemperatureSensor:
+    """A single temperature input resolved from a hwmon (or thermal) name.
+
+    The name is matched the same way `psutil.sensors_temperatures()` keys its
+    result, and the last input of that device is used, which is what the cpu
+    widget used to pick. Once resolved, a sample is one `preadv` of one file.
+    The tree is only rescanned when that file disappears or, while the sensor
+    is unresolved, when the set of hwmon devices changes.
+    """
+
+    # How often an unresolved sensor checks for newly plugged devices
+    RESCAN_INTERVAL = 10
+
+    def __init__(
+        self,
+        name: str,
+        hwmon_root: str = "/sys/class/hwmon",
+        thermal_root: str = "/sys/class/thermal",
+    ):
+        self.name = name
+        self.path: str | None = None
+
+        self._hwmon_root = hwmon_root
+        self._thermal_root = thermal_root
+        self._fd: int | None = None
+        self._buffer = bytearray(16)
+        self._devices: set[str] = set()
+        self._last_scan = 0.0
+
+        self.resolve()
+
+    def _list_devices(self) -> set[str]:
+        try:
+            return set(os.listdir(self._hwmon_root))
+        except OSError:
+            return set()
+
+    def _find_input(self) -> str | None:
+        if not self.name:
+            return None
+
+        inputs = glob.glob(f"{self._hwmon_root}/hwmon*/temp*_input")
+        inputs.extend(glob.glob(f"{self._hwmon_root}/hwmon*/device/temp*_input"))
+
+        matches = [
+            path
+            for path in inputs
+            if _read_text(os.path.join(os.path.dirname(path), "name")) == self.name
+        ]
+        if matches:
+            # Order like psutil does, by the "tempN" prefix
+            return max(matches, key=lambda path: path.removesuffix("_input"))
+
+        if inputs:
+            return None
+
+        # Same fallback as psutil when the machine exposes no hwmon inputs
+        zones = sorted(glob.glob(f"{self._thermal_root}/thermal_zone*"))
+        matches = [zone for zone in zones if _read_text(f"{zone}/type") == self.name]
+        return f"{matches[-1]}/temp" if matches else None
+
+    def resolve(self) -> str | None:
+        """Scan sysfs for the configured sensor and open its input file."""
+        self.close()
+        self._last_scan = time.monotonic()
+        self._devices = self._list_devices()
+        self.path = self._find_input()
+
+        if self.path is None:
+            logger.debug(f"[Sensors] No temperature input found for '{self.name}'")
+            return None
+
+        try:
+            self._fd = os.open(self.path, os.O_RDONLY | os.O_CLOEXEC)
+        except OSError as e:
+            logger.warning(f"[Sensors] Failed to open {self.path}: {e}")
+            self.path = None
+            return None
+
+        logger.debug(f"[Sensors] Resolved '{self.name}' to {self.path}")
+        return self.path
+
+    def _maybe_rescan(self):
+        if time.monotonic() - self._last_scan < self.RESCAN_INTERVAL:
+            return
+        self._last_scan = time.monotonic()
+        if self._list_devices() != self._devices:
+            self.resolve()
+
+    def _read_input(self) -> float:
+        size = os.preadv(self._fd, [self._buffer], 0)
+        return int(self._buffer[:size]) / 1000
+
+    def read(self) -> float | None:
+        """Return the current temperature in celsius, or None if unavailable."""
+        if self._fd is None:
+            self._maybe_rescan()
+            if self._fd is None:
+                return None
+
+        try:
+            return self._read_input()
+        except (OSError, ValueError):
+            # The device went away (or was re-enumerated), look it up again
+            if self.resolve() is None:
+                return None
+
+        try:
+            return self._read_input()
+        except (OSError, ValueError):
+            return None
+
+    def close(self):
+        if self._fd is not None:
+            with contextlib.suppress(OSError):
+                os.close(self._fd)
+            self._fd = None
+
+
+class SensorRegistry:
+    """Process-wide cache of resolved temperature sensors, keyed by name."""
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._sensors = {}
+        return cls._instance
+
+    def get(self, name: str) -> TemperatureSensor:
+        sensor = self._sensors.get(name)
+        if sensor is None:
+            sensor = self._sensors[name] = TemperatureSensor(name)
+        return sensor
+
+    def read(self, name: str) -> float | None:
+        return self.get(name).read()
+
+
+def _read_text(path: str) -> str | None:
+    try:
+        with open(path) as f:
+            return f.read().strip()
+    except OSError:
+        return None
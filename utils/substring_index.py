@@ -0,0 +1,61 @@
+from collections.abc import Iterable
+
+
+def trigrams(text: str) -> set[str]:
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+class SubstringIndex:
+    """Finds the first document with a field containing a query.
+
+    Fields are lower-cased once and their trigrams mapped to document
+    numbers, so a query of three characters or more only checks documents
+    that hold all of its trigrams. Results are memoized per query until the
+    index is rebuilt.
+    """
+
+    def __init__(self, documents: Iterable[Iterable[str | None]]):
+        self.fields: list[tuple[str, ...]] = []
+        self.postings: dict[str, set[int]] = {}
+        self._memo: dict[str, int | None] = {}
+
+        for number, fields in enumerate(documents):
+            normalized = tuple(field.lower() for field in fields if field)
+            self.fields.append(normalized)
+            for field in normalized:
+                for trigram in trigrams(field):
+                    self.postings.setdefault(trigram, set()).add(number)
+
+    def _candidates(self, query: str) -> Iterable[int]:
+        if len(query) < 3:
+            return range(len(self.fields))
+
+        candidates = None
+        # Rarest trigram first keeps the intersections small
+        for trigram in sorted(
+            trigrams(query), key=lambda t: len(self.postings.get(t, ()))
+        ):
+            posting = self.postings.get(trigram)
+            if not posting:
+                return ()
+            candidates = set(posting) if candidates is None else candidates & posting
+            if not candidates:
+                return ()
+        return sorted(candidates)
+
+    def find(self, query: str) -> int | None:
+        """Number of the first document with a field containing `query`."""
+        query = query.lower()
+        if query in self._memo:
+            return self._memo[query]
+
+        found = next(
+            (
+                number
+                for number in self._candidates(query)
+                if any(query in field for field in self.fields[number])
+            ),
+            None,
+        )
+        self._memo[query] = found
+        return found
@@ -0,0 +1,90 @@
+import contextlib
+import hashlib
+import os
+import threading
+
+# Thumbnails kept on disk before the least recently used are evicted
+THUMBNAIL_CACHE_SIZE = 32 * 1024 * 1024
+
+
+class ThumbnailCache:
+    """Thumbnail files in a directory, evicted by size in LRU order.
+
+    Files are named after the key they were stored under and their mtime
+    records the last use, so the order survives restarts.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = THUMBNAIL_CACHE_SIZE):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # Key -> (last use, size), read from the directory on first access
+        self._entries: dict[str, tuple[float, int]] | None = None
+
+    @staticmethod
+    def key(item_id: str, content: str) -> str:
+        """A file name for an item, changing with its content."""
+        digest = hashlib.sha1(content.encode(), usedforsecurity=False).hexdigest()
+        return f"{item_id}-{digest[:16]}"
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.png")
+
+    def _scan(self) -> dict[str, tuple[float, int]]:
+        if self._entries is None:
+            self._entries = {}
+            with contextlib.suppress(OSError), os.scandir(self.directory) as it:
+                for entry in it:
+                    if entry.name.endswith(".png") and entry.is_file():
+                        stat = entry.stat()
+                        self._entries[entry.name[:-4]] = (stat.st_mtime, stat.st_size)
+        return self._entries
+
+    @property
+    def size(self) -> int:
+        with self._lock:
+            return sum(size for _, size in self._scan().values())
+
+    def get(self, key: str) -> str | None:
+        """Path of a stored thumbnail, marked as used, None if missing."""
+        with self._lock:
+            entries = self._scan()
+            if key not in entries:
+                return None
+            path = self._path(key)
+            try:
+                os.utime(path)
+                # Reinserted last so ties in mtime still sort by use
+                entries[key] = (os.stat(path).st_mtime, entries.pop(key)[1])
+            except OSError:
+                del entries[key]
+                return None
+            return path
+
+    def put(self, key: str, data: bytes) -> str:
+        path = self._path(key)
+        os.makedirs(self.directory, exist_ok=True)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, path)
+
+        with self._lock:
+            entries = self._scan()
+            entries.pop(key, None)
+            entries[key] = (os.stat(path).st_mtime, len(data))
+            self._evict(entries, keep=key)
+        return path
+
+    def _evict(self, entries: dict[str, tuple[float, int]], keep: str):
+        total = sum(size for _, size in entries.values())
+        if total <= self.max_bytes:
+            return
+        for key in sorted(entries, key=lambda k: entries[k][0]):
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(self._path(key))
+            total -= entries.pop(key)[1]
@@ -0,0 +1,65 @@
+from bisect import bisect_right
+from collections.abc import Sequence
+from itertools import accumulate
+
+
+def row_count(count: int, columns: int) -> int:
+    return (count + columns - 1) // columns
+
+
+class RowOffsets:
+    """Vertical position of every row of a virtualized list or grid."""
+
+    def __init__(self, heights: Sequence[int]):
+        self.heights = list(heights)
+        self.offsets = list(accumulate(self.heights, initial=0))
+
+    def __len__(self) -> int:
+        return len(self.heights)
+
+    @property
+    def total(self) -> int:
+        return self.offsets[-1]
+
+    def top(self, row: int) -> int:
+        return self.offsets[row]
+
+    def row_at(self, y: float) -> int:
+        """The row under `y`, clamped to the existing rows."""
+        if not self.heights:
+            return 0
+        return min(max(bisect_right(self.offsets, y) - 1, 0), len(self.heights) - 1)
+
+    def visible(self, value: float, page: float, overscan: int = 0) -> range:
+        """Rows intersecting the page starting at `value`, plus `overscan`."""
+        if not self.heights:
+            return range(0)
+        first = self.row_at(value)
+        last = self.row_at(value + max(page, 1) - 1)
+        return range(max(first - overscan, 0), min(last + overscan + 1, len(self)))
+
+    def scroll_to(self, row: int, value: float, page: float) -> float:
+        """The smallest scroll change that brings `row` into view."""
+        top = self.offsets[row]
+        bottom = self.offsets[row + 1]
+        if top < value:
+            return top
+        if bottom > value + page:
+            return max(bottom - page, 0)
+        return value
+
+
+def move_selection(index: int, count: int, columns: int, dx: int, dy: int) -> int:
+    """Move a selection through a grid of `count` items, -1 means none.
+
+    Horizontal moves wrap between rows. Moving down past the end lands on
+    the last item, moving up from the first row stays put.
+    """
+    if count <= 0:
+        return -1
+    if index < 0:
+        return 0 if dx > 0 or dy > 0 else count - 1
+    moved = index + dx + dy * columns
+    if moved < 0:
+        return index if dy else 0
+    return min(moved, count - 1)
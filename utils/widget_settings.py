@@ -198,6 +198,7 @@ Dock = TypedDict(
         "layer": Layer,
         "anchor": Anchor,
         "show_when_no_windows": bool,
+        "intellihide": bool,
         "tooltip": bool,
     },
 )
@@ -239,7 +240,16 @@ Modules = TypedDict(
 # Bar configuration
 General = TypedDict(
     "General",
-    {"check_updates": bool, "debug": bool, "monitor_styles": bool},
+    {
+        "check_updates": bool,
+        "debug": bool,
+        "monitor_styles": bool,
+        "history_duration": int,
+        "history_resolution": int,
+        "adaptive_polling": bool,
+        "idle_polling_multiplier": int,
+        "battery_polling_multiplier": int,
+    },
 )
 
 # Cpu configuration
@@ -254,6 +264,7 @@ Cpu = TypedDict(
         "show_unit": bool,
         "round": bool,
         "graph_length": int,
+        "interval": int,
     },
 )
 
@@ -271,6 +282,7 @@ Memory = TypedDict(
         "graph": bool,
         "graph_length": int,
         "unit": Literal["kb", "mb", "gb", "tb"],
+        "interval": int,
     },
 )
 
@@ -287,6 +299,11 @@ NetworkUsage = TypedDict(
         "download_icon": str,
         "download": bool,
         "upload": bool,
+        "upload_threshold": int,
+        "download_threshold": int,
+        "kb_digits": int,
+        "mb_digits": int,
+        "smoothing": float,
     },
 )
 
@@ -302,6 +319,7 @@ Storage = TypedDict(
         "graph": bool,
         "graph_length": int,
         "unit": Literal["kb", "mb", "gb", "tb"],
+        "interval": int,
     },
 )
 
@@ -1,12 +1,9 @@
 import importlib
 from numbers import Number
-from time import sleep
 from typing import Literal
 
 import cairo  # For rendering the drag preview
 import gi
-import psutil
-from fabric import Fabricator
 from fabric.utils import bulk_connect
 from fabric.widgets.image import Image
 from fabric.widgets.label import Label
@@ -15,29 +12,11 @@ from gi.repository import Gdk, GdkPixbuf, GLib, Gtk
 
 from shared.animated.scale import AnimatedScale
 
-from .config import widget_config
 from .icons import symbolic_icons, text_icons
 
-storage_config = widget_config["widgets"]["storage"]
-
-
 gi.require_versions({"Gtk": "3.0", "Gdk": "3.0", "GdkPixbuf": "2.0"})
 
 
-# Function to get the system stats using psutil
-def stats_poll(fabricator):
-    while True:
-        yield {
-            "cpu_usage": round(psutil.cpu_percent(), 1),
-            "cpu_freq": psutil.cpu_freq(),
-            "temperature": psutil.sensors_temperatures(),
-            "ram_usage": round(psutil.virtual_memory().percent, 1),
-            "memory": psutil.virtual_memory(),
-            "disk": psutil.disk_usage(storage_config.get("path", "/")),
-        }
-        sleep(1)
-
-
 # Function to setup cursor hover
 def setup_cursor_hover(
     widget, cursor_name: Literal["pointer", "crosshair", "grab"] = "pointer"
@@ -254,13 +233,3 @@ def get_audio_icon_name(
             "text_icon": text_icons["volume"]["overamplified"],
             "icon": symbolic_icons["audio"]["volume"]["overamplified"],
         }
-
-
-# Create a fabricator to poll the system stats
-util_fabricator = Fabricator(poll_from=stats_poll, stream=True)
-
-
-reusable_fabricator = Fabricator(
-    interval=1000,  # ms
-    poll_from=lambda *_: "echo",  # Dummy function to keep it alive
-)
@@ -0,0 +1,96 @@
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+from loguru import logger
+
+from utils.thread import thread
+
+
+class _Job:
+    __slots__ = ("callback", "cancelled", "function", "key")
+
+    def __init__(self, key: Hashable, function: Callable, callback: Callable):
+        self.key = key
+        self.function = function
+        self.callback = callback
+        self.cancelled = False
+
+
+class WorkQueue:
+    """Keyed jobs run on the shared thread pool, at most `workers` at a time.
+
+    The most recently submitted job starts first, as it is usually the one
+    the user is looking at. A cancelled job is dropped if it hasn't started,
+    otherwise it runs to the end but its callback isn't called. Callbacks
+    run on the worker thread with the job's result.
+    """
+
+    def __init__(self, workers: int = 2, submit: Callable = thread):
+        self.workers = max(workers, 1)
+        self._submit = submit
+        self._lock = threading.Lock()
+        self._pending: OrderedDict[Hashable, _Job] = OrderedDict()
+        self._running: dict[Hashable, _Job] = {}
+        self._active = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._pending) + len(self._running)
+
+    def submit(
+        self,
+        key: Hashable,
+        function: Callable[[], Any],
+        callback: Callable[[Any], None],
+    ):
+        """Queue `function`, unless a job with this key is queued or running."""
+        with self._lock:
+            running = self._running.get(key)
+            if running is not None and not running.cancelled:
+                running.callback = callback
+                return
+            if key in self._pending:
+                self._pending[key].callback = callback
+                self._pending.move_to_end(key)
+                return
+            self._pending[key] = _Job(key, function, callback)
+            if self._active >= self.workers:
+                return
+            self._active += 1
+        self._submit(self._drain)
+
+    def cancel(self, key: Hashable):
+        with self._lock:
+            self._pending.pop(key, None)
+            running = self._running.get(key)
+            if running is not None:
+                running.cancelled = True
+
+    def clear(self):
+        with self._lock:
+            self._pending.clear()
+            for job in self._running.values():
+                job.cancelled = True
+
+    def _drain(self):
+        while True:
+            with self._lock:
+                if not self._pending:
+                    self._active -= 1
+                    return
+                _, job = self._pending.popitem()
+                self._running[job.key] = job
+            try:
+                result = job.function()
+            except Exception as e:
+                logger.exception(f"[WorkQueue] Job {job.key} failed: {e}")
+                result = None
+                job.cancelled = True
+            finally:
+                with self._lock:
+                    if self._running.get(job.key) is job:
+                        del self._running[job.key]
+            if not job.cancelled:
+                job.callback(result)
@@ -1,28 +1,34 @@
-import os
-import re
+import contextlib
 import subprocess
-import tempfile
-from urllib.parse import unquote, urlparse
 
 import gi
-from fabric.utils import remove_handler
 from fabric.widgets.box import Box
 from fabric.widgets.button import Button
 from fabric.widgets.entry import Entry
 from fabric.widgets.image import Image
 from fabric.widgets.label import Label
-from fabric.widgets.scrolledwindow import ScrolledWindow
 from gi.repository import Gdk, GdkPixbuf, GLib
 from loguru import logger
 
-from shared.list import ListBox
+from services.clipboard import ClipboardHistoryService
+from shared.virtual_list import VirtualList
 from shared.widget_container import ButtonWidget
+from utils.cliphist import ClipSearch, file_path, slot_text
+from utils.constants import CLIPBOARD_THUMBNAIL_DIRECTORY
+from utils.icon_cache import IconCache
+from utils.thumbnail_cache import ThumbnailCache
 from utils.widget_utils import nerd_font_icon
+from utils.work_queue import WorkQueue
 
 gi.require_versions({"Gdk": "3.0", "GdkPixbuf": "2.0"})
 
+PREVIEW_SIZE = 72
+# Image previews decoded at the same time
+PREVIEW_WORKERS = 2
+
+thumbnails = ThumbnailCache(CLIPBOARD_THUMBNAIL_DIRECTORY)
+
 
-# TODO: add scrolled pagination
 class ClipHistoryMenu(Box):
     """A widget to display and manage clipboard history."""
 
@@ -35,25 +41,14 @@ class ClipHistoryMenu(Box):
             **kwargs,
         )
 
-        # Create a temporary directory for image icons
-        self.tmp_dir = tempfile.mkdtemp(prefix="cliphist-")
-        self.image_cache = {}  # Cache for image previews
-
-        self.selected_index = -1  # Track the selected item index
-        self._arranger_handler = 0
-        self.clipboard_items = []
-        self._loading = False
-        self._pending_updates = False
-
-        # Pagination state, reset for new scan
-        self.items_loaded = 0
-        self.batch_size = 7
-        self.loading = False
-        self.max_items = 0  # ← LIMIT HERE
+        # Image previews missing from the thumbnail cache, decoded in workers
+        self.previews = WorkQueue(workers=PREVIEW_WORKERS)
 
-        self._search_timer_id = 0  # Timer ID for search text change
-
-        self.viewport = ListBox(name="viewport", spacing=4, orientation="v")
+        # The history is kept up to date by the service, shared by all menus
+        self.service = ClipboardHistoryService()
+        self.service.connect("changed", self._on_history_changed)
+        # Each keystroke narrows the previous matches, no need to debounce
+        self.search = ClipSearch(self.service.history)
 
         self.search_entry = Entry(
             name="search-entry",
@@ -63,16 +58,49 @@ class ClipHistoryMenu(Box):
             on_key_press_event=self.on_search_entry_key_press,
         )
 
-        self.search_entry.connect("notify::text", self._on_search_text_changed)
+        self.search_entry.connect("notify::text", self.filter_items)
 
         self.search_entry.props.xalign = 0.1
 
-        self.scrolled_window = ScrolledWindow(
+        # Only the visible rows have widgets, they are rebound on scroll
+        self.viewport = VirtualList(
             name="scrolled-window",
+            create_cell=self.create_clipboard_slot,
+            bind_cell=self.bind_clipboard_slot,
+            unbind_cell=self.unbind_clipboard_slot,
+            on_activate=lambda item: self.paste_item(item.id),
+            item_height=lambda item, height: (
+                max(height, PREVIEW_SIZE + 16) if item.kind != "text" else height
+            ),
             spacing=10,
             min_content_size=(300, 105),
             max_content_size=(300, 105),
-            child=self.viewport,
+        )
+
+        self.empty_box = Box(
+            name="no-clip-container",
+            orientation="v",
+            h_align="center",
+            v_align="center",
+            h_expand=True,
+            spacing=10,
+            v_expand=True,
+            visible=False,
+            children=[
+                Image(
+                    name="no-clip-icon",
+                    icon_name="clipboard-symbolic",
+                    icon_size=32,
+                    h_align="center",
+                    v_align="center",
+                ),
+                Label(
+                    name="no-clip",
+                    label="Clipboard history is empty",
+                    h_align="center",
+                    v_align="center",
+                ),
+            ],
         )
 
         self.header_box = Box(
@@ -97,326 +125,156 @@ class ClipHistoryMenu(Box):
             orientation="v",
             children=[
                 self.header_box,
-                self.scrolled_window,
+                self.viewport,
+                self.empty_box,
             ],
         )
 
         self.add(self.history_box)
         self.open()  # Load items when the widget is created
 
-    def load_more_items(self, aps):
-        if self.loading or self.items_loaded >= self.max_items:
-            return
-        self.loading = True
-
-        items_to_add = min(self.batch_size, self.max_items - self.items_loaded)
-
-        for i in range(self.items_loaded, self.items_loaded + items_to_add):
-            notification_item = self.make_button_from_ap(aps[i])
-            self.viewport.add(notification_item)
-
-        self.items_loaded += items_to_add
-        self.loading = False
-
-    def _on_search_text_changed(self, entry, pspec):
-        # Remove any existing pending filter operation
-        if self._search_timer_id > 0:
-            GLib.source_remove(self._search_timer_id)
-            self._search_timer_id = 0
-
-        # Start a new timer to filter after a delay
-        self._search_timer_id = GLib.timeout_add(
-            250,  # Milliseconds delay (e.g., 250ms)
-            lambda: self._perform_filter_after_delay(entry),
-        )
-
-    def _perform_filter_after_delay(self, entry):
-        self.filter_items(entry, None)  # Call the actual filter method
-        self._search_timer_id = 0  # Reset the timer ID
-        return False  # Do not repeat the timeout
-
     def close(self, *_):
         """Close the clipboard history panel"""
-        self.viewport.children = []
-        self.selected_index = -1  # Reset selection
+        self.viewport.set_items([])
+        self.previews.clear()
 
     def open(self):
-        """Open the clipboard history panel and load items"""
-        if self._loading:
-            return
-        self._loading = True
+        """Open the clipboard history panel and show the current history"""
         self.search_entry.set_text("")  # Clear search
         self.search_entry.grab_focus()
-        # Start loading in background using GLib.idle_add
-        GLib.idle_add(self._load_clipboard_items_thread)
-
-    def _load_clipboard_items_thread(self):
-        """Worker for loading clipboard items, now runs in main loop via idle_add"""
-        try:
-            result = subprocess.run(
-                ["cliphist", "list"], capture_output=True, check=True
-            )
-            # Decode stdout with error handling
-            stdout_str = result.stdout.decode("utf-8", errors="replace")
-            lines = stdout_str.strip().split("\n")
-            new_items = []
-            for line in lines:
-                if not line or "<meta http-equiv" in line:
-                    continue
-                new_items.append(line)
-            self._update_items(new_items)
-        except subprocess.CalledProcessError as e:
-            logger.exception(f"Error loading clipboard history: {e}")
-        except Exception as e:
-            logger.exception(f"Unexpected error: {e}")
-        finally:
-            self._loading = False
-            if self._pending_updates:
-                self._pending_updates = False
-                GLib.idle_add(self._load_clipboard_items_thread)
-        return False  # Ensure idle_add does not repeat
-
-    def _update_items(self, new_items):
-        """Update the items list from main thread"""
-        self.clipboard_items = new_items
         self.display_clipboard_items()
 
-    def display_clipboard_items(self, filter_text=""):
-        """Display clipboard items in the viewport"""
-        remove_handler(self._arranger_handler) if self._arranger_handler else None
-        self.viewport.remove_all()
-        self.selected_index = -1  # Reset selection
-
-        # Filter items if search text is provided
-        filtered_items = []
-        for item in self.clipboard_items:
-            # Extract just the content part (after the first tab)
-            content = item.split("\t", 1)[1] if "\t" in item else item
-            if filter_text.lower() in content.lower():
-                filtered_items.append(item)
-
-        # Show message if no items are found
-        if not filtered_items:
-            # Create a container box to better center the message
-            container = Box(
-                name="no-clip-container",
-                orientation="v",
-                h_align="center",
-                v_align="center",
-                h_expand=True,
-                spacing=10,
-                v_expand=True,
-            )
-
-            # Show a message if no clipboard items
-            label = Label(
-                name="no-clip",
-                label="Clipboard history is empty",
-                h_align="center",
-                v_align="center",
-            )
-            image = Image(
-                name="no-clip-icon",
-                icon_name="clipboard-symbolic",
-                icon_size=32,
-                h_align="center",
-                v_align="center",
-            )
-
-            container.add(image)
-            container.add(label)
-            self.viewport.add(container)
+    def _on_history_changed(self, _, added, removed):
+        # A closed menu is rendered again when opened
+        if not self.get_mapped():
+            return
+        filter_text = self.search_entry.get_text()
+        if removed or not self.service.history.ends_with(added):
+            self.display_clipboard_items(filter_text)
             return
 
-        # Display items in batches to prevent UI freeze
-        self._display_items_batch(filtered_items, 0, 10)
+        # Older entries streamed in below the ones shown
+        filter_text = filter_text.lower()
+        matches = [entry for entry in added if filter_text in entry.lowered]
+        if matches:
+            self.empty_box.set_visible(False)
+            self.viewport.set_visible(True)
+            self.viewport.extend_items(matches)
 
-    def _display_items_batch(self, items, start, batch_size):
-        """Display items in batches to keep UI responsive"""
-        end = min(start + batch_size, len(items))
+    def display_clipboard_items(self, filter_text=""):
+        """Display clipboard items in the viewport"""
+        filtered_items = self.search.search(filter_text)
+        selected_item = self.viewport.selected_item
 
-        for i in range(start, end):
-            item = items[i]
-            self.viewport.add(self.create_clipboard_item(item))
+        # Show message if no items are found
+        self.empty_box.set_visible(not filtered_items)
+        self.viewport.set_visible(bool(filtered_items))
 
-        # Schedule next batch if there are more items
-        if end < len(items):
-            GLib.idle_add(self._display_items_batch, items, end, batch_size)
-        else:
-            # Auto-select first item if we have filter text
-            if self.search_entry.get_text() and self.viewport.get_children():
-                self.update_selection(0)
-
-    def create_clipboard_item(self, item):
-        """Create a button for a clipboard item"""
-        # Extract ID and content
-        parts = item.split("\t", 1)
-        item_id = parts[0] if len(parts) > 1 else "0"
-        content = parts[1] if len(parts) > 1 else item
-
-        # Truncate content for display
-        display_text = content.strip()
-        if len(display_text) > 100:
-            display_text = display_text[:97] + "..."
-
-        # Check if this is an image by examining the content
-        is_image = self.is_image_data(content)
-
-        is_file_image = self.is_file_image(content) and os.path.exists(
-            unquote(urlparse(content).path)
+        # Auto-select first item if we have filter text
+        self.viewport.set_items(
+            filtered_items, selected=0 if self.search_entry.get_text() else -1
         )
+        # Keep the selection on its item when the history changes under it
+        if selected_item in filtered_items:
+            self.viewport.select(filtered_items.index(selected_item))
 
-        if is_image:
-            # For images, create item with image preview
-            button = Button(
-                name="slot-button",
-                child=Box(
-                    name="slot-box",
-                    orientation="h",
-                    spacing=10,
-                    children=[
-                        Image(name="clip-icon", h_align="start"),  # Placeholder
-                        Label(
-                            name="clip-label",
-                            label="[Image]",
-                            ellipsization="end",
-                            v_align="center",
-                            h_align="start",
-                            h_expand=True,
-                        ),
-                    ],
-                ),
-                tooltip_text="Image in clipboard",
-                on_clicked=lambda *_, id=item_id: self.paste_item(id),
-            )
-            # Load image preview in background
-            self._load_image_preview_async(item_id, button)
-
-        elif is_file_image:
-            button = Button(
-                name="slot-button",
-                child=Box(
-                    name="slot-box",
-                    orientation="h",
-                    spacing=10,
-                    children=[
-                        Image(
-                            name="clip-icon",
-                            h_align="start",
-                            image_file=unquote(urlparse(content).path),
-                            size=72,
-                        ),  # Placeholder
-                        Label(
-                            name="clip-label",
-                            label="[File]",
-                            ellipsization="end",
-                            v_align="center",
-                            h_align="start",
-                            h_expand=True,
-                        ),
-                    ],
-                ),
-                tooltip_text="File in clipboard",
-                on_clicked=lambda *_, id=item_id: self.paste_item(id),
-            )
-        else:
-            # For text, create regular item
-            button = self.create_text_item_button(item_id, display_text)
-
-        # Add key press event handler for Enter key
-        button.connect(
-            "key-press-event",
-            lambda widget, event, id=item_id: self.on_item_key_press(widget, event, id),
+    def create_clipboard_slot(self, **kwargs):
+        """Create an empty slot, filled in by bind_clipboard_slot"""
+        button = Button(
+            name="slot-button",
+            child=Box(
+                name="slot-box",
+                orientation="h",
+                spacing=10,
+                children=[
+                    Image(name="clip-icon", h_align="start"),
+                    Label(
+                        name="clip-label",
+                        ellipsization="end",
+                        v_align="center",
+                        h_align="start",
+                        h_expand=True,
+                    ),
+                ],
+            ),
+            **kwargs,
         )
+        button.icon, button.label = button.get_child().get_children()
+        button.item_id = None
 
         # Make sure button can receive focus and key events
         button.set_can_focus(True)
         button.add_events(Gdk.EventMask.KEY_PRESS_MASK)
-
         return button
 
-    def _load_image_preview_async(self, item_id, button):
-        """Load image preview using GLib.idle_add instead of threads"""
-
-        def load_image():
+    def bind_clipboard_slot(self, button, item, _index):
+        """Show a clipboard item in a recycled slot"""
+        item_id = item.id
+        button.item_id = item_id
+        label, tooltip = slot_text(item)
+        button.label.set_label(label)
+        button.set_tooltip_text(tooltip)
+
+        if item.kind == "image":
+            # Decoded previews are kept on disk, others are decoded in workers
+            button.icon.clear()
+            key = ThumbnailCache.key(item_id, item.preview)
+            path = thumbnails.get(key)
+            if path is None:
+                self.previews.submit(
+                    item_id,
+                    lambda: self._decode_preview(item_id, key),
+                    lambda pixbuf: GLib.idle_add(
+                        self._update_image_button, button, item_id, pixbuf
+                    ),
+                )
+            else:
+                with contextlib.suppress(GLib.Error):
+                    button.icon.set_from_pixbuf(GdkPixbuf.Pixbuf.new_from_file(path))
+            button.icon.show()
+        elif item.kind == "file":
             try:
-                if item_id in self.image_cache:
-                    pixbuf = self.image_cache[item_id]
-                else:
-                    result = subprocess.run(
-                        ["cliphist", "decode", item_id], capture_output=True, check=True
-                    )
-                    loader = GdkPixbuf.PixbufLoader()
-                    loader.write(result.stdout)
-                    loader.close()
-                    pixbuf = loader.get_pixbuf()
-                    width, height = pixbuf.get_width(), pixbuf.get_height()
-                    max_size = 72
-                    if width > height:
-                        new_width = max_size
-                        new_height = int(height * (max_size / width))
-                    else:
-                        new_height = max_size
-                        new_width = int(width * (max_size / height))
-                    pixbuf = pixbuf.scale_simple(
-                        new_width, new_height, GdkPixbuf.InterpType.BILINEAR
-                    )
-                    self.image_cache[item_id] = pixbuf
-                self._update_image_button(button, pixbuf)
-            except Exception as e:
-                logger.exception(f"Error loading image preview: {e}")
-            return False
+                button.icon.set_from_pixbuf(
+                    IconCache().load_file(file_path(item.preview), PREVIEW_SIZE)
+                )
+            except GLib.Error:
+                button.icon.clear()
+            button.icon.show()
+        else:
+            button.icon.hide()
 
-        GLib.idle_add(load_image)
+    def unbind_clipboard_slot(self, button):
+        """Stop decoding the preview of an item scrolled out of view"""
+        if button.item_id is not None:
+            self.previews.cancel(button.item_id)
 
-    def _update_image_button(self, button, pixbuf):
-        """Update the button with the loaded image preview"""
-        box = button.get_child()
-        if box and len(box.get_children()) > 0:
-            image_widget = box.get_children()[0]
-            if isinstance(image_widget, Image):
-                image_widget.set_from_pixbuf(pixbuf)
-
-    def create_text_item_button(self, item_id, display_text):
-        """Create a button for a text clipboard item"""
-        return Button(
-            name="slot-button",
-            child=Label(
-                name="clip-label",
-                label=display_text,
-                ellipsization="end",
-                v_align="center",
-                h_align="start",
-                h_expand=True,
-            ),
-            tooltip_text=display_text,
-            on_clicked=lambda *_: self.paste_item(item_id),
+    def _decode_preview(self, item_id, key):
+        """Worker decoding an image item into a thumbnail, saved to disk"""
+        result = subprocess.run(
+            ["cliphist", "decode", item_id], capture_output=True, check=True
         )
-
-    def is_file_image(self, content):
-        # Check for common image data patterns
-        if content.startswith("file:///") and content.endswith(
-            (".png", ".jpg", ".jpeg", ".bmp", ".gif")
-        ):
-            return True
-
-    def is_image_data(self, content):
-        """Determine if clipboard content is likely an image"""
-
-        return (
-            content.startswith("data:image/")
-            or content.startswith("\x89PNG")
-            or content.startswith("GIF8")
-            or content.startswith("\xff\xd8\xff")  # JPEG
-            or re.match(r"^\s*<img\s+", content) is not None  # HTML image tag
-            or (
-                "binary" in content.lower()
-                and any(
-                    ext in content.lower()
-                    for ext in ["jpg", "jpeg", "png", "bmp", "gif"]
-                )
-            )
+        loader = GdkPixbuf.PixbufLoader()
+        loader.write(result.stdout)
+        loader.close()
+        pixbuf = loader.get_pixbuf()
+        width, height = pixbuf.get_width(), pixbuf.get_height()
+        scale = PREVIEW_SIZE / max(width, height)
+        pixbuf = pixbuf.scale_simple(
+            max(int(width * scale), 1),
+            max(int(height * scale), 1),
+            GdkPixbuf.InterpType.BILINEAR,
         )
+        _, data = pixbuf.save_to_bufferv("png", [], [])
+        with contextlib.suppress(OSError):
+            thumbnails.put(key, data)
+        return pixbuf
+
+    def _update_image_button(self, button, item_id, pixbuf):
+        """Update the button with the loaded image preview"""
+        # The slot may have been recycled for another item meanwhile
+        if button.item_id == item_id:
+            button.icon.set_from_pixbuf(pixbuf)
+        return False
 
     def paste_item(self, item_id):
         """Copy the selected item to the clipboard and close (GLib.idle_add)"""
@@ -435,34 +293,12 @@ class ClipHistoryMenu(Box):
         GLib.idle_add(paste)
 
     def delete_item(self, item_id):
-        """Delete the selected clipboard item (GLib.idle_add)"""
-
-        def delete():
-            try:
-                subprocess.run(["cliphist", "delete", item_id], check=True)
-                self._pending_updates = True
-                if not self._loading:
-                    GLib.idle_add(self._load_clipboard_items_thread)
-            except subprocess.CalledProcessError as e:
-                logger.exception(f"Error deleting clipboard item: {e}")
-            return False
-
-        GLib.idle_add(delete)
+        """Delete the selected clipboard item"""
+        self.service.delete(item_id)
 
     def clear_history(self, *_):
-        """Clear all clipboard history (GLib.idle_add)"""
-
-        def clear():
-            try:
-                subprocess.run(["cliphist", "wipe"], check=True)
-                self._pending_updates = True
-                if not self._loading:
-                    GLib.idle_add(self._load_clipboard_items_thread)
-            except subprocess.CalledProcessError as e:
-                logger.exception(f"Error clearing clipboard history: {e}")
-            return False
-
-        GLib.idle_add(clear)
+        """Clear all clipboard history"""
+        self.service.wipe()
 
     def filter_items(self, entry, *_):
         """Filter clipboard items based on search text"""
@@ -470,11 +306,7 @@ class ClipHistoryMenu(Box):
 
     def on_search_entry_key_press(self, widget, event):
         """Handle key presses in the search entry"""
-        if event.keyval == Gdk.KEY_Down:
-            self.move_selection(1)
-            return True
-        elif event.keyval == Gdk.KEY_Up:
-            self.move_selection(-1)
+        if self.viewport.handle_key(event.keyval):
             return True
         elif event.keyval in (Gdk.KEY_Return, Gdk.KEY_KP_Enter):
             self.use_selected_item()
@@ -487,112 +319,17 @@ class ClipHistoryMenu(Box):
             return True
         return False
 
-    def update_selection(self, new_index):
-        """Update the selected item in the viewport"""
-        children = self.viewport.get_children()
-
-        # Unselect current
-        if self.selected_index != -1 and self.selected_index < len(children):
-            current_button = children[self.selected_index]
-            current_button.get_style_context().remove_class("selected")
-
-        # Select new
-        if new_index != -1 and new_index < len(children):
-            new_button = children[new_index]
-            new_button.get_style_context().add_class("selected")
-            self.selected_index = new_index
-            self.scroll_to_selected(new_button)
-        else:
-            self.selected_index = -1
-
-    def move_selection(self, delta):
-        """Move the selection up or down"""
-        children = self.viewport.get_children()
-        if not children:
-            return
-
-        # Allow starting selection from nothing
-        if self.selected_index == -1 and delta == 1:
-            new_index = 0
-        else:
-            new_index = self.selected_index + delta
-
-        new_index = max(0, min(new_index, len(children) - 1))
-        self.update_selection(new_index)
-
-    def scroll_to_selected(self, button):
-        """Scroll to ensure the selected item is visible"""
-
-        def scroll():
-            adj = self.scrolled_window.get_vadjustment()
-            alloc = button.get_allocation()
-            if alloc.height == 0:
-                return False  # Retry if allocation isn't ready
-
-            y = alloc.y
-            height = alloc.height
-            page_size = adj.get_page_size()
-            current_value = adj.get_value()
-
-            # Calculate visible boundaries
-            visible_top = current_value
-            visible_bottom = current_value + page_size
-
-            if y < visible_top:
-                # Item above viewport - align to top
-                adj.set_value(y)
-            elif y + height > visible_bottom:
-                # Item below viewport - align to bottom
-                new_value = y + height - page_size
-                adj.set_value(new_value)
-            return False
-
-        GLib.idle_add(scroll)
-
     def use_selected_item(self, *_):
         """Use (paste) the selected clipboard item"""
-        children = self.viewport.get_children()
-        if (
-            not children
-            or self.selected_index == -1
-            or self.selected_index >= len(self.clipboard_items)
-        ):
-            return
-
-        # Get the item ID from the first part before the tab
-        item_line = self.clipboard_items[self.selected_index]
-        item_id = item_line.split("\t", 1)[0]
-        self.paste_item(item_id)
+        item = self.viewport.selected_item
+        if item is not None:
+            self.paste_item(item.id)
 
     def delete_selected_item(self):
         """Delete the selected clipboard item"""
-        children = self.viewport.get_children()
-        if not children or self.selected_index == -1:
-            return
-
-        # Get the item ID from the first part before the tab
-        item_line = self.clipboard_items[self.selected_index]
-        item_id = item_line.split("\t", 1)[0]
-        self.delete_item(item_id)
-
-    def on_item_key_press(self, widget, event, item_id):
-        """Handle key press events on clipboard items"""
-        if event.keyval in (Gdk.KEY_Return, Gdk.KEY_KP_Enter):
-            # Copy item to clipboard and close
-            self.paste_item(item_id)
-            return True
-        return False
-
-    def __del__(self):
-        """Clean up temporary files on destruction"""
-        try:
-            if hasattr(self, "tmp_dir") and os.path.exists(self.tmp_dir):
-                import shutil
-
-                shutil.rmtree(self.tmp_dir)
-            self.image_cache.clear()
-        except Exception as e:
-            logger.exception(f"Error cleaning up temporary files: {e}")
+        item = self.viewport.selected_item
+        if item is not None:
+            self.delete_item(item.id)
 
 
 class ClipHistoryWidget(ButtonWidget):
@@ -621,6 +358,9 @@ class ClipHistoryWidget(ButtonWidget):
             self.set_tooltip_text("Clipboard History")
 
         self.popup = None
+        self.menu = None
+        # Start following the history now so the menu opens on a loaded model
+        ClipboardHistoryService()
 
         self.connect(
             "clicked",
@@ -632,8 +372,11 @@ class ClipHistoryWidget(ButtonWidget):
         if self.popup is None:
             from shared.popover import Popover
 
+            self.menu = ClipHistoryMenu()
             self.popup = Popover(
-                content=ClipHistoryMenu(),
+                content=self.menu,
                 point_to=self,
             )
+        else:
+            self.menu.open()
         self.popup.open()
@@ -1,10 +1,7 @@
-import json
-import re
-
-from fabric.hyprland.widgets import HyprlandEvent, get_hyprland_connection
 from fabric.widgets.label import Label
 from loguru import logger
 
+from services.hyprland_state import HyprlandStateService
 from shared.widget_container import ButtonWidget
 from utils.constants import KBLAYOUT_MAP
 from utils.widget_utils import nerd_font_icon
@@ -28,44 +25,19 @@ class KeyboardLayoutWidget(ButtonWidget):
 
         self.container_box.add(self.kb_label)
 
-        self._hyprland_connection = get_hyprland_connection()
-
-        # all aboard...
-        if self._hyprland_connection.ready:
-            self.on_ready(None)
-        else:
-            self._hyprland_connection.connect("event::ready", self.on_ready)
-
-    def on_ready(self, _):
-        return self.get_keyboard(), logger.info(
-            "[Keyboard] Connected to the hyprland socket"
-        )
-
-    def on_activelayout(self, _, event: HyprlandEvent):
-        if len(event.data) < 2:
-            return logger.warning("[Keyboard] got invalid event data from hyprland")
-        keyboard, language = event.data
-        matched: bool = False
+        # Devices are part of the shared state, refetched on layout changes
+        self._hyprland_state = HyprlandStateService()
+        self._hyprland_state.connect("keyboard-changed", self.get_keyboard)
 
-        if re.match(self.keyboard, keyboard) and (matched := True):
-            self.kb_label.set_label(self.formatter.format(language=language))
+        if self._hyprland_state.ready:
+            self.get_keyboard()
 
-        return logger.debug(
-            f"[Keyboard] Keyboard: {keyboard}, Language: {language}, Match: {matched}"
-        )
-
-    def get_keyboard(self):
+    def get_keyboard(self, *_):
         try:
-            data = json.loads(
-                str(self._hyprland_connection.send_command("j/devices").reply.decode())
-            )
-
-            keyboards = data.get("keyboards", [])
-            if not keyboards:
+            main_kb = self._hyprland_state.main_keyboard
+            if main_kb is None:
                 return "Unknown"
 
-            main_kb = next((kb for kb in keyboards if kb.get("main")), keyboards[-1])
-
             layout = main_kb["active_keymap"]
 
             label = KBLAYOUT_MAP.get(layout, layout)
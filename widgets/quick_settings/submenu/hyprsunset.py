@@ -1,13 +1,11 @@
 from fabric.utils import cooldown, exec_shell_command_async
 
+from services.scheduler import TickScheduler
 from shared.buttons import QSChevronButton
 from shared.submenu import QuickSubMenu
 from utils.functions import is_app_running, toggle_command
 from utils.icons import text_icons
-from utils.widget_utils import (
-    create_scale,
-    reusable_fabricator,
-)
+from utils.widget_utils import create_scale
 
 
 class HyprSunsetSubMenu(QuickSubMenu):
@@ -36,7 +34,7 @@ class HyprSunsetSubMenu(QuickSubMenu):
 
         # Connect the slider immediately
         self.scale.connect("value-changed", self.on_scale_move)
-        reusable_fabricator.connect("changed", self.update_scale)
+        TickScheduler().register(1000, self.update_scale, widget=self)
 
     @cooldown(0.1)
     def on_scale_move(self, scale):
@@ -86,8 +84,7 @@ class HyprSunsetToggle(QSChevronButton):
 
         self.connect("action-clicked", self.on_action)
 
-        # reusing the fabricator to call specified intervals
-        reusable_fabricator.connect("changed", self.update_action_button)
+        TickScheduler().register(1000, self.update_action_button, widget=self)
 
     def on_action(self, *_):
         """Handle the action button click event."""
@@ -1,21 +1,50 @@
-import json
-
-from fabric.utils import exec_shell_command, exec_shell_command_async
+from fabric.utils import exec_shell_command_async
 from fabric.widgets.circularprogressbar import CircularProgressBar
 from fabric.widgets.label import Label
 from fabric.widgets.overlay import Overlay
 
 import utils.functions as helpers
+from services.gpu import GpuStatsService
 from services.networkspeed import NetworkSpeed
+from services.scheduler import TickScheduler
+from services.system_stats import SystemStatsService
 from shared.widget_container import ButtonWidget
+from utils.history import HistoryStore, MetricHistory
 from utils.icons import text_icons
 from utils.widget_utils import (
     get_bar_graph,
     nerd_font_icon,
-    util_fabricator,
 )
 
 
+def subscribe_to_stats(widget: ButtonWidget, metrics: list[str]) -> int:
+    """Feed `widget.update_ui` with the given metrics for as long as it lives."""
+    stats_service = SystemStatsService()
+    subscription_id = stats_service.subscribe(
+        metrics, widget.update_ui, interval=widget.config.get("interval", 1000)
+    )
+    widget.connect("destroy", lambda *_: stats_service.unsubscribe(subscription_id))
+    return subscription_id
+
+
+# Window summarized by the trend line in the tooltips, in seconds
+TREND_WINDOW = 300
+
+
+def graph_label(history: MetricHistory, length: int) -> str:
+    """Render the last `length` points of a history as bar glyphs."""
+    return "".join(get_bar_graph(value) for value in history.values(length))
+
+
+def trend_text(history: MetricHistory) -> str:
+    """Summarize the recent history of a percentage metric for a tooltip."""
+    summary = history.summary(history.window_for(TREND_WINDOW))
+    if summary is None:
+        return ""
+    _, peak, average = summary
+    return f"\n {TREND_WINDOW // 60}m avg: {average:.1f}% | peak: {peak:.1f}%"
+
+
 class CpuWidget(ButtonWidget):
     """A widget to display the current CPU usage."""
 
@@ -37,8 +66,9 @@ class CpuWidget(ButtonWidget):
             self.set_cpu_name,
         )
 
+        self.history = HistoryStore().get("cpu")
+
         if self.current_mode == "graph":
-            self.graph_values = []
             self.cpu_level_label = Label(
                 label="0%",
                 style_classes="panel-text",
@@ -81,52 +111,49 @@ class CpuWidget(ButtonWidget):
             )
             self.container_box.children = (self.icon, self.cpu_level_label)
 
-        # Set up a fabricator to call the update_label method when the CPU usage changes
-        util_fabricator.connect("changed", self.update_ui)
+        # Frequency and temperature are only shown in the tooltip
+        metrics = ["cpu_usage"]
+        if self.config.get("tooltip", False):
+            metrics += ["cpu_freq", "temperature"]
+
+        subscribe_to_stats(self, metrics)
 
     def set_cpu_name(self, cpu_name):
         self.cpu_name = cpu_name.strip()
 
-    def update_ui(self, _, value: dict):
+    def update_ui(self, value: dict):
         # Update the label with the current CPU usage if enabled
         frequency = value.get("cpu_freq")
         usage = value.get("cpu_usage")
 
         if self.current_mode == "graph":
-            self.graph_values.append(get_bar_graph(usage))
-
-            if len(self.graph_values) > self.config.get("graph_length", 4):
-                self.graph_values.pop(0)
-
-            self.cpu_level_label.set_label("".join(self.graph_values))
+            self.cpu_level_label.set_label(
+                graph_label(self.history, self.config.get("graph_length", 4))
+            )
 
         elif self.current_mode == "progress":
-            self.progress_bar.set_value(usage / 100.0)
+            self.progress_bar.set_value((usage or 0) / 100.0)
 
         else:
-            self.cpu_level_label.set_label(f"{usage}%")
+            self.cpu_level_label.set_label(f"{usage}%" if usage is not None else "N/A")
 
         # Update the tooltip with the memory usage details if enabled
         if self.config.get("tooltip", False):
+            # current temperature of the configured sensor
             temp = value.get("temperature")
 
-            temp = temp.get(self.config.get("sensor", ""))
-
             if temp is None:
-                return "N/A"
-
-            # current temperature
-            temp = temp.pop()[1]
-
-            temp = round(temp) if self.config.get("round", True) else temp
+                temp = "N/A"
+            else:
+                temp = round(temp) if self.config.get("round", True) else temp
 
-            is_celsius = self.config.get("temperature_unit", "celsius") == "celsius"
+                is_celsius = self.config.get("temperature_unit", "celsius") == "celsius"
 
-            temp = (
-                f"{temp} °C"
-                if is_celsius
-                else f"{helpers.celsius_to_fahrenheit(temp)} °F"
-            )
+                temp = (
+                    f"{temp} °C"
+                    if is_celsius
+                    else f"{helpers.celsius_to_fahrenheit(temp)} °F"
+                )
 
             if isinstance(frequency, (list, tuple)) and frequency:
                 freq_text = f"{round(frequency[0], 2)} MHz"
@@ -136,8 +163,9 @@ class CpuWidget(ButtonWidget):
             tooltip_text = (
                 f"{self.cpu_name}\n"
                 f" Temperature: {temp}\n"
-                f"󰾆 Utilization: {usage}\n"
+                f"󰾆 Utilization: {'N/A' if usage is None else usage}\n"
                 f" Clock Speed: {freq_text}"
+                f"{trend_text(self.history)}"
             )
 
             self.set_tooltip_text(tooltip_text)
@@ -161,8 +189,9 @@ class GpuWidget(ButtonWidget):
         # Set the GPU name and mode
         self.current_mode = self.config.get("mode", "label")
 
+        self.history = HistoryStore().get("gpu")
+
         if self.current_mode == "graph":
-            self.graph_values = []
             self.gpu_level_label = Label(
                 label="0%",
                 style_classes="panel-text",
@@ -205,51 +234,51 @@ class GpuWidget(ButtonWidget):
             )
             self.container_box.children = (self.icon, self.gpu_level_label)
 
-        # Set up a fabricator to call the update_label method when the CPU usage changes
-        util_fabricator.connect("changed", self.update_ui)
+        # Samples arrive from the shared background sampler
+        gpu_service = GpuStatsService()
+        handler_id = gpu_service.connect("changed", self.update_ui)
+        self.connect("destroy", lambda *_: gpu_service.disconnect(handler_id))
 
-    def update_ui(self, *_):
+    def update_ui(self, _, stats: dict):
         # Update the label with the current GPU usage if enabled
-
-        value = exec_shell_command("nvtop -s")
-
-        stats = json.loads(value.strip("\n"))
-
-        if type(stats) is list:
-            stats = stats[0]
-
-        frequency = stats.get("gpu_clock", "0 MHz")
-        usage = stats.get("mem_util", "0").strip("%")
-        gpu_name = stats.get("device_name", "N/A")
+        usage = stats.get("usage")
 
         if self.current_mode == "graph":
-            self.graph_values.append(get_bar_graph(usage))
-
-            if len(self.graph_values) > self.config.get("graph_length", 4):
-                self.graph_values.pop(0)
-
-            self.gpu_level_label.set_label("".join(self.graph_values))
+            self.gpu_level_label.set_label(
+                graph_label(self.history, self.config.get("graph_length", 4))
+            )
 
         elif self.current_mode == "progress":
-            self.progress_bar.set_value(usage / 100.0)
+            self.progress_bar.set_value((usage or 0) / 100.0)
 
         else:
-            self.gpu_level_label.set_label(usage)
+            self.gpu_level_label.set_label(
+                f"{round(usage)}%" if usage is not None else "N/A"
+            )
 
-        # Update the tooltip with the memory usage details if enabled
+        # Update the tooltip with the gpu usage details if enabled
         if self.config.get("tooltip", False):
-            temp = stats.get("temp")
-
-            if temp is None:
-                return "N/A"
+            temp = stats.get("temperature")
+            frequency = stats.get("frequency")
+            memory_used = stats.get("memory_used")
+            memory_total = stats.get("memory_total")
 
             tooltip_text = (
-                f"{gpu_name}\n"
-                f" Temperature: {temp}\n"
-                f"󰾆 Utilization: {usage}\n"
-                f" Clock Speed: {frequency}"
+                f"{stats.get('name', 'N/A')}\n"
+                f" Temperature: {'N/A' if temp is None else f'{round(temp)}°C'}\n"
+                f"󰾆 Utilization: {'N/A' if usage is None else f'{round(usage)}%'}\n"
+                f" Clock Speed: "
+                f"{'N/A' if frequency is None else f'{round(frequency)} MHz'}"
             )
 
+            if memory_used is not None and memory_total:
+                tooltip_text += (
+                    f"\n󰍛 VRAM: {helpers.convert_bytes(memory_used, 'gb')}/"
+                    f"{helpers.convert_bytes(memory_total, 'gb')}"
+                )
+
+            tooltip_text += trend_text(self.history)
+
             self.set_tooltip_text(tooltip_text)
 
         return True
@@ -271,8 +300,9 @@ class MemoryWidget(ButtonWidget):
         # Set the memory name and mode
         self.current_mode = self.config.get("mode", "label")
 
+        self.history = HistoryStore().get("memory")
+
         if self.current_mode == "graph":
-            self.graph_values = []
             self.memory_level_label = Label(
                 label="0%", style_classes="panel-text", visible=False
             )
@@ -315,23 +345,22 @@ class MemoryWidget(ButtonWidget):
             )
             self.container_box.children = (self.icon, self.memory_level_label)
 
-        # Set up a fabricator to call the update_label method  at specified intervals
-        util_fabricator.connect("changed", self.update_ui)
+        subscribe_to_stats(self, ["memory"])
 
-    def update_ui(self, _, value: dict):
+    def update_ui(self, value: dict):
         # Get the current memory usage
         memory = value.get("memory")
+        if memory is None:
+            # The collector failed, keep the last reading
+            return True
         self.used_memory = memory.used
         self.total_memory = memory.total
         self.percent_used = memory.percent
 
         if self.current_mode == "graph":
-            self.graph_values.append(get_bar_graph(self.percent_used))
-
-            if len(self.graph_values) > self.config.get("graph_length", 4):
-                self.graph_values.pop(0)
-
-            self.memory_level_label.set_label("".join(self.graph_values))
+            self.memory_level_label.set_label(
+                graph_label(self.history, self.config.get("graph_length", 4))
+            )
 
         elif self.current_mode == "progress":
             self.progress_bar.set_value(self.percent_used / 100.0)
@@ -342,7 +371,8 @@ class MemoryWidget(ButtonWidget):
         # Update the tooltip with the memory usage details if enabled
         if self.config.get("tooltip", False):
             self.set_tooltip_text(
-                f"󰾆 {self.percent_used}%\n{text_icons['memory']} {self.ratio()}",
+                f"󰾆 {self.percent_used}%\n{text_icons['memory']} {self.ratio()}"
+                f"{trend_text(self.history)}",
             )
 
         return True
@@ -373,9 +403,9 @@ class StorageWidget(ButtonWidget):
         # Set the memory name and mode
         self.current_mode = self.config.get("mode", "label")
 
-        if self.current_mode == "graph":
-            self.graph_values = []
+        self.history = HistoryStore().get("storage")
 
+        if self.current_mode == "graph":
             self.storage_level_label = Label(
                 label="0",
                 style_classes="panel-text",
@@ -420,21 +450,21 @@ class StorageWidget(ButtonWidget):
 
             self.container_box.children = (self.icon, self.storage_level_label)
 
-        # Set up a fabricator to call the update_label method at specified intervals
-        util_fabricator.connect("changed", self.update_ui)
+        subscribe_to_stats(self, ["disk"])
 
-    def update_ui(self, _, value: dict):
+    def update_ui(self, value: dict):
         # Get the current disk usage
-        self.disk = value.get("disk")
+        disk = value.get("disk")
+        if disk is None:
+            # The collector failed, e.g. the configured path doesn't exist
+            return True
+        self.disk = disk
         percent = self.disk.percent
 
         if self.current_mode == "graph":
-            self.graph_values.append(get_bar_graph(percent))
-
-            if len(self.graph_values) > self.config.get("graph_length", 4):
-                self.graph_values.pop(0)
-
-            self.storage_level_label.set_label("".join(self.graph_values))
+            self.storage_level_label.set_label(
+                graph_label(self.history, self.config.get("graph_length", 4))
+            )
 
         elif self.current_mode == "progress":
             self.progress_bar.set_value(percent / 100.0)
@@ -514,10 +544,9 @@ class NetworkUsageWidget(ButtonWidget):
             self.download_label,
         )
 
-        self.client = NetworkSpeed()
+        self.client = NetworkSpeed(smoothing=self.config.get("smoothing", 0.0))
 
-        # Set up a fabricator to call the update_label method at specified intervals
-        util_fabricator.connect("changed", self.update_ui)
+        TickScheduler().register(1000, self.update_ui, widget=self)
 
     def update_ui(self, *_):
         """Update the network usage label with the current network usage."""
@@ -552,6 +581,14 @@ class NetworkUsageWidget(ButtonWidget):
                 f"Download: {format_speed(download_speed)}\n"
                 f"Upload: {format_speed(upload_speed)}"
             )
+
+            interfaces = network_speed.get("interfaces", {})
+            if len(interfaces) > 1:
+                for interface, rate in sorted(interfaces.items()):
+                    tooltip_text += (
+                        f"\n{interface}: 󰇚 {format_speed(rate.download)}"
+                        f"  󰕒 {format_speed(rate.upload)}"
+                    )
             self.set_tooltip_text(tooltip_text)
 
         return True
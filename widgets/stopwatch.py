@@ -1,8 +1,8 @@
 import time
 
 from fabric.widgets.label import Label
-from gi.repository import GLib
 
+from services.polling import AdaptiveTimer
 from shared.widget_container import ButtonWidget
 from utils.widget_utils import nerd_font_icon
 
@@ -30,18 +30,22 @@ class StopWatchWidget(ButtonWidget):
 
         self.connect("clicked", self.handle_click)
 
-        self.timeout_id = GLib.timeout_add(100, self.update_time)
+        # Only tick while running, at a pace set by the polling policy
+        self.timer = AdaptiveTimer(100, self.update_time, start=False)
+        self.connect("destroy", lambda *_: self.timer.stop())
 
     # stop or run on click
     def handle_click(self, *_):
         if self.running:
             self.running = False
+            self.timer.stop()
             self.icon.set_label(
                 self.config.get("stopped_icon", "󰒲"),
             )
         else:
             self.running = True
             self.start_time = time.time() - self.elapsed_time
+            self.timer.start()
             self.icon.set_label(
                 self.config.get("running_icon", "󰕸"),
             )
@@ -2,6 +2,7 @@ from fabric.hyprland.widgets import get_hyprland_connection
 from fabric.widgets.label import Label
 from loguru import logger
 
+from services.hyprland_ipc import HyprlandCommandService
 from shared.widget_container import ButtonWidget
 from utils.widget_utils import nerd_font_icon
 
@@ -25,6 +26,7 @@ class SubMapWidget(ButtonWidget):
             self.container_box.add(self.icon)
 
         self._hyprland_connection = get_hyprland_connection()
+        self._hyprland_commands = HyprlandCommandService()
 
         self._hyprland_connection.connect("event::submap", self.get_submap)
 
@@ -40,10 +42,13 @@ class SubMapWidget(ButtonWidget):
         )
 
     def get_submap(self, *_):
+        self._hyprland_commands.send("submap", self.update_submap)
+
+    def update_submap(self, reply: str | None):
+        if reply is None:
+            return
         try:
-            submap = str(
-                self._hyprland_connection.send_command("submap").reply.decode()
-            ).strip("\n")
+            submap = reply.strip("\n")
 
             if submap == "unknown request":
                 submap = "default"
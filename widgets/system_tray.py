@@ -8,11 +8,12 @@ from fabric.widgets.box import Box
 from fabric.widgets.grid import Grid
 from fabric.widgets.image import Image
 from fabric.widgets.separator import Separator
-from gi.repository import Gdk, GdkPixbuf, GLib, Gray, Gtk
+from gi.repository import Gdk, GLib, Gray
 from loguru import logger
 
 from shared.buttons import HoverButton
 from shared.widget_container import ButtonWidget
+from utils.icon_cache import IconCache
 from utils.icons import text_icons
 from utils.widget_utils import nerd_font_icon
 
@@ -36,57 +37,40 @@ class BaseSystemTray:
                 item.context_menu(event.x, event.y)
 
     def resolve_icon(self, item, icon_size: int = 16):
+        icon_cache = IconCache()
         pixmap = Gray.get_pixmap_for_pixmaps(item.get_icon_pixmaps(), icon_size)
 
         try:
             if pixmap is not None:
-                return pixmap.as_pixbuf(icon_size, GdkPixbuf.InterpType.HYPER)
+                return icon_cache.load_pixmap(pixmap, icon_size)
             else:
                 icon_name = item.get_icon_name()
                 icon_theme_path = item.get_icon_theme_path()
 
-                logger.info(
+                logger.debug(
                     f"""[SystemTray] Resolving icon: {icon_name}, size: {icon_size},
                     theme path: {icon_theme_path}"""
                 )
 
                 # Use custom theme path if available
                 if icon_theme_path:
-                    custom_theme = Gtk.IconTheme.new()
-                    custom_theme.prepend_search_path(icon_theme_path)
                     try:
-                        return custom_theme.load_icon(
-                            icon_name,
-                            icon_size,
-                            Gtk.IconLookupFlags.FORCE_SIZE,
+                        return icon_cache.load_icon(
+                            icon_name, icon_size, search_path=icon_theme_path
                         )
                     except GLib.Error:
                         # Fallback to default theme if custom path fails
-                        return Gtk.IconTheme.get_default().load_icon(
-                            icon_name,
-                            icon_size,
-                            Gtk.IconLookupFlags.FORCE_SIZE,
-                        )
+                        return icon_cache.load_icon(icon_name, icon_size)
                 else:
                     if os.path.exists(
                         icon_name
                     ):  # for some apps, the icon_name is a path
-                        return GdkPixbuf.Pixbuf.new_from_file_at_size(
-                            icon_name, width=icon_size, height=icon_size
-                        )
+                        return icon_cache.load_file(icon_name, icon_size)
                     else:
-                        return Gtk.IconTheme.get_default().load_icon(
-                            icon_name,
-                            icon_size,
-                            Gtk.IconLookupFlags.FORCE_SIZE,
-                        )
+                        return icon_cache.load_icon(icon_name, icon_size)
         except GLib.Error:
             # Fallback to 'image-missing' icon
-            return Gtk.IconTheme.get_default().load_icon(
-                "image-missing",
-                icon_size,
-                Gtk.IconLookupFlags.FORCE_SIZE,
-            )
+            return icon_cache.load_icon("image-missing", icon_size)
 
     def _bake_item_button(self, item: Gray.Item) -> HoverButton:
         button = HoverButton(
@@ -99,6 +83,9 @@ class BaseSystemTray:
         self._update_item_button(item, button)
         return button
 
+    def _on_icon_changed(self, item: Gray.Item, button: HoverButton):
+        self._update_item_button(item, button)
+
     def _update_item_button(self, item: Gray.Item, button: HoverButton):
         button.set_image(
             Image(pixbuf=self.resolve_icon(item=item, icon_size=self.icon_size))
@@ -143,8 +130,8 @@ class SystemTrayMenu(Box, BaseSystemTray):
         bulk_connect(
             item,
             {
-                "removed": lambda *_: self.on_item_removed(button),
-                "icon-changed": lambda icon_item: self._update_item_button(
+                "removed": lambda *_: self.on_item_removed(item, button),
+                "icon-changed": lambda icon_item: self._on_icon_changed(
                     icon_item, button
                 ),
             },
@@ -160,7 +147,7 @@ class SystemTrayMenu(Box, BaseSystemTray):
         if self.parent_widget:
             self.parent_widget.update_visibility()
 
-    def on_item_removed(self, button):
+    def on_item_removed(self, item, button):
         """Handle when an item is removed from the menu."""
         button.destroy()
         # Update parent widget visibility if parent is available
@@ -258,7 +245,7 @@ class SystemTrayWidget(ButtonWidget, BaseSystemTray):
         # Update visibility after an item is removed
         self.update_visibility()
 
-    def on_item_button_removed(self, button):
+    def on_item_button_removed(self, item, button):
         """Handle when a button is removed from the main tray."""
         button.destroy()
         self.update_visibility()
@@ -291,8 +278,8 @@ class SystemTrayWidget(ButtonWidget, BaseSystemTray):
             bulk_connect(
                 item,
                 {
-                    "removed": lambda *_: self.on_item_button_removed(button),
-                    "icon-changed": lambda icon_item: self._update_item_button(
+                    "removed": lambda *_: self.on_item_button_removed(item, button),
+                    "icon-changed": lambda icon_item: self._on_icon_changed(
                         icon_item, button
                     ),
                 },
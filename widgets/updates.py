@@ -1,5 +1,4 @@
 import json
-from datetime import datetime
 
 from fabric.utils import (
     cooldown,
@@ -10,12 +9,10 @@ from fabric.widgets.label import Label
 from fabric.widgets.revealer import Revealer
 from loguru import logger
 
+from services.scheduler import TickScheduler
 from shared.widget_container import ButtonWidget
 from utils.colors import Colors
-from utils.widget_utils import (
-    nerd_font_icon,
-    reusable_fabricator,
-)
+from utils.widget_utils import nerd_font_icon
 
 
 class UpdatesWidget(ButtonWidget):
@@ -28,8 +25,6 @@ class UpdatesWidget(ButtonWidget):
         # Initialize the EventBox with specific name and style
         super().__init__(name="updates", **kwargs)
 
-        self.update_time = datetime.now()
-
         self.base_command = self._build_base_command()
 
         if self.config.get("show_icon", True):
@@ -54,11 +49,10 @@ class UpdatesWidget(ButtonWidget):
 
         self.connect("button-press-event", self.on_button_press)
 
-        # Set up a repeater to call the update method at specified intervals
         self.check_update()
 
-        # reusing the fabricator to call specified intervals
-        reusable_fabricator.connect("changed", self.should_update)
+        # Not bound to the widget: auto_hide unmaps it until updates show up
+        TickScheduler().register(self.config["interval"] * 1000, self.check_update)
 
     def _build_base_command(self) -> str:
         script = get_relative_path("../assets/scripts/systemupdates.sh")
@@ -77,18 +71,6 @@ class UpdatesWidget(ButtonWidget):
 
         return " ".join(command)
 
-    def should_update(self, *_):
-        """
-        Handles the 'changed' signal from the fabricator.
-        Checks if the update interval has elapsed and triggers an update if necessary.
-        """
-        if (datetime.now() - self.update_time).total_seconds() >= self.config[
-            "interval"
-        ]:
-            self.check_update()
-            self.update_time = datetime.now()
-        return True
-
     def update_values(self, value: str):
         """Update the UI based on the returned update data."""
         try:
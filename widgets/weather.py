@@ -1,5 +1,4 @@
 import time
-from datetime import datetime
 
 import gi
 from fabric.utils import cooldown, get_relative_path
@@ -11,14 +10,12 @@ from fabric.widgets.svg import Svg
 from gi.repository import Gtk
 from loguru import logger
 
+from services.scheduler import TickScheduler
 from services.weather import WeatherService
 from shared.widget_container import ButtonWidget
 from utils.functions import check_if_day
 from utils.icons import weather_icons
-from utils.widget_utils import (
-    nerd_font_icon,
-    reusable_fabricator,
-)
+from utils.widget_utils import nerd_font_icon
 
 gi.require_versions({"Gtk": "3.0"})
 
@@ -115,8 +112,6 @@ class WeatherMenu(Box, BaseWeatherWidget):
 
         self.next_values = None
 
-        self.update_time = datetime.now()
-
         self.weather_icons_dir = get_relative_path("../assets/icons/svg/weather")
 
         self.current_weather_image = Svg(
@@ -246,8 +241,8 @@ class WeatherMenu(Box, BaseWeatherWidget):
             callback=self.update_data,
         )
 
-        # reusing the fabricator to call specified intervals
-        reusable_fabricator.connect("changed", self.update_widget)
+        # Refresh the forecast as the hours go by, only while the menu is shown
+        TickScheduler().register(60000, self.update_widget, align="minute", widget=self)
 
     def update_data(self, data):
         self.update_app_data(data)
@@ -257,14 +252,12 @@ class WeatherMenu(Box, BaseWeatherWidget):
     def update_widget(self, *args, **kwargs):
         forced = kwargs.get("forced", False)
 
-        # Check if the update time is more than 4 minute ago
-        if (datetime.now() - self.update_time).total_seconds() < 60 and not forced:
+        # Nothing to show until the first fetch lands
+        if getattr(self, "data", None) is None:
             return
 
         logger.debug("[Weather] Updating weather widget")
 
-        self.update_time = datetime.now()
-
         current_time = int(time.strftime("%H00"))
 
         if forced:
@@ -352,8 +345,6 @@ class WeatherWidget(ButtonWidget, BaseWeatherWidget):
 
         self.connect("button-press-event", self.on_button_press)
 
-        self.update_time = datetime.now()
-
         if self.config.get("label", True):
             self.weather_label = Label(
                 label="Fetching..",
@@ -370,14 +361,16 @@ class WeatherWidget(ButtonWidget, BaseWeatherWidget):
             else:
                 self.container_box.add(self.weather_label)
 
-        self.update_ui(forced=True)
+        self.update_ui()
 
-        # Set up a fabricator to call the update_label method at specified intervals
-        reusable_fabricator.connect("changed", self.update_ui)
+        scheduler = TickScheduler()
+        scheduler.register(
+            self.config.get("interval", 3600) * 1000, self.update_ui, widget=self
+        )
+        # Switch between day and night icons around sunrise and sunset
+        scheduler.register(300000, self.update_icon, align="minute", widget=self)
 
     def update_data(self, data):
-        self.update_time = datetime.now()
-
         if data is None:
             self.weather_label.set_label("")
             self.weather_icon.set_label("")
@@ -436,30 +429,23 @@ class WeatherWidget(ButtonWidget, BaseWeatherWidget):
             self.popover.open() if self.popover else None
             return
         else:
-            self.update_ui(forced=True)
+            self.update_ui()
 
-    def update_ui(self, *args, **kwargs):
-        forced = kwargs.get("forced", False)
+    def update_icon(self):
+        if getattr(self, "current_weather", None) is None:
+            return
 
-        # Check if the update time is more than 5 minutes ago, update the icon
-        if (datetime.now() - self.update_time).total_seconds() > 300:
-            text_icon = (
-                weather_icons[self.current_weather["weatherCode"]]["icon"]
-                if check_if_day(
-                    sunrise_time=self.sunrise_time,
-                    sunset_time=self.sunset_time,
-                )
-                else weather_icons[self.current_weather["weatherCode"]]["icon-night"]
+        self.weather_icon.set_label(
+            weather_icons[self.current_weather["weatherCode"]]["icon"]
+            if check_if_day(
+                sunrise_time=self.sunrise_time,
+                sunset_time=self.sunset_time,
             )
+            else weather_icons[self.current_weather["weatherCode"]]["icon-night"]
+        )
 
-            self.weather_icon.set_label(text_icon)
-
-        if (datetime.now() - self.update_time).total_seconds() < self.config[
-            "interval"
-        ] and not forced:
-            # Check if the update time is more than interval seconds ago
-            return
-
+    def update_ui(self, *_):
+        # The service serves cached data while it is younger than the ttl
         WeatherService().get_weather_async(
             location=self.config.get("location", ""),
             ttl=self.config.get("interval", 3600),
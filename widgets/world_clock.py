@@ -4,8 +4,9 @@ from zoneinfo import ZoneInfo, available_timezones
 from fabric.widgets.label import Label
 from loguru import logger
 
+from services.scheduler import TickScheduler
 from shared.widget_container import ButtonWidget
-from utils.widget_utils import nerd_font_icon, reusable_fabricator
+from utils.widget_utils import nerd_font_icon
 
 
 class WorldClockWidget(ButtonWidget):
@@ -41,8 +42,8 @@ class WorldClockWidget(ButtonWidget):
             else:
                 logger.info(f"[world_clock] Skipping invalid timezone: {tz_name}")
 
-        # reusing the fabricator to call specified intervals
-        reusable_fabricator.connect("changed", self.update_ui)
+        # Tick on second boundaries so every clock changes in step
+        TickScheduler().register(1000, self.update_ui, align="second", widget=self)
 
     def update_ui(self, *_):
         try: